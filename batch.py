@@ -0,0 +1,277 @@
+"""
+Simulation par lots du jeu Ski Alpin 2D, pour régler la difficulté.
+
+Ce module joue un grand nombre de parties sans affichage
+(classes.Simulation), réparties sur plusieurs processus, chacune pilotée
+par une politique d'entrées (aléatoire ou scriptée) avec sa propre graine.
+Le résultat de chaque partie (images jouées, niveau atteint, points,
+collisions, sauts) est transmis dès qu'elle se termine, éventuellement
+écrit dans un fichier CSV, puis agrégé en courbe de survie : proportion
+des parties qui atteignent chaque niveau, et nombre médian d'images pour
+l'atteindre.
+
+Les parties sont indépendantes et ne transmettent que quelques entiers :
+le débit croît presque linéairement avec le nombre de processus. Les
+graines des parties ne dépendent que de la graine du lot, et non de la
+répartition entre processus : un lot est reproductible.
+
+Une politique est une classe créée avec une graine, appelée à chaque
+image avec la simulation et qui retourne les touches actives. Les
+politiques fournies sont "random" (RandomPolicy) et "dodge"
+(DodgePolicy); une autre politique se donne sous la forme
+module:Classe.
+
+Exemples:
+    python batch.py --runs 10000 --policy dodge --seed 1
+    python batch.py --runs 1000 --output parties.csv
+    python batch.py --runs 1000 --policy ma_politique:MaPolitique
+"""
+import argparse
+import contextlib
+import csv
+import importlib
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from classes.DodgePolicy import DodgePolicy
+from classes.RandomPolicy import RandomPolicy
+from classes.Simulation import Simulation
+
+POLICIES = {"random": RandomPolicy, "dodge": DodgePolicy}
+
+# Colonnes du fichier CSV des parties
+RESULT_FIELDS = (
+    "seed", "frames", "level", "points", "hits", "jumps", "clears",
+    "level_frames"
+)
+
+
+def load_policy(name):
+    """Retourne la classe d'une politique d'entrées.
+
+    Args:
+        name (str): Nom d'une politique fournie ("random", "dodge") ou
+            chemin module:Classe.
+
+    Returns:
+        type: Classe de la politique.
+
+    Raises:
+        ValueError: Si la politique est inconnue.
+    """
+    if name in POLICIES:
+        return POLICIES[name]
+
+    module_name, separator, attribute = name.partition(":")
+    if not separator:
+        raise ValueError(f"politique inconnue : {name}")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"politique introuvable : {name}") from error
+
+
+def play(policy, seed, max_frames, course=False, dt=1 / 120):
+    """Joue une partie jusqu'à la perte de toutes les vies.
+
+    Args:
+        policy (str): Politique d'entrées (voir load_policy).
+        seed (int): Graine de la partie et de la politique.
+        max_frames (int): Nombre maximal d'images jouées.
+        course (bool): Place les obstacles selon une piste construite par
+            tronçons.
+        dt (float): Durée simulée d'une image (secondes).
+
+    Returns:
+        dict: Graine, images jouées, niveau atteint, points, collisions,
+            sauts, obstacles franchis, et image à laquelle chaque niveau a
+            été atteint (level_frames, 0 pour le premier).
+    """
+    simulation = Simulation.headless(seed=seed, course=course)
+    inputs = load_policy(policy)(seed)
+    rules = simulation.rules
+    level_frames = [0]
+
+    try:
+        while not simulation.game_over and simulation.frame < max_frames:
+            simulation.step(inputs(simulation), dt)
+            while len(level_frames) < rules.level:
+                level_frames.append(simulation.frame)
+    finally:
+        simulation.close()
+
+    return {
+        "seed": seed,
+        "frames": simulation.frame,
+        "level": rules.level,
+        "points": simulation.player.points,
+        "hits": simulation.hits,
+        "jumps": simulation.jumps,
+        "clears": simulation.clears,
+        "level_frames": level_frames
+    }
+
+
+def play_task(task):
+    """Joue une partie dans un processus du lot.
+
+    Args:
+        task (tuple): Arguments de play.
+
+    Returns:
+        dict: Résultat de la partie.
+    """
+    return play(*task)
+
+
+def run_seeds(runs, seed=None):
+    """Tire la graine de chaque partie d'un lot.
+
+    Args:
+        runs (int): Nombre de parties.
+        seed (int | None): Graine du lot.
+
+    Returns:
+        list[int]: Graine de chaque partie.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(63) for i in range(runs)]
+
+
+def run_batch(runs, policy="random", seed=None, max_frames=72000,
+              course=False, processes=None, chunksize=None):
+    """Joue un lot de parties réparties sur plusieurs processus.
+
+    Args:
+        runs (int): Nombre de parties.
+        policy (str): Politique d'entrées (voir load_policy).
+        seed (int | None): Graine du lot.
+        max_frames (int): Nombre maximal d'images d'une partie.
+        course (bool): Place les obstacles selon une piste construite par
+            tronçons.
+        processes (int | None): Nombre de processus. Par défaut, un par
+            cœur; 1 joue les parties dans le processus courant.
+        chunksize (int | None): Parties envoyées à la fois à un processus.
+            Par défaut, de quoi donner environ huit envois à chacun.
+
+    Yields:
+        dict: Résultat de chaque partie, dans l'ordre où elles se
+            terminent.
+    """
+    load_policy(policy)
+    tasks = [(policy, run_seed, max_frames, course)
+             for run_seed in run_seeds(runs, seed)]
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1:
+        yield from map(play_task, tasks)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, runs // (processes * 8))
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(play_task, tasks, chunksize)
+
+
+def survival_curve(results):
+    """Agrège les résultats d'un lot en courbe de survie par niveau.
+
+    Args:
+        results (list[dict]): Résultats des parties.
+
+    Returns:
+        list[tuple[int, int, float, float]]: Pour chaque niveau, du
+            premier au plus élevé atteint : niveau, nombre de parties qui
+            l'atteignent, proportion de ces parties et nombre médian
+            d'images pour l'atteindre.
+    """
+    reached = {}
+    for result in results:
+        for level, frame in enumerate(result["level_frames"], start=1):
+            reached.setdefault(level, []).append(frame)
+
+    runs = len(results)
+    return [
+        (level, len(frames), len(frames) / runs, statistics.median(frames))
+        for level, frames in sorted(reached.items())
+    ]
+
+
+def main(argv=None):
+    """Joue un lot de parties et affiche la courbe de survie.
+
+    Args:
+        argv (list[str] | None): Options de la ligne de commande.
+
+    Returns:
+        int: Code de sortie (2 si la politique est inconnue).
+    """
+    parser = argparse.ArgumentParser(
+        description="Ski Alpin 2D : simulation par lots"
+    )
+    parser.add_argument("--runs", type=int, default=1000,
+                        help="nombre de parties")
+    parser.add_argument("--policy", default="random",
+                        help="politique d'entrées : random, dodge ou "
+                             "module:Classe")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine du lot")
+    parser.add_argument("--max-frames", type=int, default=72000,
+                        help="nombre maximal d'images d'une partie "
+                             "(72000 : dix minutes à 120 Hz)")
+    parser.add_argument("--no-course", action="store_true",
+                        help="replace les obstacles au hasard au lieu de "
+                             "suivre une piste construite par tronçons")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="nombre de processus (un par cœur par défaut)")
+    parser.add_argument("--output", metavar="FICHIER",
+                        help="écrit le résultat de chaque partie en CSV")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs doit être au moins 1")
+
+    try:
+        load_policy(args.policy)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    results = []
+    if args.output:
+        output = open(args.output, "w", newline="")
+    else:
+        output = contextlib.nullcontext()
+    start = time.perf_counter()
+    with output as file:
+        writer = csv.writer(file) if file is not None else None
+        if writer is not None:
+            writer.writerow(RESULT_FIELDS)
+        for result in run_batch(args.runs, args.policy, args.seed,
+                                args.max_frames, not args.no_course,
+                                args.processes):
+            results.append(result)
+            if writer is not None:
+                writer.writerow(
+                    [result[field] for field in RESULT_FIELDS[:-1]]
+                    + [" ".join(map(str, result["level_frames"]))]
+                )
+    elapsed = time.perf_counter() - start
+
+    frames = sum(result["frames"] for result in results)
+    print(f"Parties : {len(results)} en {elapsed:.1f} s "
+          f"({len(results) / elapsed:.0f} parties/s, "
+          f"{frames / elapsed:.0f} images/s)")
+    print(f"Images par partie (médiane) : "
+          f"{statistics.median(r['frames'] for r in results):.0f}")
+    print(f"{'niveau':>6} {'parties':>8} {'survie':>7} "
+          f"{'images (médiane)':>17}")
+    for level, count, share, median in survival_curve(results):
+        print(f"{level:>6} {count:>8} {share:>7.1%} {median:>17.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
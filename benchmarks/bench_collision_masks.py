@@ -0,0 +1,137 @@
+"""
+Banc d'essai : collisions par rectangles contre collisions au pixel près.
+
+Mesure le temps d'une image de logique (Simulation.step) avec les vraies
+images, d'abord avec le seul test des rectangles de collision, puis avec
+le test au pixel près (CollisionMasks) appelé lorsque les rectangles se
+chevauchent, et le coût d'un test au pixel près. Les masques sont
+calculés avant la mesure, au chargement des images, comme dans le jeu.
+Le skieur suit les mêmes touches aléatoires (sauts compris) dans les deux
+cas; les parties divergent dès qu'un contact est écarté par les masques,
+si bien que l'écart entre les deux mesures tient aussi aux collisions
+évitées.
+
+Exemple:
+    python benchmarks/bench_collision_masks.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from classes.GameRules import GameRules  # noqa: E402
+from classes.Simulation import Simulation  # noqa: E402
+from classes.Window import Window  # noqa: E402
+
+# Nombre d'obstacles de départ (rochers + arbres) de chaque mesure
+COUNTS = (7, 30, 100)
+FRAMES = 20000
+KEY_NAMES = ("left", "right", "up", "down", "space", "return")
+
+
+def key_sequence(frames, seed=1):
+    """Génère les touches du skieur, changées toutes les 30 images.
+
+    Args:
+        frames (int): Nombre d'images.
+        seed (int): Graine des touches.
+
+    Returns:
+        list[dict]: Touches actives de chaque image.
+    """
+    rng = random.Random(seed)
+    keys = []
+    for i in range(frames):
+        if i % 30 == 0:
+            current = {name: rng.random() < 0.3 for name in KEY_NAMES}
+            current["return"] = True
+        keys.append(current)
+    return keys
+
+
+def run(window, count, narrow_phase, keys):
+    """Mesure le temps moyen d'une image de logique.
+
+    Args:
+        window (Window): Fenêtre dont les images de la partie sont
+            chargées.
+        count (int): Nombre d'obstacles de départ.
+        narrow_phase (CollisionMasks | None): Test précis, ou None pour
+            le seul test des rectangles.
+        keys (list[dict]): Touches de chaque image.
+
+    Returns:
+        float: Temps moyen par image (secondes).
+    """
+    rules = GameRules()
+    rules.narrow_phase = narrow_phase
+    rocks = count * 3 // 7
+    simulation = Simulation(
+        window.width, window.height, window.left_limit, window.right_limit,
+        window.skier_left, window.skier_right, window.rock, window.tree,
+        rules=rules, rocks=rocks, trees=count - rocks, seed=1)
+
+    start = time.perf_counter()
+    for step_keys in keys:
+        simulation.step(step_keys, 1 / 120)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def time_per_test(window, masks, calls=100000):
+    """Mesure le coût d'un test au pixel près, saut compris.
+
+    Args:
+        window (Window): Fenêtre dont les images de la partie sont
+            chargées.
+        masks (CollisionMasks): Masques précalculés.
+        calls (int): Nombre de tests.
+
+    Returns:
+        float: Temps moyen par test (secondes).
+    """
+    simulation = Simulation(
+        window.width, window.height, window.left_limit, window.right_limit,
+        window.skier_left, window.skier_right, window.rock, window.tree,
+        rocks=1, trees=0, seed=1)
+    player = simulation.player
+    obstacle = simulation.obstacles[0]
+    obstacle.x, obstacle.y = player.x + 40, player.y + 40
+    player.jumping = True
+
+    start = time.perf_counter()
+    for i in range(calls):
+        player.angle = i % 360
+        masks(player, obstacle)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    """Affiche le tableau comparatif."""
+    window = Window(1400, 750, mask_collision=True)
+    masks = window.collision_masks
+    keys = key_sequence(FRAMES)
+
+    print(f"{'obstacles':>10} {'rectangles (µs)':>16} {'pixels (µs)':>12} "
+          f"{'surcoût (µs)':>13} {'tests/image':>12} {'sans contact':>13}")
+    for count in COUNTS:
+        # Meilleure de trois mesures, pour limiter le bruit
+        rect_only = min(run(window, count, None, keys) for i in range(3))
+        masks.tests = masks.rejected = 0
+        with_masks = min(run(window, count, masks, keys) for i in range(3))
+        print(f"{count:>10} {rect_only * 1e6:>16.2f} "
+              f"{with_masks * 1e6:>12.2f} "
+              f"{(with_masks - rect_only) * 1e6:>13.2f} "
+              f"{masks.tests / (3 * FRAMES):>12.3f} "
+              f"{masks.rejected / max(masks.tests, 1):>12.0%}")
+    print(f"Coût d'un test au pixel près : "
+          f"{time_per_test(window, masks) * 1e6:.2f} µs")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
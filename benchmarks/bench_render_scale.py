@@ -0,0 +1,92 @@
+"""
+Banc d'essai : temps d'affichage d'une image selon l'échelle du rendu.
+
+Pour chaque facteur d'échelle, une même partie (même graine, mêmes
+touches) est affichée image par image comme dans main.py : effacement,
+obstacles, skieur, état de la partie, décor et présentation. Seul
+l'affichage est chronométré, en séparant le dessin de la présentation;
+la logique est identique à toutes les échelles. La fenêtre est recréée
+pour chaque échelle (pygame.SCALED ne peut pas être activé sur une
+fenêtre existante).
+
+Avec le pilote factice, l'agrandissement de pygame.SCALED est fait par le
+rendu logiciel de SDL à la présentation, ce qui la rend plus coûteuse
+qu'à l'échelle 1; avec un rendu accéléré, l'agrandissement est fait par
+la carte graphique et seule la texture à la taille du rendu est envoyée.
+
+Exemple:
+    python benchmarks/bench_render_scale.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from classes.GameRules import GameRules  # noqa: E402
+from classes.Simulation import Simulation  # noqa: E402
+from classes.Window import Window  # noqa: E402
+
+SCALES = (1.0, 0.75, 0.5, 0.25)
+FRAMES = 600
+KEYS = {"left": False, "right": False, "up": False, "down": True,
+        "space": False, "return": False}
+
+
+def run(scale):
+    """Mesure le temps moyen de dessin et de présentation d'une image.
+
+    Args:
+        scale (float): Facteur d'échelle du rendu.
+
+    Returns:
+        tuple[float, float]: Temps moyen de dessin et de présentation par
+            image (secondes).
+    """
+    pygame.display.quit()
+    window = Window(1400, 750, scale=scale)
+    rules = GameRules()
+    simulation = Simulation(
+        window.width, window.height, window.left_limit, window.right_limit,
+        window.skier_left, window.skier_right, window.rock, window.tree,
+        rules=rules, seed=1)
+    player = simulation.player
+
+    drawing = presenting = 0.0
+    for frame in range(FRAMES):
+        simulation.step(KEYS, 1 / 120)
+        window.scroll_side_obstacles(rules.speed)
+
+        start = time.perf_counter()
+        window.clear_background()
+        for obs, x, y in simulation.interpolated_obstacles(1.0):
+            window.draw(obs.image, x, y)
+        window.draw_player(player)
+        window.update_status(rules.level, player.lives, player.points)
+        window.draw_side_obstacles()
+        drawn = time.perf_counter()
+        window.flip()
+        drawing += drawn - start
+        presenting += time.perf_counter() - drawn
+    return drawing / FRAMES, presenting / FRAMES
+
+
+def main():
+    """Affiche le tableau comparatif."""
+    print(f"{'échelle':>8} {'rendu':>10} {'pixels':>9} {'dessin (µs)':>12} "
+          f"{'présentation (µs)':>18} {'total (µs)':>11}")
+    for scale in SCALES:
+        # Meilleure de trois mesures, pour limiter le bruit
+        drawing, presenting = min(run(scale) for i in range(3))
+        width, height = round(1400 * scale), round(750 * scale)
+        print(f"{scale:>8.2f} {f'{width}x{height}':>10} {width * height:>9} "
+              f"{drawing * 1e6:>12.0f} {presenting * 1e6:>18.0f} "
+              f"{(drawing + presenting) * 1e6:>11.0f}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Banc d'essai : instantanés de la partie contre copy.deepcopy.
+
+Mesure le nombre d'instantanés pris (Simulation.snapshot) et rétablis
+(Simulation.restore) par seconde, au premier niveau et à un niveau élevé
+(plus d'obstacles en jeu), avec les obstacles replacés au hasard et avec
+la piste construite par tronçons. La copie profonde de la simulation
+(copy.deepcopy) sert de référence; elle n'est possible que sans piste,
+dont le fil d'exécution ne se copie pas.
+
+Exemple:
+    python benchmarks/bench_snapshot.py
+"""
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes.RandomPolicy import RandomPolicy  # noqa: E402
+from classes.Simulation import Simulation  # noqa: E402
+
+# Points de départ : premier niveau, puis niveau 11
+POINTS = (0, 10000)
+
+
+def per_second(function, budget=0.5):
+    """Mesure le nombre d'appels d'une fonction par seconde.
+
+    Args:
+        function (Callable[[], object]): Fonction mesurée.
+        budget (float): Durée approximative de la mesure (secondes).
+
+    Returns:
+        float: Appels par seconde.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget and calls >= 3:
+            return calls / elapsed
+
+
+def prepare(points, course):
+    """Crée une partie en cours, avec les obstacles du niveau.
+
+    Args:
+        points (int): Points de départ du joueur.
+        course (bool): Place les obstacles selon une piste construite par
+            tronçons.
+
+    Returns:
+        Simulation: Partie après quelques secondes de jeu.
+    """
+    simulation = Simulation.headless(seed=1, course=course)
+    simulation.player.points = points
+    simulation.player.invincible = True
+    simulation.player.invincible_duration = float("inf")
+    policy = RandomPolicy(1)
+    for frame in range(1200):
+        simulation.step(policy(simulation), 1 / 120)
+    return simulation
+
+
+def main():
+    """Affiche le tableau comparatif."""
+    print(f"{'piste':>6} {'niveau':>7} {'obstacles':>10} "
+          f"{'instantanés/s':>14} {'rétablis/s':>11} {'deepcopy/s':>11}")
+    for course in (False, True):
+        for points in POINTS:
+            simulation = prepare(points, course)
+            snapshot = simulation.snapshot()
+            saves = per_second(simulation.snapshot)
+            restores = per_second(lambda: simulation.restore(snapshot))
+            if course:
+                copies = "-"
+            else:
+                copies = f"{per_second(lambda: copy.deepcopy(simulation)):.0f}"
+            print(f"{'oui' if course else 'non':>6} "
+                  f"{simulation.rules.level:>7} "
+                  f"{len(simulation.obstacles):>10} {saves:>14.0f} "
+                  f"{restores:>11.0f} {copies:>11}")
+            simulation.close()
+
+
+if __name__ == '__main__':
+    main()
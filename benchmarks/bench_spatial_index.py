@@ -0,0 +1,87 @@
+"""
+Banc d'essai : phase large (SpatialIndex) contre test exhaustif.
+
+Mesure le coût de la détection des collisions d'une image de
+Simulation.step, avec l'index par cellules de la piste et en testant tous
+les obstacles, ainsi que le nombre moyen de candidats testés par image.
+
+Exemple:
+    python benchmarks/bench_spatial_index.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes.Simulation import Simulation  # noqa: E402
+
+COUNTS = (10, 100, 1000, 5000)
+WARMUP = 500
+FRAMES = 200
+
+
+def collision_phase(simulation, brute_force):
+    """Mesure le temps moyen de la phase de collision d'une image.
+
+    La phase mesurée comprend la requête à l'index et le test détaillé
+    (GameRules.check_collision) de chaque candidat.
+
+    Args:
+        simulation (Simulation): Simulation à mesurer.
+        brute_force (bool): Teste tous les obstacles, sans index.
+
+    Returns:
+        tuple[float, float]: Temps par image (secondes) et nombre moyen
+            de candidats testés.
+    """
+    player = simulation.player
+    rules = simulation.rules
+    keys = dict.fromkeys(
+        ("left", "right", "up", "down", "space", "return"), False)
+    elapsed = 0.0
+    tested = 0
+
+    # Les obstacles apparaissent sous l'écran : on les laisse monter
+    # jusqu'au joueur avant de mesurer.
+    for frame in range(WARMUP):
+        player.invincible = True
+        simulation.step(keys, 1 / 120)
+
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        if brute_force:
+            candidates = simulation.obstacles
+        else:
+            rect = player.rect
+            candidates = simulation.index.query(
+                rect.x, rect.y, rect.x + rect.width, rect.y + rect.height)
+        for obs in candidates:
+            obs.update_rect()
+            rules.check_collision(simulation, player, obs)
+        elapsed += time.perf_counter() - start
+        tested += len(candidates)
+
+        player.invincible = True
+        simulation.step(keys, 1 / 120)
+
+    return elapsed / FRAMES, tested / FRAMES
+
+
+def main():
+    """Affiche le tableau comparatif."""
+    print(f"{'obstacles':>10} {'exhaustif (µs)':>15} {'index (µs)':>11} "
+          f"{'candidats':>10}")
+    for count in COUNTS:
+        brute, _ = collision_phase(
+            Simulation.headless(seed=1, rocks=count // 2,
+                                trees=count - count // 2), True)
+        indexed, candidates = collision_phase(
+            Simulation.headless(seed=1, rocks=count // 2,
+                                trees=count - count // 2), False)
+        print(f"{count:>10} {brute * 1e6:>15.1f} {indexed * 1e6:>11.1f} "
+              f"{candidates:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Banc d'essai : temps jusqu'à la première image, sans cache et avec le cache
+des images redimensionnées (SpriteCache) vide ou déjà rempli.
+
+Chaque mesure est faite dans un nouveau processus Python, sous les pilotes
+SDL factices : le temps mesuré va de l'importation de pygame jusqu'à la
+présentation de l'écran de démarrage. La part de ce temps passée à charger
+les images (VisualAssetManager.load_scaled_image) est aussi rapportée, car
+l'initialisation de pygame et les images du saut en dominent le total.
+
+Exemple:
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def first_frame(cache_directory):
+    """Crée la fenêtre et présente l'écran de démarrage (processus enfant).
+
+    Args:
+        cache_directory (str | None): Dossier du cache, ou None pour
+            charger les images sans cache.
+
+    Returns:
+        tuple[float, float]: Temps jusqu'à la première image et temps de
+            chargement des images (secondes).
+    """
+    start = time.perf_counter()
+    import pygame
+    from classes.SpriteCache import SpriteCache
+    from classes.VisualAssetManager import VisualAssetManager
+    from classes.Window import Window
+
+    loading = [0.0]
+    load_scaled_image = VisualAssetManager.load_scaled_image
+
+    def timed_load(self, *args, **kwargs):
+        begin = time.perf_counter()
+        image = load_scaled_image(self, *args, **kwargs)
+        loading[0] += time.perf_counter() - begin
+        return image
+
+    VisualAssetManager.load_scaled_image = timed_load
+
+    pygame.init()
+    cache = SpriteCache(cache_directory) if cache_directory else None
+    window = Window(1400, 750, sprite_cache=cache)
+    window.show_start_screen()
+    window.flip()
+    return time.perf_counter() - start, loading[0]
+
+
+def measure(cache_directory):
+    """Mesure le temps jusqu'à la première image dans un nouveau processus.
+
+    Args:
+        cache_directory (str | None): Dossier du cache, ou None.
+
+    Returns:
+        tuple[float, float]: Temps jusqu'à la première image et temps de
+            chargement des images (secondes).
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--child"]
+    if cache_directory:
+        command += ["--cache", cache_directory]
+
+    environment = dict(
+        os.environ,
+        SDL_VIDEODRIVER="dummy",
+        SDL_AUDIODRIVER="dummy",
+        PYGAME_HIDE_SUPPORT_PROMPT="1"
+    )
+    output = subprocess.run(
+        command, cwd=ROOT, env=environment, check=True,
+        capture_output=True, text=True
+    ).stdout
+    total, images = output.split()[-2:]
+    return float(total), float(images)
+
+
+def main(argv=None):
+    """Affiche le temps médian jusqu'à la première image de chaque cas.
+
+    Args:
+        argv (list[str] | None): Options de la ligne de commande.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true",
+                        help=argparse.SUPPRESS)
+    parser.add_argument("--cache", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        print(*first_frame(args.cache))
+        return
+
+    directory = tempfile.mkdtemp()
+    try:
+        uncached = [measure(None) for i in range(args.runs)]
+
+        cold = []
+        for i in range(args.runs):
+            cache = os.path.join(directory, f"cold-{i}")
+            cold.append(measure(cache))
+
+        warm = [measure(cache) for i in range(args.runs)]
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{'cas':<16} {'première image (ms)':>20} {'images (ms)':>12}")
+    for name, timings in (("sans cache", uncached), ("cache vide", cold),
+                          ("cache rempli", warm)):
+        total = statistics.median(timing[0] for timing in timings)
+        images = statistics.median(timing[1] for timing in timings)
+        print(f"{name:<16} {total * 1000:>20.1f} {images * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Banc d'essai : coût d'une copie vers l'écran selon le format des images.
+
+Pour chaque image du jeu (images chargées et images de secours dessinées
+lorsqu'un fichier manque), mesure le temps d'une copie (blit) vers
+l'écran :
+    - telle que chargée avant la préparation (les grandes images de
+      l'écran de démarrage n'étaient pas converties, les images de
+      secours gardaient le format par défaut de pygame.Surface);
+    - convertie au format de l'écran avec transparence par pixel
+      (convert_alpha);
+    - prémultipliée par son alpha (premul_alpha, copiée avec
+      BLEND_PREMULTIPLIED);
+    - préparée par VisualAssetManager.prepare, dont le choix est affiché.
+
+Exemple:
+    python benchmarks/bench_surface_formats.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+from classes.VisualAssetManager import VisualAssetManager  # noqa: E402
+
+BLITS = 3000
+
+
+def time_blit(display, image, flags=0):
+    """Mesure le temps moyen d'une copie vers l'écran.
+
+    Args:
+        display (pygame.Surface): Écran.
+        image (pygame.Surface): Image copiée.
+        flags (int): Mode de mélange pygame.
+
+    Returns:
+        float: Meilleur temps moyen de trois mesures (secondes).
+    """
+    # Première copie hors mesure : encodage RLE éventuel
+    display.blit(image, (0, 0), None, flags)
+    best = float("inf")
+    for repeat in range(3):
+        start = time.perf_counter()
+        for i in range(BLITS):
+            display.blit(image, (300 + i % 7, 200), None, flags)
+        best = min(best, (time.perf_counter() - start) / BLITS)
+    return best
+
+
+def sprites(assets):
+    """Retourne les images du jeu telles que chargées avant préparation.
+
+    Args:
+        assets (VisualAssetManager): Gestionnaire des images.
+
+    Returns:
+        list[tuple[str, pygame.Surface]]: Nom et image.
+    """
+    return [
+        ("grand skieur", assets.load_scaled_image(
+            assets.big_skier_path, (200, 200))),
+        ("grand arbre", assets.load_scaled_image(
+            assets.big_tree_path, (200, 200))),
+        ("skieur", assets.load_scaled_image(
+            assets.skier_path, (100, 100), convert=True)),
+        ("arbre", assets.load_scaled_image(
+            assets.tree_path, (70, 70), convert=True)),
+        ("rocher", assets.load_scaled_image(
+            assets.rock_path, (90, 60), convert=True)),
+        ("skieur (secours)", assets.create_fallback_skier()),
+        ("arbre (secours)", assets.create_fallback_tree()),
+        ("rocher (secours)", assets.create_fallback_rock()),
+    ]
+
+
+def main():
+    """Affiche le tableau comparatif."""
+    pygame.init()
+    display = pygame.display.set_mode((1400, 750))
+    assets = VisualAssetManager()
+
+    print(f"{'image':>17} {'chargée':>9} {'convert_alpha':>14} "
+          f"{'prémultipliée':>14} {'préparée':>9} {'gain':>6}  préparation "
+          f"(µs par copie)")
+    for name, image in sprites(assets):
+        loaded = time_blit(display, image)
+        converted = time_blit(display, image.convert_alpha())
+        premultiplied = time_blit(
+            display, image.convert_alpha().premul_alpha(),
+            pygame.BLEND_PREMULTIPLIED)
+        prepared = time_blit(display, assets.prepare(name, image))
+        mode = assets.preparations[-1][1]
+        print(f"{name:>17} {loaded * 1e6:>9.1f} {converted * 1e6:>14.1f} "
+              f"{premultiplied * 1e6:>14.1f} {prepared * 1e6:>9.1f} "
+              f"{loaded / prepared:>5.1f}x  {mode}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""
+Suite de bancs d'essai des chemins critiques de l'affichage et de la logique.
+
+Chaque banc d'essai chronomètre une fonction du jeu avec les vraies
+ressources (polices et images), sous les pilotes SDL factices
+(SDL_VIDEODRIVER=dummy, SDL_AUDIODRIVER=dummy). Les résultats sont écrits
+en JSON, puis comparés à une référence enregistrée : tout banc d'essai plus
+lent que la référence au-delà de la tolérance est signalé et le programme
+se termine avec le code 1.
+
+Exemples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --update-baseline
+    python benchmarks/run_benchmarks.py --only draw_player --tolerance 0.5
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+RESULTS_PATH = os.path.join(ROOT, "benchmarks", "results.json")
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+from classes.GameRules import GameRules  # noqa: E402
+from classes.Simulation import Simulation  # noqa: E402
+from classes.Window import Window  # noqa: E402
+
+
+def measure(function, repeat=7, target=0.05):
+    """Chronomètre une fonction sans argument.
+
+    Le nombre d'appels par répétition est calibré pour durer environ
+    `target` secondes.
+
+    Args:
+        function (Callable[[], object]): Fonction à chronométrer.
+        repeat (int): Nombre de répétitions.
+        target (float): Durée visée d'une répétition (secondes).
+
+    Returns:
+        dict: Temps par appel en microsecondes (médiane et minimum) et
+            nombre d'appels par répétition.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target / 10 or number >= 1 << 20:
+            break
+        number *= 2
+    number = max(1, int(number * target / max(elapsed, 1e-9) / 10) * 10)
+
+    timings = []
+    for r in range(repeat):
+        start = time.perf_counter()
+        for i in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+
+    return {
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "number": number,
+    }
+
+
+class Fixture:
+    """Fenêtre, simulation et obstacles partagés par les bancs d'essai."""
+
+    def __init__(self):
+        """Crée la fenêtre avec les vraies ressources et une simulation."""
+        os.chdir(ROOT)
+        pygame.init()
+        self.window = Window(1400, 750)
+        self.simulation = Simulation(
+            self.window.width,
+            self.window.height,
+            self.window.left_limit,
+            self.window.right_limit,
+            self.window.skier_left,
+            self.window.skier_right,
+            self.window.rock,
+            self.window.tree,
+            rules=GameRules(),
+            seed=1
+        )
+        self.keys = dict.fromkeys(
+            ("left", "right", "up", "down", "space", "return"), False)
+        self.frame = 0
+
+    def obstacles(self, count):
+        """Crée une simulation de `count` obstacles déjà à l'écran.
+
+        Args:
+            count (int): Nombre d'obstacles.
+
+        Returns:
+            Simulation: Simulation dont les obstacles sont visibles.
+        """
+        simulation = Simulation(
+            self.window.width,
+            self.window.height,
+            self.window.left_limit,
+            self.window.right_limit,
+            self.window.skier_left,
+            self.window.skier_right,
+            self.window.rock,
+            self.window.tree,
+            rules=GameRules(),
+            rocks=count // 2,
+            trees=count - count // 2,
+            seed=1
+        )
+        for obs in simulation.obstacles:
+            obs.y -= self.window.height
+            obs.update_rect()
+        return simulation
+
+    def gameplay_frame(self):
+        """Exécute une image de jeu complète avec des entrées scriptées."""
+        window = self.window
+        simulation = self.simulation
+        player = simulation.player
+        frame = self.frame
+        self.frame += 1
+
+        keys = self.keys
+        keys["left"] = frame % 240 < 100
+        keys["right"] = 120 <= frame % 240 < 220
+        keys["space"] = frame % 200 == 0
+
+        simulation.step(keys, 1 / 120)
+        if simulation.game_over:
+            simulation.restart(1 / 120)
+        window.scroll_side_obstacles(simulation.rules.speed)
+
+        window.clear_background()
+        for obs, x, y in simulation.interpolated_obstacles(0.5):
+            window.draw(obs.image, x, y)
+        window.draw_player(player, simulation.interpolated_player(0.5))
+        window.update_status(
+            simulation.rules.level, player.lives, player.points)
+        window.draw_side_obstacles()
+        window.flip()
+
+
+def benchmarks(fixture):
+    """Construit la liste des bancs d'essai.
+
+    Args:
+        fixture (Fixture): Objets partagés.
+
+    Returns:
+        dict[str, Callable[[], object]]: Bancs d'essai par nom.
+    """
+    window = fixture.window
+    player = fixture.simulation.player
+    rules = fixture.simulation.rules
+
+    jumping = Simulation.headless(seed=1).player
+    jumping.image = window.skier_left
+    jumping.jumping = True
+    jumping.angle = 135.0
+
+    cases = {
+        "show_text": lambda: window.show_text(
+            "Points : 1234", 700, 20, (0, 0, 0), window.font_retro),
+        "update_status": lambda: window.update_status(3, 2, 2475),
+        "update_side_obstacles": lambda: window.update_side_obstacles(1.5),
+        "draw_player": lambda: window.draw_player(player),
+        "draw_player_jumping": lambda: window.draw_player(jumping),
+        "gameplay_frame": fixture.gameplay_frame,
+    }
+
+    for count in (7, 100, 1000):
+        simulation = fixture.obstacles(count)
+
+        def check_collision(simulation=simulation):
+            for obs in simulation.obstacles:
+                rules.check_collision(simulation, simulation.player, obs)
+
+        cases[f"check_collision_{count}"] = check_collision
+
+    obstacle = fixture.simulation.obstacles[0]
+    cases["obstacle_update_position"] = lambda: obstacle.update_position(1.5)
+
+    return cases
+
+
+def compare(results, baseline, tolerance):
+    """Compare les résultats à la référence.
+
+    Le temps minimal est comparé : il est le moins sensible aux
+    interruptions du système.
+
+    Args:
+        results (dict): Résultats de cette exécution.
+        baseline (dict): Résultats de référence.
+        tolerance (float): Ralentissement relatif toléré (0.25 = 25 %).
+
+    Returns:
+        list[str]: Noms des bancs d'essai en régression.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"  {name:<28} {result['min_us']:>10.2f} µs  (nouveau)")
+            continue
+
+        ratio = result["min_us"] / reference["min_us"]
+        status = "ok"
+        if ratio > 1 + tolerance:
+            status = "RÉGRESSION"
+            regressions.append(name)
+        print(f"  {name:<28} {result['min_us']:>10.2f} µs  "
+              f"réf. {reference['min_us']:>10.2f} µs  "
+              f"{ratio:>5.2f}x  {status}")
+
+    return regressions
+
+
+def main(argv=None):
+    """Exécute la suite, écrit les résultats et les compare à la référence.
+
+    Args:
+        argv (list[str] | None): Options de la ligne de commande.
+
+    Returns:
+        int: Code de sortie (1 en cas de régression).
+    """
+    parser = argparse.ArgumentParser(
+        description="Bancs d'essai de Ski Alpin 2D")
+    parser.add_argument("--output", default=RESULTS_PATH,
+                        help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="fichier JSON de référence")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="enregistre les résultats comme référence")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="ralentissement relatif toléré (0.25 = 25 %%)")
+    parser.add_argument("--only", default="",
+                        help="n'exécute que les bancs dont le nom contient "
+                             "ce texte")
+    args = parser.parse_args(argv)
+
+    fixture = Fixture()
+    results = {}
+    for name, function in benchmarks(fixture).items():
+        if args.only in name:
+            results[name] = measure(function)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Référence enregistrée : {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+    except FileNotFoundError:
+        baseline = {}
+        print(f"Aucune référence ({args.baseline}) : "
+              "utiliser --update-baseline")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"RÉGRESSION de performance : {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Module activity_monitor.
+
+Ce module définit la classe ActivityMonitor, qui mesure l'activité de la
+boucle principale selon ce qu'elle affiche (menus ou partie) : durée,
+temps processeur consommé et nombre de réveils par seconde. Il permet de
+vérifier qu'un écran de menu immobile ne consomme presque rien.
+
+Le temps processeur est celui de tout le processus (time.process_time),
+fils du chargeur et du mélangeur audio compris.
+"""
+import time
+
+
+class ActivityMonitor:
+    """Mesure la durée, le temps processeur et les réveils par mode.
+
+    Chaque appel de tick compte un réveil de la boucle principale; le
+    temps écoulé depuis l'appel précédent est attribué au mode alors en
+    cours.
+
+    Attributes:
+        mode (str | None): Mode en cours (None : mesure arrêtée).
+        since (float): Instant du dernier appel de tick.
+        cpu_since (float): Temps processeur au dernier appel de tick.
+        totals (dict[str, list]): Durée (secondes), temps processeur
+            (secondes) et nombre de réveils de chaque mode, dans l'ordre
+            où les modes apparaissent.
+    """
+
+    def __init__(self, clock=time.perf_counter, cpu_clock=time.process_time):
+        """Initialise une mesure arrêtée.
+
+        Args:
+            clock (Callable[[], float]): Horloge (secondes).
+            cpu_clock (Callable[[], float]): Temps processeur (secondes).
+        """
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.mode = None
+        self.since = 0.0
+        self.cpu_since = 0.0
+        self.totals = {}
+
+    def tick(self, mode):
+        """Compte un réveil de la boucle et passe au mode donné.
+
+        Args:
+            mode (str | None): Mode de l'itération qui commence (None
+                arrête la mesure).
+        """
+        now = self.clock()
+        cpu = self.cpu_clock()
+        if self.mode is not None:
+            total = self.totals.setdefault(self.mode, [0.0, 0.0, 0])
+            total[0] += now - self.since
+            total[1] += cpu - self.cpu_since
+            total[2] += 1
+        self.mode = mode
+        self.since = now
+        self.cpu_since = cpu
+
+    def report(self):
+        """Résume l'activité de chaque mode.
+
+        Returns:
+            list[str]: Une ligne par mode : durée, part du temps
+                processeur et réveils par seconde.
+        """
+        lines = []
+        for mode, (elapsed, cpu, wakes) in self.totals.items():
+            if elapsed <= 0:
+                continue
+            lines.append(
+                f"{mode} : {elapsed:.1f} s, processeur {cpu / elapsed:.1%}, "
+                f"{wakes / elapsed:.1f} réveils/s"
+            )
+        return lines
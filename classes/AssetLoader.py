@@ -0,0 +1,150 @@
+"""
+Module asset_loader.
+
+Ce module définit la classe AssetLoader, qui charge des ressources (sons,
+images) dans un groupe de fils d'exécution pendant que l'écran de
+démarrage est déjà affiché. Seules les ressources de l'écran de démarrage
+sont chargées avant la première image; les autres sont attendues, au
+besoin, au lancement de la partie.
+
+Le chargeur mesure aussi le temps jusqu'à la première image et le temps
+de chargement total, et les affiche une fois connus.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class AssetLoader:
+    """Charge des ressources en arrière-plan et mesure les temps de chargement.
+
+    Attributes:
+        futures (dict[str, Future]): Tâche de chargement de chaque ressource.
+        start (float): Instant de création du chargeur (perf_counter).
+        first_frame_time (float | None): Temps jusqu'à la première image
+            présentée (secondes).
+        load_time (float | None): Temps jusqu'à la fin du chargement de
+            toutes les ressources (secondes).
+        wait_time (float): Temps passé à attendre des ressources pas encore
+            chargées (secondes).
+        verbose (bool): Affiche les temps mesurés.
+    """
+
+    def __init__(self, workers=4, verbose=True):
+        """Crée le groupe de fils d'exécution.
+
+        Args:
+            workers (int): Nombre de fils d'exécution.
+            verbose (bool): Affiche les temps mesurés.
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="assets")
+        self.futures = {}
+        self.finished = {}
+        self.start = time.perf_counter()
+        self.first_frame_time = None
+        self.load_time = None
+        self.wait_time = 0.0
+        self.verbose = verbose
+
+    def submit(self, name, function, *args):
+        """Lance le chargement d'une ressource en arrière-plan.
+
+        Args:
+            name (str): Nom unique de la ressource.
+            function (Callable): Fonction de chargement.
+            *args: Arguments de la fonction de chargement.
+        """
+        self.futures[name] = self.executor.submit(
+            self.run, name, function, *args)
+
+    def run(self, name, function, *args):
+        """Exécute un chargement et note l'instant où il se termine.
+
+        Args:
+            name (str): Nom de la ressource.
+            function (Callable): Fonction de chargement.
+            *args: Arguments de la fonction de chargement.
+
+        Returns:
+            object: Ressource chargée.
+        """
+        try:
+            return function(*args)
+        finally:
+            self.finished[name] = time.perf_counter() - self.start
+
+    def pending(self):
+        """Retourne les ressources dont le chargement n'est pas terminé.
+
+        Returns:
+            list[str]: Noms des ressources en cours de chargement.
+        """
+        return [name for name, future in self.futures.items()
+                if not future.done()]
+
+    def result(self, name):
+        """Retourne une ressource, en attendant la fin de son chargement.
+
+        Args:
+            name (str): Nom de la ressource.
+
+        Returns:
+            object: Ressource chargée.
+        """
+        future = self.futures[name]
+        if not future.done():
+            start = time.perf_counter()
+            wait([future])
+            self.wait_time += time.perf_counter() - start
+        return future.result()
+
+    def wait(self):
+        """Attend la fin des chargements qui ne sont pas terminés.
+
+        Returns:
+            float: Temps d'attente (secondes).
+        """
+        pending = [future for future in self.futures.values()
+                   if not future.done()]
+        start = time.perf_counter()
+        wait(pending)
+        waited = time.perf_counter() - start
+        self.wait_time += waited
+        return waited
+
+    def frame_presented(self):
+        """Note la présentation d'une image.
+
+        La première image fixe le temps jusqu'à la première image. Le temps
+        de chargement total est fixé dès que toutes les ressources sont
+        chargées.
+        """
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - self.start
+            self.log(
+                f"Première image : {self.first_frame_time * 1000:.0f} ms")
+
+        if self.load_time is None:
+            self.check_finished()
+
+    def check_finished(self):
+        """Fixe le temps de chargement total si tout est chargé."""
+        if self.load_time is not None or self.pending():
+            return
+
+        self.load_time = max(self.finished.values(), default=0.0)
+        self.log(f"Chargement terminé : {self.load_time * 1000:.0f} ms "
+                 f"(attente : {self.wait_time * 1000:.0f} ms)")
+
+    def log(self, message):
+        """Affiche un message si le chargeur est verbeux.
+
+        Args:
+            message (str): Message à afficher.
+        """
+        if self.verbose:
+            print(f"[CHARGEMENT]: {message}")
+
+    def shutdown(self):
+        """Attend les chargements en cours et ferme le groupe de fils."""
+        self.executor.shutdown(wait=True)
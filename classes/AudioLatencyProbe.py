@@ -0,0 +1,82 @@
+"""
+Module audio_latency_probe.
+
+Ce module définit la classe AudioLatencyProbe, qui mesure le délai entre
+un événement de jeu (obstacle touché, sauté ou franchi) et la sortie du
+son correspondant.
+
+pygame n'indique pas l'instant où un échantillon atteint le haut-parleur.
+La sonde mesure donc le délai de répartition, de l'instant où la
+simulation constate l'événement au retour de Sound.play, et y ajoute la
+durée d'un tampon du mélangeur (taille du tampon / fréquence) : un son
+lancé est mélangé au prochain rappel audio, puis joué après le tampon en
+cours. Le résultat est une estimation de la latence audible.
+
+Seuls les derniers délais de chaque événement sont conservés : la mémoire
+utilisée ne grandit pas avec la durée de la partie.
+"""
+import time
+from collections import deque
+
+
+class AudioLatencyProbe:
+    """Mesure le délai entre les événements de jeu et la sortie des sons.
+
+    Attributes:
+        buffer_latency (float): Durée d'un tampon du mélangeur (secondes).
+        capacity (int): Nombre de délais conservés pour chaque événement.
+        samples (dict[str, collections.deque[float]]): Derniers délais de
+            répartition mesurés pour chaque événement (secondes).
+        counts (dict[str, int]): Nombre de sons joués pour chaque
+            événement.
+    """
+
+    def __init__(self, frequency, buffer, capacity=1000):
+        """Initialise la sonde.
+
+        Args:
+            frequency (int): Fréquence du mélangeur (Hz).
+            buffer (int): Taille du tampon du mélangeur (échantillons).
+            capacity (int): Nombre de délais conservés pour chaque
+                événement.
+        """
+        self.buffer_latency = buffer / frequency
+        self.capacity = capacity
+        self.samples = {}
+        self.counts = {}
+
+    def play(self, event, sound, start):
+        """Joue un son et mesure le délai depuis l'événement.
+
+        Args:
+            event (str): Nom de l'événement de jeu.
+            sound (pygame.mixer.Sound): Son à jouer.
+            start (float): Instant où la simulation a constaté l'événement
+                (time.perf_counter).
+        """
+        sound.play()
+        delays = self.samples.get(event)
+        if delays is None:
+            delays = self.samples[event] = deque(maxlen=self.capacity)
+        delays.append(time.perf_counter() - start)
+        self.counts[event] = self.counts.get(event, 0) + 1
+
+    def report(self):
+        """Résume les latences estimées de chaque événement.
+
+        Returns:
+            list[str]: Une ligne par événement : nombre de sons, latence
+                moyenne et maximale estimées sur les derniers délais
+                conservés (millisecondes).
+        """
+        lines = [
+            f"Tampon du mélangeur : {self.buffer_latency * 1000:.1f} ms"
+        ]
+        for event, delays in sorted(self.samples.items()):
+            average = sum(delays) / len(delays) + self.buffer_latency
+            worst = max(delays) + self.buffer_latency
+            lines.append(
+                f"{event} : {self.counts[event]} sons, latence estimée "
+                f"{average * 1000:.1f} ms (max {worst * 1000:.1f} ms)"
+            )
+        return lines
@@ -0,0 +1,126 @@
+"""
+Module collision_masks.
+
+Ce module définit la classe CollisionMasks, un test de collision au pixel
+près entre le skieur et les obstacles. Il sert de test précis
+(GameRules.narrow_phase) : il n'est appelé que si les rectangles de
+collision se chevauchent déjà, ce qui arrive rarement.
+
+Les masques (pygame.mask.Mask) sont calculés une fois pour toutes au
+chargement des images : un par image de la partie, plus un par image
+précalculée du saut (SpriteTable). Aucun masque n'est calculé pendant la
+partie; une image sans masque garde le résultat du test des rectangles.
+"""
+import pygame
+from classes.HeadlessSprite import round_coordinate
+
+
+class CollisionMasks:
+    """Masques de collision des images de la partie.
+
+    Attributes:
+        sprite_table (SpriteTable): Images précalculées du saut.
+        masks (dict[pygame.Surface, pygame.mask.Mask]): Masque de chaque
+            image de la partie.
+        frames (dict[pygame.Surface, list[pygame.mask.Mask]]): Masque de
+            chaque image du saut, par image du skieur.
+        tests (int): Nombre de tests au pixel près.
+        rejected (int): Chevauchements de rectangles sans contact de
+            pixels.
+    """
+
+    def __init__(self, sprite_table):
+        """Initialise des masques vides.
+
+        Args:
+            sprite_table (SpriteTable): Images précalculées du saut, dont
+                les masques suivent l'indice.
+        """
+        self.sprite_table = sprite_table
+        self.masks = {}
+        self.frames = {}
+        self.tests = 0
+        self.rejected = 0
+
+    def build(self, skier_images, obstacle_images, sources=None):
+        """Calcule les masques des images de la partie.
+
+        Peut s'exécuter dans un fil d'exécution du chargeur, après la
+        construction des images du saut.
+
+        Args:
+            skier_images (Iterable[pygame.Surface]): Images du skieur, dont
+                les images du saut sont aussi masquées.
+            obstacle_images (Iterable[pygame.Surface]): Images des
+                obstacles.
+            sources (dict[pygame.Surface, pygame.Surface] | None): Image
+                avec transparence par pixel de chaque image du skieur,
+                transformée pour les images du saut qui manquent.
+        """
+        sources = sources or {}
+        for image in skier_images:
+            self.masks[image] = pygame.mask.from_surface(image)
+            frames = self.sprite_table.tables.get(image)
+            if frames is None:
+                frames = self.sprite_table.build(
+                    image, source=sources.get(image))
+            self.frames[image] = [
+                pygame.mask.from_surface(frame) for frame in frames
+            ]
+        for image in obstacle_images:
+            self.masks[image] = pygame.mask.from_surface(image)
+
+    def player_mask(self, player):
+        """Retourne le masque du skieur et sa position à l'écran.
+
+        Pendant un saut, l'image précalculée est centrée sur l'image du
+        skieur, comme dans Window.draw_player.
+
+        Args:
+            player (Player): Joueur.
+
+        Returns:
+            tuple[pygame.mask.Mask | None, int, int]: Masque (None si
+                l'image n'a pas de masque) et position de son coin
+                supérieur gauche.
+        """
+        x = round_coordinate(player.x)
+        y = round_coordinate(player.y)
+        if not player.jumping:
+            return self.masks.get(player.image), x, y
+
+        frames = self.frames.get(player.image)
+        if frames is None:
+            return None, x, y
+        mask = frames[self.sprite_table.index(player.angle)]
+        width, height = mask.get_size()
+        return (
+            mask,
+            x + player.image.get_width()//2 - width//2,
+            y + player.image.get_height()//2 - height//2
+        )
+
+    def __call__(self, player, obstacle):
+        """Vérifie si les pixels du skieur et d'un obstacle se touchent.
+
+        Args:
+            player (Player): Joueur.
+            obstacle (Obstacle): Obstacle dont le rectangle de collision
+                chevauche celui du joueur.
+
+        Returns:
+            bool: True si des pixels opaques se chevauchent, ou si l'une
+                des images n'a pas de masque.
+        """
+        mask, x, y = self.player_mask(player)
+        obstacle_mask = self.masks.get(obstacle.image)
+        if mask is None or obstacle_mask is None:
+            return True
+
+        self.tests += 1
+        offset = (round_coordinate(obstacle.x) - x,
+                  round_coordinate(obstacle.y) - y)
+        if mask.overlap(obstacle_mask, offset) is None:
+            self.rejected += 1
+            return False
+        return True
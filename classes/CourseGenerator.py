@@ -0,0 +1,272 @@
+"""
+Module course_generator.
+
+Ce module définit la classe CourseGenerator, qui construit la piste par
+tronçons de hauteur fixe, à mesure qu'elle défile. Chaque tronçon place
+des rochers et des arbres en respectant un espacement minimal entre
+obstacles et en gardant au moins un passage pour le skieur.
+
+Vérification du passage : la piste est découpée en couloirs (colonnes) et
+en rangées. Une case est libre si le skieur peut s'y trouver, n'importe
+où dans la case, sans toucher d'obstacle. En descendant d'une rangée, le
+skieur peut rester dans son couloir ou passer au couloir voisin; les
+couloirs atteignables de chaque rangée sont un masque de bits, si bien
+que la vérification d'un tronçon ne coûte que quelques opérations sur des
+entiers par rangée. Les rochers sont traités comme des arbres : le
+passage garanti ne demande pas de sauter.
+
+Les obstacles sont placés un à un, ceux du premier niveau d'abord; une
+position qui fermerait le passage est tirée de nouveau. Retirer des
+obstacles ne ferme jamais un passage : la piste reste donc praticable à
+tous les niveaux, quels que soient les obstacles en jeu.
+
+Les coordonnées verticales sont celles de la piste : un obstacle placé à
+y apparaît à l'écran à y moins la distance parcourue.
+"""
+import math
+import random
+from operator import itemgetter
+
+# Clé de tri des obstacles placés
+PLACEMENT_Y = itemgetter(1)
+
+
+class CourseGenerator:
+    """Construit la piste par tronçons avec un passage garanti.
+
+    Un obstacle placé est un tuple (x, y, jump_allowed, level) : position
+    de l'image sur la piste, rocher (True) ou arbre (False), et premier
+    niveau auquel l'obstacle est en jeu.
+
+    Attributes:
+        left_limit (int): Limite horizontale gauche de la piste.
+        right_limit (int): Limite horizontale droite de la piste.
+        start (int): Haut du premier tronçon, sur la piste.
+        chunk_height (int): Hauteur d'un tronçon.
+        sizes (dict[bool, tuple[int, int]]): Taille de l'image des rochers
+            (True) et des arbres (False).
+        player_size (tuple[int, int]): Taille du rectangle de collision du
+            skieur.
+        counts (dict[bool, int]): Rochers et arbres de chaque tronçon au
+            premier niveau.
+        extra_per_level (int): Rochers et arbres ajoutés à chaque niveau.
+        max_extra (int): Nombre maximal de rochers et d'arbres ajoutés.
+        spacing (int): Espace minimal entre les images de deux obstacles.
+        lane_width (int): Largeur d'un couloir.
+        row_height (int): Hauteur d'une rangée.
+        rows (int): Nombre de rangées d'un tronçon.
+        lanes (int): Nombre de couloirs.
+        tries (int): Nombre de positions tirées pour un obstacle.
+        rng (random.Random): Générateur aléatoire de la piste.
+        chunks (int): Nombre de tronçons construits.
+        blocking (int): Positions tirées de nouveau car elles fermaient
+            le passage.
+        unplaced (int): Obstacles sans position valide, non placés.
+    """
+
+    def __init__(self, left_limit, right_limit, start, sizes,
+                 player_size=(80, 80), chunk_height=750, rocks=3, trees=4,
+                 extra_per_level=1, max_extra=10, spacing=20, lane_width=25,
+                 slope=0.4, tries=10, seed=None):
+        """Initialise le générateur.
+
+        Args:
+            left_limit (int): Limite horizontale gauche de la piste.
+            right_limit (int): Limite horizontale droite de la piste.
+            start (int): Haut du premier tronçon, sur la piste.
+            sizes (dict[bool, tuple[int, int]]): Taille de l'image des
+                rochers (True) et des arbres (False).
+            player_size (tuple[int, int]): Taille du rectangle de
+                collision du skieur.
+            chunk_height (int): Hauteur d'un tronçon.
+            rocks (int): Rochers de chaque tronçon au premier niveau.
+            trees (int): Arbres de chaque tronçon au premier niveau.
+            extra_per_level (int): Rochers et arbres ajoutés à chaque
+                niveau au-delà du premier.
+            max_extra (int): Nombre maximal de rochers et d'arbres
+                ajoutés.
+            spacing (int): Espace minimal entre les images de deux
+                obstacles.
+            lane_width (int): Largeur d'un couloir.
+            slope (float): Déplacement latéral du skieur par pixel de
+                descente, au moins. Le skieur se déplace de 3 pixels par
+                pas de logique; 0.4 couvre une vitesse de défilement
+                jusqu'à 7.5 pixels par pas (niveau 13).
+            tries (int): Nombre de positions tirées pour un obstacle.
+            seed (int | None): Graine du générateur aléatoire.
+        """
+        self.left_limit = left_limit
+        self.right_limit = right_limit
+        self.start = start
+        self.chunk_height = chunk_height
+        self.sizes = sizes
+        self.player_size = player_size
+        self.counts = {True: rocks, False: trees}
+        self.extra_per_level = extra_per_level
+        self.max_extra = max_extra
+        self.spacing = spacing
+        self.lane_width = lane_width
+        self.row_height = math.ceil(lane_width / slope)
+        self.rows = math.ceil(chunk_height / self.row_height)
+        self.tries = tries
+        self.rng = random.Random(seed)
+
+        # Le skieur reste entre les limites, bornes exclues
+        self.lanes = (right_limit - left_limit - 1) // lane_width
+        self.all_lanes = (1 << self.lanes) - 1
+
+        # Aucun obstacle dans le haut d'un tronçon : les obstacles d'un
+        # tronçon ne gênent pas les rangées du tronçon précédent
+        self.clearance = player_size[1] + spacing
+
+        self.chunks = 0
+        self.blocking = 0
+        self.unplaced = 0
+
+    def course(self):
+        """Construit la piste, un tronçon à la fois, sans fin.
+
+        Yields:
+            tuple[int, list[tuple]]: Haut du tronçon sur la piste et
+                obstacles placés, triés par position verticale.
+        """
+        top = self.start
+        reach = self.all_lanes
+        last_free = self.all_lanes
+
+        while True:
+            placements, reach, last_free = self.build_chunk(
+                top, reach, last_free)
+            self.chunks += 1
+            yield top, placements
+            top += self.chunk_height
+
+    def build_chunk(self, top, reach, last_free):
+        """Construit un tronçon qui prolonge le passage.
+
+        Args:
+            top (int): Haut du tronçon sur la piste.
+            reach (int): Couloirs atteignables à la dernière rangée du
+                tronçon précédent.
+            last_free (int): Couloirs libres de la dernière rangée du
+                tronçon précédent.
+
+        Returns:
+            tuple[list[tuple], int, int]: Obstacles placés, puis couloirs
+                atteignables et couloirs libres de la dernière rangée.
+        """
+        rng = self.rng
+        spacing = self.spacing
+        placements = []
+        boxes = []
+        blocked = [0] * self.rows
+        exit_reach = self.passable(blocked, reach, last_free)
+
+        for jump_allowed, level in self.levels():
+            width, height = self.sizes[jump_allowed]
+            for attempt in range(self.tries):
+                x = rng.randint(self.left_limit + 50, self.right_limit - 50)
+                y = rng.randint(top + self.clearance,
+                                top + self.chunk_height - height)
+                box = (x - spacing, y - spacing,
+                       x + width + spacing, y + height + spacing)
+                if any(
+                    box[0] < other[2] and other[0] < box[2]
+                    and box[1] < other[3] and other[1] < box[3]
+                    for other in boxes
+                ):
+                    continue
+
+                candidate = list(blocked)
+                self.block(candidate, x, y - top, width, height)
+                candidate_reach = self.passable(candidate, reach, last_free)
+                if not candidate_reach:
+                    self.blocking += 1
+                    continue
+
+                blocked = candidate
+                exit_reach = candidate_reach
+                boxes.append((x, y, x + width, y + height))
+                placements.append((x, y, jump_allowed, level))
+                break
+            else:
+                self.unplaced += 1
+
+        placements.sort(key=PLACEMENT_Y)
+        return placements, exit_reach, self.all_lanes & ~blocked[-1]
+
+    def levels(self):
+        """Énumère les obstacles d'un tronçon et leur premier niveau.
+
+        Returns:
+            list[tuple[bool, int]]: Rocher ou arbre, et premier niveau,
+                du premier niveau au plus élevé.
+        """
+        per_level = self.extra_per_level
+        extra = self.max_extra if per_level else 0
+        levels = []
+        for jump_allowed in (True, False):
+            levels += [(jump_allowed, 1)] * self.counts[jump_allowed]
+            levels += [(jump_allowed, 2 + i // per_level)
+                       for i in range(extra)]
+        return sorted(levels, key=itemgetter(1))
+
+    def block(self, blocked, x, y, width, height):
+        """Marque les cases où le skieur toucherait un obstacle.
+
+        Les positions sont celles des images; les rectangles de collision
+        sont réduits de 10 pixels de chaque côté, comme dans
+        Player.update_rect et Obstacle.update_rect.
+
+        Args:
+            blocked (list[int]): Couloirs bloqués de chaque rangée,
+                modifiés sur place.
+            x (int): Position horizontale de l'obstacle.
+            y (int): Position verticale de l'obstacle, depuis le haut du
+                tronçon.
+            width (int): Largeur de l'image de l'obstacle.
+            height (int): Hauteur de l'image de l'obstacle.
+        """
+        lane, row = self.lane_width, self.row_height
+        player_width, player_height = self.player_size
+        origin = self.left_limit + 1
+
+        # Positions du skieur en collision (intervalles ouverts)
+        left = x - player_width - origin
+        right = x + width - 20 - origin
+        upper = y - player_height
+        lower = y + height - 20
+
+        first_lane = max(0, math.floor(left / lane))
+        last_lane = min(self.lanes - 1, math.ceil(right / lane) - 1)
+        first_row = max(0, math.floor(upper / row))
+        last_row = min(self.rows - 1, math.ceil(lower / row) - 1)
+        if first_lane > last_lane:
+            return
+
+        mask = ((1 << (last_lane - first_lane + 1)) - 1) << first_lane
+        for i in range(first_row, last_row + 1):
+            blocked[i] |= mask
+
+    def passable(self, blocked, reach, last_free):
+        """Propage les couloirs atteignables d'une rangée à la suivante.
+
+        Args:
+            blocked (list[int]): Couloirs bloqués de chaque rangée.
+            reach (int): Couloirs atteignables à la rangée précédente.
+            last_free (int): Couloirs libres de la rangée précédente.
+
+        Returns:
+            int: Couloirs atteignables à la dernière rangée, 0 s'il n'y a
+                pas de passage.
+        """
+        all_lanes = self.all_lanes
+        for mask in blocked:
+            free = all_lanes & ~mask
+            # Changer de couloir exige qu'il soit libre dans les deux
+            # rangées
+            reach = (reach | ((reach << 1 | reach >> 1) & last_free)) & free
+            if not reach:
+                return 0
+            last_free = free
+        return reach
@@ -0,0 +1,186 @@
+"""
+Module course_scheduler.
+
+Ce module définit la classe CourseScheduler, qui place les obstacles selon
+la piste construite par tronçons (CourseGenerator, CourseStream) au lieu
+de les replacer au hasard. Un obstacle de la piste est pris dans sa
+réserve lorsqu'il arrive à moins d'un horizon sous le haut de l'écran,
+s'il est en jeu au niveau courant, puis rendu à sa réserve lorsqu'il sort
+de l'écran par le haut. Un tronçon entièrement placé est oublié.
+
+Les derniers tronçons reçus sont conservés : une partie rétablie depuis
+un instantané (Simulation.restore) reprend les tronçons déjà consommés,
+dans le même ordre, au lieu d'en demander de nouveaux.
+"""
+from collections import deque
+from classes.SpawnScheduler import SpawnScheduler
+
+
+class CourseScheduler(SpawnScheduler):
+    """Place les obstacles de la piste construite par tronçons.
+
+    Attributes:
+        pools (dict[str, ObstaclePool]): Réserve des rochers et des
+            arbres.
+        stream (CourseStream): Tronçons de la piste.
+        horizon (float): Distance sous le haut de l'écran à laquelle un
+            obstacle entre en jeu.
+        pending (collections.deque): Obstacles des tronçons reçus, pas
+            encore entrés en jeu, triés par position verticale.
+        frontier (float): Bas du dernier tronçon reçu, sur la piste.
+        next_y (float): Position sur la piste du prochain obstacle à
+            placer, ou du prochain tronçon à recevoir.
+        skipped (int): Obstacles de la piste ignorés car d'un niveau
+            plus élevé.
+        history (collections.deque): Derniers tronçons reçus du flux.
+        received (int): Nombre de tronçons placés depuis le début de la
+            partie, inférieur au nombre de tronçons consommés après le
+            rétablissement d'un instantané.
+    """
+
+    def __init__(self, pools, stream, horizon, history=8):
+        """Initialise le planificateur.
+
+        Args:
+            pools (dict[str, ObstaclePool]): Réserve des rochers
+                ("rochers") et des arbres ("arbres").
+            stream (CourseStream): Tronçons de la piste.
+            horizon (float): Distance sous le haut de l'écran à laquelle un
+                obstacle entre en jeu.
+            history (int): Nombre de tronçons reçus conservés pour les
+                instantanés.
+        """
+        super().__init__(pools, per_level=0)
+        self.kinds = {True: pools["rochers"], False: pools["arbres"]}
+        self.stream = stream
+        self.horizon = horizon
+        self.pending = deque()
+        self.frontier = stream.generator.start
+        self.next_y = self.frontier
+        self.skipped = 0
+        self.history = deque(maxlen=history)
+        self.received = 0
+
+    def due(self, level, distance):
+        """Indique si un obstacle ou un tronçon arrive à l'horizon.
+
+        Args:
+            level (int): Niveau du jeu.
+            distance (float): Distance parcourue sur la piste.
+
+        Returns:
+            bool: True si des obstacles doivent entrer en jeu.
+        """
+        return self.next_y < distance + self.horizon
+
+    def spawn(self, level, distance):
+        """Place les obstacles de la piste arrivés à l'horizon.
+
+        Args:
+            level (int): Niveau du jeu.
+            distance (float): Distance parcourue sur la piste.
+
+        Returns:
+            list[Obstacle]: Obstacles entrés en jeu.
+        """
+        limit = distance + self.horizon
+        pending = self.pending
+        spawned = []
+
+        while self.frontier < limit:
+            top, placements = self.next_chunk()
+            pending.extend(placements)
+            self.frontier = top + self.stream.generator.chunk_height
+
+        while pending and pending[0][1] < limit:
+            x, y, jump_allowed, first_level = pending.popleft()
+            if level < first_level:
+                self.skipped += 1
+                continue
+            obstacle = self.kinds[jump_allowed].acquire((x, y - distance))
+            if obstacle is not None:
+                spawned.append(obstacle)
+
+        self.next_y = pending[0][1] if pending else self.frontier
+        return spawned
+
+    def next_chunk(self):
+        """Reçoit le prochain tronçon, du flux ou des tronçons conservés.
+
+        Returns:
+            tuple[int, list[tuple]]: Haut du tronçon sur la piste et
+                obstacles placés.
+        """
+        behind = self.stream.consumed - self.received
+        if behind:
+            chunk = self.history[-behind]
+        else:
+            chunk = self.stream.next_chunk()
+            self.history.append(chunk)
+        self.received += 1
+        return chunk
+
+    def state(self):
+        """Retourne l'état du planificateur, de ses réserves et de la piste.
+
+        Returns:
+            tuple: État des réserves (voir SpawnScheduler.state), puis
+                tronçons reçus, bas du dernier tronçon, prochain obstacle,
+                obstacles ignorés et obstacles pas encore entrés en jeu.
+        """
+        return super().state() + (
+            self.received, self.frontier, self.next_y, self.skipped,
+            tuple(self.pending)
+        )
+
+    def set_state(self, state):
+        """Rétablit l'état du planificateur, de ses réserves et de la piste.
+
+        Args:
+            state (tuple): État retourné par state.
+
+        Raises:
+            ValueError: Si des tronçons consommés depuis l'instantané ne
+                sont plus conservés.
+        """
+        received, frontier, next_y, skipped, pending = state[-5:]
+        if self.stream.consumed - received > len(self.history):
+            raise ValueError("instantané trop ancien : tronçons oubliés")
+        super().set_state(state[:-5])
+        self.received = received
+        self.frontier = frontier
+        self.next_y = next_y
+        self.skipped = skipped
+        self.pending.clear()
+        self.pending.extend(pending)
+
+    def retire(self, obstacle, level):
+        """Rend à sa réserve un obstacle sorti de l'écran.
+
+        Args:
+            obstacle (Obstacle): Obstacle sorti de l'écran par le haut.
+            level (int): Niveau du jeu.
+
+        Returns:
+            bool: True si l'obstacle vient d'une réserve.
+        """
+        for pool in self.pools.values():
+            if obstacle in pool:
+                pool.release(obstacle)
+                return True
+        return False
+
+    def report(self):
+        """Résume l'utilisation des réserves et de la piste.
+
+        Returns:
+            list[str]: Une ligne par réserve, puis une ligne pour la piste.
+        """
+        generator = self.stream.generator
+        return super().report() + [
+            f"Piste : {self.stream.consumed} tronçons, "
+            f"{generator.blocking} positions qui fermaient le passage, "
+            f"{generator.unplaced} obstacles non placés, "
+            f"{self.skipped} obstacles d'un niveau plus élevé, "
+            f"attente : {self.stream.wait_time * 1000:.1f} ms"
+        ]
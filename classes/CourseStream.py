@@ -0,0 +1,78 @@
+"""
+Module course_stream.
+
+Ce module définit la classe CourseStream, qui construit les tronçons de la
+piste (CourseGenerator) dans un fil d'exécution en arrière-plan, en avance
+sur la caméra. Les tronçons construits attendent dans une file de taille
+bornée : le fil s'arrête lorsque la file est pleine et reprend lorsqu'un
+tronçon est consommé. La mémoire reste donc bornée, même pour une partie
+sans fin.
+
+La suite des tronçons ne dépend que de la graine du générateur, et non du
+moment où le fil les construit : une partie reste reproductible.
+"""
+import queue
+import threading
+import time
+
+
+class CourseStream:
+    """File bornée de tronçons construits en arrière-plan.
+
+    Attributes:
+        generator (CourseGenerator): Générateur des tronçons.
+        chunks (queue.Queue): Tronçons construits, pas encore consommés.
+        consumed (int): Nombre de tronçons consommés.
+        wait_time (float): Temps passé à attendre un tronçon pas encore
+            construit (secondes).
+    """
+
+    def __init__(self, generator, ahead=2):
+        """Démarre la construction des tronçons.
+
+        Args:
+            generator (CourseGenerator): Générateur des tronçons.
+            ahead (int): Nombre maximal de tronçons construits d'avance.
+        """
+        self.generator = generator
+        self.chunks = queue.Queue(maxsize=ahead)
+        self.consumed = 0
+        self.wait_time = 0.0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, name="course", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Construit les tronçons tant que le flux n'est pas fermé."""
+        for chunk in self.generator.course():
+            while not self.stopped.is_set():
+                try:
+                    self.chunks.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if self.stopped.is_set():
+                return
+
+    def next_chunk(self):
+        """Consomme le prochain tronçon, en l'attendant au besoin.
+
+        Returns:
+            tuple[int, list[tuple]]: Haut du tronçon sur la piste et
+                obstacles placés, triés par position verticale.
+        """
+        try:
+            chunk = self.chunks.get_nowait()
+        except queue.Empty:
+            start = time.perf_counter()
+            chunk = self.chunks.get()
+            self.wait_time += time.perf_counter() - start
+
+        self.consumed += 1
+        return chunk
+
+    def close(self):
+        """Arrête la construction des tronçons."""
+        self.stopped.set()
+        self.thread.join()
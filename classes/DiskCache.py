@@ -0,0 +1,151 @@
+"""
+Module disk_cache.
+
+Ce module définit la classe DiskCache, base des caches sur disque des
+ressources déjà décodées (images redimensionnées, sons décodés en PCM).
+
+Le nom d'une entrée contient le nom du fichier source, une étiquette
+décrivant la forme décodée (taille d'image, format du mélangeur audio) et
+une empreinte (SHA-256) du contenu du fichier source et de l'étiquette :
+une ressource modifiée ou une autre forme décodée donne une nouvelle
+entrée, et les entrées périmées de la même ressource et de la même
+étiquette sont supprimées à l'écriture.
+"""
+import hashlib
+import os
+
+# À incrémenter si le format des entrées change
+FORMAT_VERSION = 1
+
+
+class DiskCache:
+    """Cache sur disque d'octets dérivés d'un fichier source.
+
+    Les sous-classes définissent l'étiquette (tag) d'une forme décodée et
+    l'extension de leurs entrées, puis convertissent les octets lus et
+    écrits.
+
+    Attributes:
+        directory (str): Dossier des entrées du cache.
+        extension (str): Extension des fichiers d'entrée.
+        hits (int): Nombre de ressources lues dans le cache.
+        misses (int): Nombre de ressources absentes du cache.
+    """
+
+    extension = ".bin"
+
+    def __init__(self, directory):
+        """Initialise le cache.
+
+        Le dossier n'est créé qu'à la première écriture.
+
+        Args:
+            directory (str): Dossier des entrées du cache.
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def tag(self, form):
+        """Décrit la forme décodée d'une ressource.
+
+        Args:
+            form (tuple): Forme décodée (taille, format, ...).
+
+        Returns:
+            str: Étiquette utilisable dans un nom de fichier.
+        """
+        return "-".join(str(value) for value in form)
+
+    def prefix(self, path, form):
+        """Calcule le début du nom des entrées d'une ressource.
+
+        Args:
+            path (str): Chemin du fichier source.
+            form (tuple): Forme décodée.
+
+        Returns:
+            str: Nom du fichier source suivi de l'étiquette.
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        return f"{name}-{self.tag(form)}-"
+
+    def entry_path(self, path, form):
+        """Calcule le chemin de l'entrée d'une ressource.
+
+        Args:
+            path (str): Chemin du fichier source.
+            form (tuple): Forme décodée.
+
+        Returns:
+            str: Chemin de l'entrée dans le dossier du cache.
+
+        Raises:
+            FileNotFoundError: Si le fichier source n'existe pas.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{FORMAT_VERSION}:{self.tag(form)}:".encode())
+        with open(path, "rb") as file:
+            digest.update(file.read())
+
+        return os.path.join(
+            self.directory,
+            self.prefix(path, form) + digest.hexdigest()[:16]
+            + self.extension
+        )
+
+    def read(self, path, form):
+        """Lit les octets d'une entrée.
+
+        Args:
+            path (str): Chemin du fichier source.
+            form (tuple): Forme décodée.
+
+        Returns:
+            bytes | None: Contenu de l'entrée, ou None si elle est absente
+                ou illisible.
+
+        Raises:
+            FileNotFoundError: Si le fichier source n'existe pas.
+        """
+        entry = self.entry_path(path, form)
+
+        try:
+            with open(entry, "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def write(self, path, form, data):
+        """Écrit les octets d'une entrée.
+
+        Les entrées précédentes de la même ressource et de la même étiquette
+        sont supprimées. Une erreur d'écriture (dossier en lecture seule,
+        disque plein) est ignorée : le cache n'est qu'une accélération.
+
+        Args:
+            path (str): Chemin du fichier source.
+            form (tuple): Forme décodée.
+            data (bytes): Contenu de l'entrée.
+        """
+        entry = self.entry_path(path, form)
+        prefix = self.prefix(path, form)
+        length = len(os.path.basename(entry))
+        temporary = entry + ".tmp"
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(data)
+            os.replace(temporary, entry)
+
+            for name in os.listdir(self.directory):
+                stale = os.path.join(self.directory, name)
+                if (
+                    name.startswith(prefix)
+                    and len(name) == length
+                    and stale != entry
+                ):
+                    os.remove(stale)
+        except OSError:
+            pass
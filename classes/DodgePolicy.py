@@ -0,0 +1,126 @@
+"""
+Module dodge_policy.
+
+Ce module définit la classe DodgePolicy, une politique d'entrées scriptée
+pour les parties simulées sans affichage (batch.py). Le skieur évite
+l'obstacle le plus proche devant lui en s'écartant du côté le plus libre,
+saute les rochers trop proches pour être évités et revient vers le milieu
+de la piste lorsque la voie est libre. Une part des images est jouée en
+retard (touches de l'image précédente conservées), pour que les parties
+ne soient pas toutes parfaites.
+"""
+import random
+from classes.Recording import KEY_NAMES
+
+
+class DodgePolicy:
+    """Politique scriptée qui évite les obstacles.
+
+    Attributes:
+        rng (random.Random): Générateur aléatoire des retards.
+        lookahead (float): Distance sous le skieur à laquelle un obstacle
+            est pris en compte.
+        margin (float): Marge latérale ajoutée aux obstacles.
+        jump_distance (float): Distance sous le skieur à laquelle un
+            rocher est sauté plutôt qu'évité.
+        error (float): Probabilité de conserver les touches de l'image
+            précédente.
+        keys (dict): Touches actives.
+    """
+
+    def __init__(self, seed=None, lookahead=250, margin=20,
+                 jump_distance=30, error=0.1):
+        """Initialise la politique.
+
+        Args:
+            seed (int | None): Graine des retards.
+            lookahead (float): Distance sous le skieur à laquelle un
+                obstacle est pris en compte.
+            margin (float): Marge latérale ajoutée aux obstacles.
+            jump_distance (float): Distance sous le skieur à laquelle un
+                rocher est sauté plutôt qu'évité.
+            error (float): Probabilité de conserver les touches de l'image
+                précédente.
+        """
+        self.rng = random.Random(seed)
+        self.lookahead = lookahead
+        self.margin = margin
+        self.jump_distance = jump_distance
+        self.error = error
+        self.keys = dict.fromkeys(KEY_NAMES, False)
+
+    def threat(self, simulation):
+        """Cherche l'obstacle le plus proche sur la trajectoire du skieur.
+
+        Les rectangles de collision des obstacles ne sont mis à jour par
+        la simulation que près du skieur : leur position est calculée ici
+        à partir de celle de l'obstacle, comme dans Obstacle.update_rect.
+
+        Args:
+            simulation (Simulation): Partie en cours.
+
+        Returns:
+            tuple[Obstacle, float, float] | None: Obstacle le plus proche
+                devant le skieur, dont le rectangle de collision, élargi
+                de la marge, croise celui du skieur, puis le centre
+                horizontal et le haut de ce rectangle.
+        """
+        rect = simulation.player.rect
+        top = rect.y
+        bottom = rect.y + rect.height + self.lookahead
+        left = rect.x - self.margin
+        right = rect.x + rect.width + self.margin
+
+        nearest = None
+        for obs in simulation.obstacles:
+            x = obs.x + 10
+            y = obs.y + 10
+            width = obs.rect.width
+            if (
+                y + obs.rect.height > top
+                and y < bottom
+                and x < right
+                and x + width > left
+                and (nearest is None or y < nearest[2])
+            ):
+                nearest = (obs, x + width / 2, y)
+        return nearest
+
+    def __call__(self, simulation):
+        """Choisit les touches actives de la prochaine image.
+
+        Args:
+            simulation (Simulation): Partie en cours.
+
+        Returns:
+            dict: Touches actives.
+        """
+        keys = self.keys
+        if self.rng.random() < self.error:
+            return keys
+
+        player = simulation.player
+        rect = player.rect
+        center = rect.x + rect.width / 2
+        middle = (simulation.left_limit + simulation.right_limit) / 2
+        keys["space"] = False
+
+        threat = self.threat(simulation)
+        if threat is None:
+            # Voie libre : revenir vers le milieu de la piste
+            direction = "left" if center > middle else "right"
+        else:
+            obs, obs_center, obs_top = threat
+            distance = obs_top - (rect.y + rect.height)
+            if obs.jump_allowed and distance < self.jump_distance:
+                keys["space"] = True
+            # S'écarter de l'obstacle, vers le côté de la piste le plus
+            # large
+            if abs(obs_center - center) < rect.width / 4:
+                direction = "left" if center > middle else "right"
+            else:
+                direction = "left" if obs_center > center else "right"
+
+        keys["left"] = direction == "left"
+        keys["right"] = direction == "right"
+        return keys
@@ -0,0 +1,68 @@
+"""
+Module fixed_timestep.
+
+Ce module définit la classe FixedTimestep, un accumulateur qui découple
+la fréquence de la logique du jeu de celle de l'affichage. Le temps réel
+écoulé entre deux images affichées est accumulé, puis consommé par pas
+de logique de durée fixe. Le reste de l'accumulateur donne la fraction
+utilisée pour interpoler l'affichage entre les deux derniers états.
+
+Les vitesses du jeu (Player.speed, GameRules.speed, défilement du décor)
+sont exprimées en pixels par pas de logique; elles ont été réglées pour
+120 pas par seconde.
+"""
+
+
+class FixedTimestep:
+    """Accumulateur de temps pour une logique à pas fixe.
+
+    Attributes:
+        logic_hz (int): Nombre de pas de logique par seconde.
+        dt (float): Durée d'un pas de logique (secondes).
+        max_steps (int): Nombre maximal de pas exécutés par image
+            affichée, pour éviter l'emballement après un long arrêt.
+        accumulator (float): Temps réel pas encore simulé (secondes).
+    """
+
+    def __init__(self, logic_hz=120, max_steps=8):
+        """Initialise l'accumulateur.
+
+        Args:
+            logic_hz (int): Nombre de pas de logique par seconde.
+            max_steps (int): Nombre maximal de pas par image affichée.
+        """
+        self.logic_hz = logic_hz
+        self.dt = 1 / logic_hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Ajoute le temps d'une image et calcule les pas à exécuter.
+
+        Args:
+            frame_time (float): Temps réel écoulé depuis l'image
+                précédente (secondes).
+
+        Returns:
+            int: Nombre de pas de logique à exécuter.
+        """
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+
+        if steps > self.max_steps:
+            # Le retard au-delà de max_steps est abandonné
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+
+        return steps
+
+    @property
+    def alpha(self):
+        """float: Fraction du pas suivant déjà écoulée, entre 0 et 1."""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        """Vide l'accumulateur."""
+        self.accumulator = 0.0
@@ -0,0 +1,229 @@
+"""
+Module frame_pacer.
+
+Ce module définit la classe FramePacer, qui cadence la boucle principale
+à un nombre d'images par seconde donné et mesure la régularité des
+images.
+
+Chaque image a une échéance, celle de l'image précédente plus une
+période : un retard ponctuel ne décale pas les images suivantes. Trois
+façons d'attendre l'échéance sont proposées :
+    - "sleep" : une seule mise en veille du système, économe mais
+      imprécise (le réveil peut être en retard d'une à deux
+      millisecondes, comme avec pygame.time.Clock.tick);
+    - "busy" : attente active jusqu'à l'échéance, précise mais qui occupe
+      un cœur (comme pygame.time.Clock.tick_busy_loop);
+    - "hybrid" : mise en veille jusqu'à une marge avant l'échéance, puis
+      attente active pendant la marge.
+
+Les intervalles entre images sont comptés dans un histogramme de taille
+fixe, qui permet de comparer la gigue des modes.
+"""
+import math
+import time
+
+MODES = ("sleep", "busy", "hybrid")
+
+
+class FramePacer:
+    """Cadence les images et mesure leurs intervalles.
+
+    Attributes:
+        fps (int): Nombre maximal d'images par seconde (0 : sans limite).
+        mode (str): Façon d'attendre : "sleep", "busy" ou "hybrid".
+        period (float): Durée visée d'une image (secondes).
+        spin (float): Marge d'attente active du mode "hybrid" (secondes).
+        deadline (float): Échéance de l'image en cours.
+        last (float): Fin de l'attente de l'image précédente.
+        frame_time (float): Intervalle mesuré entre les deux dernières
+            images (secondes).
+        bin_width (float): Largeur d'une classe de l'histogramme
+            (secondes).
+        histogram (list[int]): Nombre d'intervalles par classe; la
+            dernière classe compte aussi les intervalles plus longs.
+        count (int): Nombre d'intervalles mesurés.
+        total (float): Somme des intervalles (secondes).
+        total_squares (float): Somme des carrés des intervalles.
+        longest (float): Plus long intervalle (secondes).
+    """
+
+    def __init__(self, fps=120, mode="hybrid", spin=0.002,
+                 bin_width=0.00025, bins=200, refresh=30,
+                 clock=time.perf_counter, sleep=time.sleep):
+        """Initialise le cadenceur.
+
+        Args:
+            fps (int): Nombre maximal d'images par seconde (0 : sans
+                limite).
+            mode (str): Façon d'attendre : "sleep", "busy" ou "hybrid".
+            spin (float): Marge d'attente active du mode "hybrid"
+                (secondes).
+            bin_width (float): Largeur d'une classe de l'histogramme
+                (secondes).
+            bins (int): Nombre de classes de l'histogramme.
+            refresh (int): Nombre d'images entre deux calculs du résumé.
+            clock (Callable[[], float]): Horloge (secondes).
+            sleep (Callable[[float], None]): Mise en veille.
+
+        Raises:
+            ValueError: Si le mode est inconnu.
+        """
+        if mode not in MODES:
+            raise ValueError(f"mode de cadence inconnu : {mode}")
+        self.fps = fps
+        self.mode = mode
+        self.period = 1 / fps if fps > 0 else 0.0
+        self.spin = spin
+        self.clock = clock
+        self.sleep = sleep
+        self.refresh = refresh
+
+        self.bin_width = bin_width
+        self.histogram = [0] * bins
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.longest = 0.0
+        self.lines = []
+        self.frames_since_summary = refresh
+
+        self.frame_time = 0.0
+        self.reset()
+
+    def reset(self):
+        """Repart de l'instant présent, sans attente en retard."""
+        self.last = self.clock()
+        self.deadline = self.last + self.period
+
+    def wait(self):
+        """Attend l'échéance de l'image puis mesure son intervalle.
+
+        Returns:
+            float: Intervalle depuis la fin de l'attente précédente
+                (secondes).
+        """
+        clock = self.clock
+        now = clock()
+        if self.period:
+            remaining = self.deadline - now
+            if self.mode == "sleep":
+                if remaining > 0:
+                    self.sleep(remaining)
+            elif self.mode == "hybrid" and remaining > self.spin:
+                self.sleep(remaining - self.spin)
+            if self.mode != "sleep":
+                while now < self.deadline:
+                    now = clock()
+            now = clock()
+
+            # Une image en retard d'une période ou plus ne fait pas
+            # rattraper les suivantes
+            self.deadline += self.period
+            if self.deadline < now:
+                self.deadline = now + self.period
+
+        self.frame_time = now - self.last
+        self.last = now
+        self.record(self.frame_time)
+        return self.frame_time
+
+    def record(self, interval):
+        """Compte un intervalle dans l'histogramme.
+
+        Args:
+            interval (float): Intervalle entre deux images (secondes).
+        """
+        index = min(int(interval / self.bin_width), len(self.histogram) - 1)
+        self.histogram[index] += 1
+        self.count += 1
+        self.total += interval
+        self.total_squares += interval * interval
+        self.longest = max(self.longest, interval)
+        self.frames_since_summary += 1
+
+    def mean(self):
+        """float: Intervalle moyen (secondes), 0 sans mesure."""
+        return self.total / self.count if self.count else 0.0
+
+    def jitter(self):
+        """Calcule l'écart-type des intervalles.
+
+        Returns:
+            float: Écart-type (secondes), 0 sans mesure.
+        """
+        if not self.count:
+            return 0.0
+        mean = self.mean()
+        return math.sqrt(max(0.0, self.total_squares / self.count
+                             - mean * mean))
+
+    def percentile(self, q):
+        """Estime un percentile des intervalles à partir de l'histogramme.
+
+        Args:
+            q (float): Percentile recherché, entre 0 et 100.
+
+        Returns:
+            float: Borne supérieure de la classe du percentile (secondes),
+                ou 0 sans mesure.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, frames in enumerate(self.histogram):
+            seen += frames
+            if seen >= rank and frames:
+                return (index + 1) * self.bin_width
+        return len(self.histogram) * self.bin_width
+
+    def summary(self):
+        """Retourne les lignes du résumé affiché en surimpression.
+
+        Le résumé n'est recalculé que toutes les `refresh` images.
+
+        Returns:
+            list[str]: Lignes du résumé.
+        """
+        if self.frames_since_summary >= self.refresh:
+            self.frames_since_summary = 0
+            target = f"{self.fps}" if self.fps else "sans limite"
+            self.lines = [
+                f"cadence {self.mode} {target}",
+                f"intervalle {self.mean() * 1000:.2f} ms "
+                f"± {self.jitter() * 1000:.2f}",
+                f"p99 {self.percentile(99) * 1000:.2f} ms  "
+                f"max {self.longest * 1000:.2f} ms",
+            ]
+        return self.lines
+
+    def report(self, width=40):
+        """Décrit les intervalles mesurés et leur histogramme.
+
+        Args:
+            width (int): Longueur de la barre de la classe la plus
+                remplie.
+
+        Returns:
+            list[str]: Résumé, puis une ligne par classe non vide.
+        """
+        lines = [
+            f"Cadence {self.mode}, {self.fps or 'sans limite'} images/s : "
+            f"{self.count} images, intervalle moyen "
+            f"{self.mean() * 1000:.2f} ms, écart-type "
+            f"{self.jitter() * 1000:.2f} ms, p50 "
+            f"{self.percentile(50) * 1000:.2f} ms, p99 "
+            f"{self.percentile(99) * 1000:.2f} ms, max "
+            f"{self.longest * 1000:.2f} ms"
+        ]
+        most = max(self.histogram)
+        last = len(self.histogram) - 1
+        for index, frames in enumerate(self.histogram):
+            if not frames:
+                continue
+            low = index * self.bin_width * 1000
+            label = (f">= {low:6.2f} ms" if index == last
+                     else f"{low:6.2f} - {low + self.bin_width * 1000:.2f}")
+            bar = "#" * max(1, round(frames / most * width))
+            lines.append(f"{label:>16} {frames:>7} {bar}")
+        return lines
@@ -0,0 +1,216 @@
+"""
+Module frame_profiler.
+
+Ce module définit la classe FrameProfiler, qui mesure la durée de chaque
+phase d'une image de la boucle principale (entrées, logique, affichage des
+obstacles, du joueur, de l'interface et du décor, présentation, attente).
+
+Les durées sont conservées dans un tampon circulaire de taille fixe : la
+mémoire utilisée ne grandit pas avec la durée de la partie. Le tampon peut
+être résumé (images par seconde, percentiles de la durée des images, durée
+moyenne de chaque phase) pour l'affichage en surimpression, ou exporté en
+CSV.
+
+Lorsque le profileur est désactivé, chaque méthode retourne dès la
+vérification de l'attribut enabled : le coût est de quelques dizaines de
+nanosecondes par appel.
+"""
+import csv
+import time
+
+
+class FrameProfiler:
+    """Mesure la durée des phases de chaque image dans un tampon circulaire.
+
+    Attributes:
+        phases (tuple[str, ...]): Noms des phases, dans l'ordre du CSV.
+        capacity (int): Nombre d'images conservées.
+        enabled (bool): True si les durées sont mesurées.
+        overlay (bool): True si le résumé doit être affiché à l'écran.
+        refresh (int): Nombre d'images entre deux calculs du résumé.
+        samples (list[list[float]]): Durée de chaque phase (secondes),
+            une ligne par image.
+        totals (list[float]): Durée totale de chaque image (secondes).
+        frames (list[int]): Numéro de chaque image conservée.
+        index (int): Ligne du tampon de l'image en cours.
+        count (int): Nombre d'images conservées (au plus capacity).
+        frame (int): Nombre d'images mesurées depuis le début.
+        row (list[float]): Durée de chaque phase de l'image en cours.
+    """
+
+    def __init__(self, phases, capacity=600, enabled=False, refresh=30):
+        """Initialise un tampon vide.
+
+        Args:
+            phases (Iterable[str]): Noms des phases mesurées.
+            capacity (int): Nombre d'images conservées.
+            enabled (bool): Active la mesure dès la création.
+            refresh (int): Nombre d'images entre deux calculs du résumé.
+        """
+        self.phases = tuple(phases)
+        self.phase_index = {name: i for i, name in enumerate(self.phases)}
+        self.capacity = capacity
+        self.enabled = enabled
+        self.overlay = False
+        self.refresh = refresh
+
+        self.samples = [[0.0] * len(self.phases) for i in range(capacity)]
+        self.totals = [0.0] * capacity
+        self.frames = [0] * capacity
+        self.index = 0
+        self.count = 0
+        self.frame = 0
+
+        self.row = [0.0] * len(self.phases)
+        self.start = 0.0
+        self.last = 0.0
+        self.lines = []
+        self.frames_since_summary = refresh
+
+    def toggle_overlay(self):
+        """Affiche ou masque le résumé à l'écran.
+
+        Afficher le résumé active aussi la mesure. Activée en cours
+        d'image, la mesure de l'image en cours commence à cet instant.
+        """
+        self.overlay = not self.overlay
+        if self.overlay:
+            if not self.enabled:
+                self.enabled = True
+                self.begin_frame()
+            self.frames_since_summary = self.refresh
+
+    def begin_frame(self):
+        """Commence la mesure d'une image."""
+        if not self.enabled:
+            return
+
+        # L'image en cours n'entre dans le tampon qu'à end_frame, pour
+        # qu'une image interrompue n'écrase pas la plus ancienne
+        row = self.row
+        for i in range(len(row)):
+            row[i] = 0.0
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """Attribue à une phase le temps écoulé depuis la mesure précédente.
+
+        Une phase marquée plusieurs fois dans la même image (plusieurs pas
+        de logique, par exemple) cumule ses durées.
+
+        Args:
+            phase (str): Nom de la phase qui vient de se terminer.
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        self.row[self.phase_index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """Termine la mesure de l'image et avance dans le tampon."""
+        if not self.enabled:
+            return
+
+        self.totals[self.index] = time.perf_counter() - self.start
+        self.samples[self.index][:] = self.row
+        self.frames[self.index] = self.frame
+        self.frame += 1
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames_since_summary += 1
+
+    def rows(self):
+        """Retourne les images conservées, de la plus ancienne à la récente.
+
+        Returns:
+            list[tuple[int, float, list[float]]]: Numéro de l'image, durée
+                totale et durée de chaque phase (secondes).
+        """
+        first = (self.index - self.count) % self.capacity
+        order = [(first + i) % self.capacity for i in range(self.count)]
+        return [(self.frames[i], self.totals[i], self.samples[i])
+                for i in order]
+
+    def percentile(self, q):
+        """Calcule un percentile de la durée des images conservées.
+
+        Args:
+            q (float): Percentile recherché, entre 0 et 100.
+
+        Returns:
+            float: Durée de l'image au percentile q (secondes), ou 0 si
+                aucune image n'a été mesurée.
+        """
+        if self.count == 0:
+            return 0.0
+
+        totals = sorted(self.totals[i] for i in range(self.count))
+        rank = round(q / 100 * (self.count - 1))
+        return totals[rank]
+
+    def fps(self):
+        """Calcule le nombre moyen d'images par seconde.
+
+        Returns:
+            float: Images par seconde sur les images conservées.
+        """
+        elapsed = sum(self.totals[i] for i in range(self.count))
+        if elapsed == 0:
+            return 0.0
+        return self.count / elapsed
+
+    def phase_averages(self):
+        """Calcule la durée moyenne de chaque phase.
+
+        Returns:
+            dict[str, float]: Durée moyenne par phase (secondes).
+        """
+        if self.count == 0:
+            return {name: 0.0 for name in self.phases}
+
+        return {
+            name: sum(self.samples[i][p] for i in range(self.count))
+            / self.count
+            for p, name in enumerate(self.phases)
+        }
+
+    def summary(self):
+        """Retourne les lignes du résumé affiché en surimpression.
+
+        Le résumé n'est recalculé que toutes les `refresh` images : les
+        chiffres restent lisibles et les textes rendus restent en cache.
+
+        Returns:
+            list[str]: Lignes du résumé.
+        """
+        if self.frames_since_summary >= self.refresh:
+            self.frames_since_summary = 0
+            self.lines = [
+                f"FPS {self.fps():.0f}",
+                f"p50 {self.percentile(50) * 1000:.2f} ms  "
+                f"p99 {self.percentile(99) * 1000:.2f} ms",
+            ]
+            self.lines += [
+                f"{name} {average * 1000:.2f} ms"
+                for name, average in self.phase_averages().items()
+            ]
+        return self.lines
+
+    def write_csv(self, path):
+        """Écrit les images conservées dans un fichier CSV.
+
+        Les durées sont exprimées en millisecondes.
+
+        Args:
+            path (str): Chemin du fichier CSV.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "total_ms") + self.phases)
+            for frame, total, row in self.rows():
+                writer.writerow(
+                    [frame, f"{total * 1000:.4f}"]
+                    + [f"{value * 1000:.4f}" for value in row]
+                )
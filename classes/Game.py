@@ -11,38 +11,63 @@ Elle gère :
 - les sons et la musique de fond.
 
 La classe Game agit comme un contrôleur central reliant le joueur,
-la fenêtre et les obstacles, elle est une sous-classe de la classe
-AssetManager.
+la fenêtre et les obstacles, elle est une sous-classe des classes
+GameRules et AssetManager.
 
 Classes:
+    GameRules: Règles du jeu (collisions, niveau, vitesse) indépendantes
+        de pygame.
+    AssetLoader: Chargement des ressources en arrière-plan (optionnel).
+    SoundCache: Cache sur disque des sons décodés en PCM (optionnel).
+    AudioLatencyProbe: Mesure de la latence des effets sonores.
+    InputState: État du clavier tenu à jour à partir des événements.
     AssetManager: Fournit des utilitaires simples pour signaler les problèmes
         de chargement de fichiers (images, sons, polices, etc.)
 """
 import pygame
 from classes.AssetManager import AssetManager
+from classes.AudioLatencyProbe import AudioLatencyProbe
+from classes.GameRules import GameRules
+from classes.InputState import InputState
 
 
-class Game(AssetManager):
+class Game(GameRules, AssetManager):
     """Gère la logique principale et l'état global du jeu."""
 
-    def __init__(self):
+    def __init__(self, loader=None, frequency=44100, buffer=512, channels=2,
+                 sound_cache=None, latency_probe=False):
         """Initialise le jeu, pygame et les ressources audio.
 
+        Args:
+            loader (AssetLoader | None): Chargeur en arrière-plan des
+                effets sonores. Par défaut, ils sont décodés ici.
+            frequency (int): Fréquence du mélangeur audio (Hz).
+            buffer (int): Taille du tampon du mélangeur (échantillons).
+                Un petit tampon réduit la latence des effets sonores mais
+                augmente le risque de coupures.
+            channels (int): Nombre de canaux (1 : mono, 2 : stéréo).
+            sound_cache (SoundCache | None): Cache sur disque des sons
+                décodés en PCM.
+            latency_probe (bool): Mesure la latence des effets sonores.
+
         # pragma: no cover signifie que les lignes associées ne sont
         pas calculées dans le calcul de couverture des tests unittest.
         """
-        pygame.mixer.pre_init(44100, -16, 2, 512)
+        pygame.mixer.pre_init(frequency, -16, channels, buffer)
 
         if not pygame.get_init():
             pygame.init()  # pragma: no cover
 
         pygame.mixer.init()
 
+        super().__init__()
         self.started = False
-        self.clock = pygame.time.Clock()
-        self.level = 1
-        self.speed = 1
-        self.keys = ""
+        self.input = InputState()
+        self.keys = self.input.keys
+        self.sound_cache = sound_cache
+        self.latency_probe = (
+            AudioLatencyProbe(frequency, buffer) if latency_probe else None
+        )
 
         # github.com/RobertGodin/CodePython/tree/master/chapitre8/Son1.wav
         sound_killed_path = "audio/killed.wav"
@@ -60,29 +85,21 @@ class Game(AssetManager):
         # https://creativecommons.org/licenses/by-sa/3.0/
         music_path = "audio/Pandemia(chosic.com).mp3"
 
-        try:
-            self.sound_killed = pygame.mixer.Sound(sound_killed_path)
-        except FileNotFoundError:
-            self.sound_killed = None
-            super().print_file_missing_error(sound_killed_path)
-
-        try:
-            self.sound_points = pygame.mixer.Sound(sound_points_path)
-        except FileNotFoundError:
-            self.sound_points = None
-            super().print_file_missing_error(sound_points_path)
-
-        try:
-            self.sound_doh = pygame.mixer.Sound(sound_doh_path)
-        except FileNotFoundError:
-            self.sound_doh = None
-            super().print_file_missing_error(sound_doh_path)
-
-        try:
-            self.sound_woohoo = pygame.mixer.Sound(sound_woohoo_path)
-        except FileNotFoundError:
-            self.sound_woohoo = None
-            super().print_file_missing_error(sound_woohoo_path)
+        # Les effets sonores sont décodés en arrière-plan si un chargeur
+        # est fourni; ils ne servent qu'une fois la partie commencée.
+        self.loader = loader
+        self.sound_paths = {
+            "sound_killed": sound_killed_path,
+            "sound_points": sound_points_path,
+            "sound_doh": sound_doh_path,
+            "sound_woohoo": sound_woohoo_path
+        }
+        for name, path in self.sound_paths.items():
+            if loader is None:
+                setattr(self, name, self.load_sound(path))
+            else:
+                setattr(self, name, None)
+                loader.submit(name, self.load_sound, path)
 
         try:
             pygame.mixer.music.load(music_path)
@@ -91,156 +108,155 @@ class Game(AssetManager):
             self.music = False
             super().print_file_missing_error(music_path)
 
-    def check_game_started(self):
-        """Démarre la partie lorsque la touche Entrée est pressée."""
-        if self.keys["return"]:
-            self.started = True
-            if self.music:
-                pygame.mixer.music.play(-1)  # boucle infinie
+    def load_sound(self, path):
+        """Charge un effet sonore.
 
-    def restart_game(self):
-        """Redémarre la partie si la touche Entrée est pressée.
+        Si un cache est configuré, le son décodé y est lu directement, ou
+        y est écrit au premier chargement.
+
+        Args:
+            path (str): Chemin du fichier audio.
 
         Returns:
-            bool: True si la partie doit redémarrer, False sinon.
+            pygame.mixer.Sound | None: Effet sonore, ou None si le fichier
+                est manquant.
         """
-        if self.keys["return"]:
-            self.level = 1
-            if self.music:
-                pygame.mixer.music.unpause()
-            return True
-
-        return False
-
-    def get_key_pressed(self):
-        """Met à jour l'état des touches clavier pressées."""
-        pressed = pygame.key.get_pressed()
-        self.keys = {
-            "left": pressed[pygame.K_LEFT],
-            "right": pressed[pygame.K_RIGHT],
-            "up": pressed[pygame.K_UP],
-            "down": pressed[pygame.K_DOWN],
-            "space": pressed[pygame.K_SPACE],
-            "return": pressed[pygame.K_RETURN]
-        }
+        cache = self.sound_cache
+        try:
+            sound = cache.get(path) if cache is not None else None
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
+                if cache is not None:
+                    cache.put(path, sound)
+            return sound
+        except FileNotFoundError:
+            super().print_file_missing_error(path)
+            return None
 
-    def check_collision(self, window, player, obstacle):
-        """Détecte une collision entre le joueur et un obstacle visible.
+    def finish_loading(self):
+        """Attend les ressources en cours de chargement.
 
-        Cette méthode gère plusieurs cas :
-        - collision classique (perte de vie),
-        - obstacle sauté avec succès (gain de points),
-        - sortie des limites latérales.
+        Seules les ressources dont le chargement n'est pas terminé sont
+        attendues. Les effets sonores chargés en arrière-plan sont ensuite
+        rattachés au jeu.
+        """
+        if self.loader is None:
+            return
 
-        Attention :
-            Cette méthode reçoit directement des objets mutables
-            (window, player, obstacle).
+        self.loader.wait()
+        for name in self.sound_paths:
+            setattr(self, name, self.loader.result(name))
 
-        Args:
-            window (Window): Fenêtre du jeu.
-            player (Player): Joueur.
-            obstacle (Obstacle): Obstacle testé.
+    def check_game_started(self):
+        """Démarre la partie lorsque la touche Entrée est pressée.
 
-        Returns:
-            str | bool: "hit", "jumped" ou False s'il n'y a pas de collision.
+        Les ressources encore en cours de chargement sont attendues avant
+        le début de la partie.
         """
-        visible = -obstacle.image.get_height() < obstacle.y < window.height
-
-        if visible:
-            collision = player.rect.colliderect(obstacle.rect)
-        else:
-            collision = False
-
-        if (
-            collision
-            and not player.invincible
-            and (not player.jumping or not obstacle.jump_allowed)
-        ):
-            return "hit"
-
-        if (
-            collision
-            and not player.invincible
-            and obstacle.jump_allowed
-            and player.jumping
-            and not player.stop_points
-        ):
-            return "jumped"
-
-        if (
-            not player.invincible
-            and (
-                player.x <= window.left_limit
-                or player.x >= window.right_limit
-            )
-        ):
-            return "hit"
-
-        return False
+        if self.keys["return"]:
+            self.start_game()
 
-    def check_obstacle_cleared(self, player_y, obs_y, obs_cleared):
-        """Vérifie si un obstacle a été dépassé par le joueur.
+    def start_game(self):
+        """Démarre la partie et la musique."""
+        self.finish_loading()
+        self.started = True
+        if self.music:
+            pygame.mixer.music.play(-1)  # boucle infinie
 
-        Args:
-            player_y (int): Position verticale du joueur.
-            obs_y (int): Position verticale de l'obstacle.
-            obs_cleared (bool): Indique si l'obstacle a déjà été comptabilisé.
+    def restart_game(self):
+        """Redémarre la partie si la touche Entrée est pressée.
 
         Returns:
-            bool: True si l'obstacle est franchi pour la première fois.
+            bool: True si la partie doit redémarrer, False sinon.
         """
-        if player_y <= obs_y or obs_cleared:
-            return False
-        else:
+        if self.keys["return"]:
+            self.reset_game()
             return True
 
-    def obstacle_hit(self, player_lives):
+        return False
+
+    def reset_game(self):
+        """Remet le niveau à 1 et reprend la musique."""
+        self.level = 1
+        if self.music:
+            pygame.mixer.music.unpause()
+
+    def obstacle_hit(self, player_lives, event_time=None):
         """Joue le son approprié lorsqu'un obstacle est touché.
 
         Args:
             player_lives (int): Nombre de vies restantes du joueur.
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
         """
         if player_lives == 0:
             if self.sound_killed:
-                self.sound_killed.play()
+                self.play_sound("obstacle_hit", self.sound_killed, event_time)
             if self.music:
                 pygame.mixer.music.pause()
         else:
             if self.sound_doh:
-                self.sound_doh.play()
+                self.play_sound("obstacle_hit", self.sound_doh, event_time)
 
-    def obstacle_cleared(self):
-        """Joue le son associé au passage d'un obstacle."""
+    def obstacle_cleared(self, event_time=None):
+        """Joue le son associé au passage d'un obstacle.
+
+        Args:
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
+        """
         if self.sound_points:
-            self.sound_points.play()
+            self.play_sound(
+                "obstacle_cleared", self.sound_points, event_time)
+
+    def obstacle_jumped(self, event_time=None):
+        """Joue le son associé à un obstacle sauté.
 
-    def obstacle_jumped(self):
-        """Joue le son associé à un obstacle sauté."""
+        Args:
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
+        """
         if self.sound_woohoo:
-            self.sound_woohoo.play()
+            self.play_sound(
+                "obstacle_jumped", self.sound_woohoo, event_time)
 
-    def update_level(self, player_points):
-        """Met à jour le niveau et la vitesse du jeu.
+    def play_sound(self, event, sound, event_time=None):
+        """Joue l'effet sonore d'un événement de jeu.
+
+        Le délai n'est mesuré que si l'instant de l'événement est connu.
 
         Args:
-            player_points (int): Nombre de points du joueur.
+            event (str): Nom de l'événement de jeu.
+            sound (pygame.mixer.Sound): Son à jouer.
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
         """
-        self.level = player_points // 1000 + 1
-        self.speed = self.level/2 + 1
+        if self.latency_probe is None or event_time is None:
+            sound.play()
+        else:
+            self.latency_probe.play(event, sound, event_time)
 
     def check_quit_event(self):
-        """Vérifie si l'utilisateur a demandé à quitter le jeu.
+        """Lit les événements de l'image et vérifie si l'utilisateur a
+        demandé à quitter le jeu.
+
+        La file d'événements n'est vidée qu'ici : l'état des touches
+        (keys) et les touches enfoncées depuis l'image précédente
+        (input.keys_down) sont mis à jour en même temps.
 
         Returns:
             bool: True si l'événement de fermeture est détecté.
         """
-        quit_event = False
+        return self.input.poll()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                quit_event = True
+    def check_profiler_toggled(self):
+        """Vérifie si la touche F3 vient d'être enfoncée.
 
-        return quit_event
+        Returns:
+            bool: True si le résumé du profileur doit être affiché ou
+                masqué.
+        """
+        return pygame.K_F3 in self.input.keys_down
 
     def quit(self):
         """Ferme proprement pygame."""
@@ -0,0 +1,159 @@
+"""
+Module game_rules.
+
+Ce module définit la classe GameRules, qui regroupe les règles du jeu
+indépendantes de pygame :
+- la détection des collisions entre le joueur et les obstacles ou les
+  bordures de la piste,
+- le franchissement des obstacles,
+- le niveau et la vitesse du jeu.
+
+Elle expose aussi des méthodes appelées lors des événements de jeu
+(obstacle touché, franchi ou sauté). Elles ne font rien par défaut;
+la classe Game les redéfinit pour jouer les sons.
+"""
+
+
+class GameRules:
+    """Règles du jeu, sans dépendance à pygame.
+
+    Attributes:
+        level (int): Niveau du jeu.
+        speed (float): Vitesse de défilement des obstacles.
+        narrow_phase (Callable[[Player, Obstacle], bool] | None): Test de
+            collision précis (par exemple au pixel près), appelé seulement
+            si les rectangles de collision se chevauchent et que le joueur
+            n'est pas invincible. Par défaut, le chevauchement des
+            rectangles suffit.
+    """
+
+    def __init__(self):
+        """Initialise le niveau et la vitesse du jeu."""
+        self.level = 1
+        self.speed = 1
+        self.narrow_phase = None
+
+    def check_collision(self, window, player, obstacle):
+        """Détecte une collision entre le joueur et un obstacle visible.
+
+        Cette méthode gère plusieurs cas :
+        - collision classique (perte de vie),
+        - obstacle sauté avec succès (gain de points),
+        - sortie des limites latérales.
+
+        Attention :
+            Cette méthode reçoit directement des objets mutables
+            (window, player, obstacle).
+
+        Args:
+            window (Window): Fenêtre du jeu, ou tout objet ayant les
+                attributs height, left_limit et right_limit.
+            player (Player): Joueur.
+            obstacle (Obstacle): Obstacle testé.
+
+        Returns:
+            str | bool: "hit", "jumped" ou False s'il n'y a pas de collision.
+        """
+        visible = -obstacle.image.get_height() < obstacle.y < window.height
+
+        if visible:
+            collision = player.rect.colliderect(obstacle.rect)
+            # Le test précis ne change rien pour un joueur invincible
+            if (
+                collision
+                and self.narrow_phase is not None
+                and not player.invincible
+            ):
+                collision = self.narrow_phase(player, obstacle)
+        else:
+            collision = False
+
+        if (
+            collision
+            and not player.invincible
+            and (not player.jumping or not obstacle.jump_allowed)
+        ):
+            return "hit"
+
+        if (
+            collision
+            and not player.invincible
+            and obstacle.jump_allowed
+            and player.jumping
+            and not player.stop_points
+        ):
+            return "jumped"
+
+        if self.check_side_limits(window, player):
+            return "hit"
+
+        return False
+
+    def check_side_limits(self, window, player):
+        """Vérifie si le joueur touche les forêts en bordure de piste.
+
+        Args:
+            window (Window): Fenêtre du jeu, ou tout objet ayant les
+                attributs left_limit et right_limit.
+            player (Player): Joueur.
+
+        Returns:
+            bool: True si le joueur, non invincible, sort de la piste.
+        """
+        return (
+            not player.invincible
+            and (
+                player.x <= window.left_limit
+                or player.x >= window.right_limit
+            )
+        )
+
+    def check_obstacle_cleared(self, player_y, obs_y, obs_cleared):
+        """Vérifie si un obstacle a été dépassé par le joueur.
+
+        Args:
+            player_y (int): Position verticale du joueur.
+            obs_y (int): Position verticale de l'obstacle.
+            obs_cleared (bool): Indique si l'obstacle a déjà été comptabilisé.
+
+        Returns:
+            bool: True si l'obstacle est franchi pour la première fois.
+        """
+        if player_y <= obs_y or obs_cleared:
+            return False
+        else:
+            return True
+
+    def update_level(self, player_points):
+        """Met à jour le niveau et la vitesse du jeu.
+
+        Args:
+            player_points (int): Nombre de points du joueur.
+        """
+        self.level = player_points // 1000 + 1
+        self.speed = self.level/2 + 1
+
+    def obstacle_hit(self, player_lives, event_time=None):
+        """Appelée lorsqu'un obstacle est touché.
+
+        Args:
+            player_lives (int): Nombre de vies restantes du joueur.
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
+        """
+
+    def obstacle_cleared(self, event_time=None):
+        """Appelée lorsqu'un obstacle est franchi.
+
+        Args:
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
+        """
+
+    def obstacle_jumped(self, event_time=None):
+        """Appelée lorsqu'un obstacle est sauté.
+
+        Args:
+            event_time (float | None): Instant où la simulation a constaté
+                l'événement (time.perf_counter).
+        """
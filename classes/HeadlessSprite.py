@@ -0,0 +1,128 @@
+"""
+Module headless_sprite.
+
+Ce module définit des substituts minimaux de pygame.Surface et pygame.Rect
+pour exécuter la logique du jeu sans pygame ni affichage. Ils exposent
+uniquement ce que Player, Obstacle et GameRules utilisent : la taille de
+l'image et un rectangle de collision.
+
+Les coordonnées des rectangles sont arrondies comme celles de pygame.Rect
+(arrondi à l'entier le plus proche, moitié loin de zéro) afin qu'une
+partie simulée donne les mêmes collisions qu'une partie affichée.
+"""
+
+
+def round_coordinate(value):
+    """Arrondit une coordonnée comme pygame.Rect.
+
+    Args:
+        value (float): Coordonnée à arrondir.
+
+    Returns:
+        int: Coordonnée entière.
+    """
+    if value >= 0:
+        return int(value + 0.5)
+    return -int(-value + 0.5)
+
+
+class HeadlessRect:
+    """Rectangle de collision compatible avec pygame.Rect.
+
+    Attributes:
+        x (int): Position horizontale du coin supérieur gauche.
+        y (int): Position verticale du coin supérieur gauche.
+        width (int): Largeur du rectangle.
+        height (int): Hauteur du rectangle.
+    """
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        """Initialise le rectangle.
+
+        Args:
+            x (float): Position horizontale du coin supérieur gauche.
+            y (float): Position verticale du coin supérieur gauche.
+            width (int): Largeur du rectangle.
+            height (int): Hauteur du rectangle.
+        """
+        self.x = round_coordinate(x)
+        self.y = round_coordinate(y)
+        self.width = width
+        self.height = height
+
+    @property
+    def topleft(self):
+        """tuple[int, int]: Coin supérieur gauche du rectangle."""
+        return (self.x, self.y)
+
+    @topleft.setter
+    def topleft(self, position):
+        self.x = round_coordinate(position[0])
+        self.y = round_coordinate(position[1])
+
+    def colliderect(self, other):
+        """Vérifie si deux rectangles se chevauchent.
+
+        Comme pour pygame.Rect, des rectangles qui se touchent seulement
+        par un bord ne sont pas en collision.
+
+        Args:
+            other (HeadlessRect | pygame.Rect): Autre rectangle.
+
+        Returns:
+            bool: True si les rectangles se chevauchent.
+        """
+        return (
+            self.width > 0 and self.height > 0
+            and other.width > 0 and other.height > 0
+            and self.x < other.x + other.width
+            and other.x < self.x + self.width
+            and self.y < other.y + other.height
+            and other.y < self.y + self.height
+        )
+
+
+class HeadlessSprite:
+    """Image sans pixels, réduite à ses dimensions.
+
+    Attributes:
+        width (int): Largeur de l'image.
+        height (int): Hauteur de l'image.
+    """
+
+    __slots__ = ("width", "height")
+
+    def __init__(self, width, height):
+        """Initialise l'image.
+
+        Args:
+            width (int): Largeur de l'image.
+            height (int): Hauteur de l'image.
+        """
+        self.width = width
+        self.height = height
+
+    def get_width(self):
+        """Retourne la largeur de l'image."""
+        return self.width
+
+    def get_height(self):
+        """Retourne la hauteur de l'image."""
+        return self.height
+
+    def get_size(self):
+        """Retourne les dimensions de l'image."""
+        return (self.width, self.height)
+
+    def get_rect(self, topleft=(0, 0)):
+        """Retourne un rectangle de la taille de l'image.
+
+        Args:
+            topleft (tuple[float, float]): Coin supérieur gauche.
+
+        Returns:
+            HeadlessRect: Rectangle de l'image.
+        """
+        return HeadlessRect(topleft[0], topleft[1], self.width, self.height)
@@ -0,0 +1,188 @@
+"""
+Module input_state.
+
+Ce module définit la classe InputState, qui lit les entrées du clavier à
+partir des événements de pygame. La file d'événements est vidée une seule
+fois par image : la demande de fermeture, les touches enfoncées pendant
+l'image (F3, ...) et l'état des touches du jeu en sont tirés.
+
+Une touche du jeu enfoncée puis relâchée entre deux pas de logique
+(appui bref, ou image sans pas de logique à fréquence d'affichage élevée)
+reste active jusqu'au prochain pas qui la prend en compte : un appui
+n'est jamais perdu.
+
+Dans les menus, la boucle peut attendre le prochain événement (wait) au
+lieu de relire la file à chaque image : le processus dort jusqu'à un
+appui ou jusqu'à l'expiration du délai.
+
+Chaque appui est daté lorsqu'il est retiré de la file (pygame ne date pas
+les événements), puis le délai jusqu'au pas de logique qui le prend en
+compte est mesuré, en images et en millisecondes. L'attente dans la file
+avant la lecture, au plus une image, n'est donc pas comprise.
+"""
+import time
+from collections import deque
+import pygame
+
+# Touches du jeu et leur nom dans l'état transmis à la simulation
+KEY_BINDINGS = {
+    pygame.K_LEFT: "left",
+    pygame.K_RIGHT: "right",
+    pygame.K_UP: "up",
+    pygame.K_DOWN: "down",
+    pygame.K_SPACE: "space",
+    pygame.K_RETURN: "return"
+}
+
+
+class InputState:
+    """État du clavier tenu à jour à partir des événements.
+
+    Attributes:
+        keys (dict[str, bool]): Touches actives, transmises à la
+            simulation : touches tenues, plus celles enfoncées depuis le
+            dernier pas de logique. Le dictionnaire est créé une fois et
+            mis à jour sur place.
+        held (dict[str, bool]): Touches tenues à la fin de la dernière
+            lecture des événements.
+        pressed (dict[str, tuple[int, float] | None]): Image et instant du
+            premier appui de chaque touche pas encore pris en compte.
+        keys_down (list[int]): Codes des touches enfoncées pendant la
+            dernière image.
+        frame (int): Nombre de lectures des événements.
+        pending (list[pygame.event.Event]): Événements reçus pendant une
+            attente, traités à la prochaine lecture.
+        exposed (bool): La fenêtre a été découverte pendant la dernière
+            image et doit être présentée de nouveau.
+        latencies (dict[str, collections.deque]): Délais mesurés entre
+            l'appui et sa prise en compte, en images et en secondes, par
+            touche.
+    """
+
+    def __init__(self, history=600):
+        """Initialise un clavier sans touche enfoncée.
+
+        Args:
+            history (int): Nombre de délais conservés par touche.
+        """
+        names = KEY_BINDINGS.values()
+        self.keys = dict.fromkeys(names, False)
+        self.held = dict.fromkeys(names, False)
+        self.pressed = dict.fromkeys(names)
+        self.keys_down = []
+        self.frame = 0
+        self.pending = []
+        self.exposed = False
+        self.latencies = {name: deque(maxlen=history) for name in names}
+
+    def poll(self, events=None, now=None):
+        """Lit les événements de l'image.
+
+        Args:
+            events (Iterable[pygame.event.Event] | None): Événements à
+                traiter. Par défaut, la file de pygame est vidée.
+            now (float | None): Instant de la lecture (time.perf_counter).
+
+        Returns:
+            bool: True si la fermeture du jeu est demandée.
+        """
+        if events is None:
+            events = pygame.event.get()
+        if self.pending:
+            events = self.pending + list(events)
+            self.pending = []
+        if now is None:
+            now = time.perf_counter()
+        self.frame += 1
+        self.keys_down.clear()
+        self.exposed = False
+        quit_event = False
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.keys_down.append(event.key)
+                name = KEY_BINDINGS.get(event.key)
+                if name is not None:
+                    self.held[name] = True
+                    self.keys[name] = True
+                    if self.pressed[name] is None:
+                        self.pressed[name] = (self.frame, now)
+            elif event.type == pygame.KEYUP:
+                name = KEY_BINDINGS.get(event.key)
+                if name is not None:
+                    # La touche reste active si son appui n'a pas encore
+                    # été pris en compte
+                    self.held[name] = False
+                    self.keys[name] = self.pressed[name] is not None
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Les relâchements ne sont plus reçus : tout relâcher
+                for name in self.held:
+                    self.held[name] = False
+                    self.keys[name] = self.pressed[name] is not None
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.exposed = True
+            elif event.type == pygame.QUIT:
+                quit_event = True
+
+        return quit_event
+
+    def wait(self, timeout):
+        """Attend le prochain événement sans occuper le processeur.
+
+        L'événement reçu reste à traiter par la prochaine lecture (poll).
+
+        Args:
+            timeout (float): Attente maximale (secondes).
+
+        Returns:
+            bool: True si un événement est arrivé avant le délai.
+        """
+        event = pygame.event.wait(max(1, round(timeout * 1000)))
+        if event.type == pygame.NOEVENT:
+            return False
+        self.pending.append(event)
+        return True
+
+    def consume(self, now=None, record=True):
+        """Prend en compte les appuis après un pas de logique.
+
+        Le délai de chaque appui est mesuré, puis les touches relâchées
+        depuis leur appui ne sont plus actives.
+
+        Args:
+            now (float | None): Instant du pas (time.perf_counter).
+            record (bool): Mesure le délai des appuis. Les menus passent
+                False : leurs appuis ne sont pas pris en compte par un pas
+                de logique et fausseraient les statistiques.
+        """
+        for name, pressed in self.pressed.items():
+            if pressed is not None:
+                if record:
+                    if now is None:
+                        now = time.perf_counter()
+                    frame, start = pressed
+                    self.latencies[name].append(
+                        (self.frame - frame, now - start))
+                self.pressed[name] = None
+                self.keys[name] = self.held[name]
+
+    def report(self):
+        """Résume les délais entre les appuis et leur prise en compte.
+
+        Returns:
+            list[str]: Une ligne par touche appuyée : nombre d'appuis,
+                délai moyen et maximal en images et en millisecondes.
+        """
+        lines = []
+        for name, samples in self.latencies.items():
+            if not samples:
+                continue
+            frames = [sample[0] for sample in samples]
+            delays = [sample[1] for sample in samples]
+            lines.append(
+                f"{name} : {len(samples)} appuis, délai moyen "
+                f"{sum(frames) / len(frames):.2f} images "
+                f"({sum(delays) / len(delays) * 1000:.1f} ms), "
+                f"max {max(frames)} images ({max(delays) * 1000:.1f} ms)"
+            )
+        return lines
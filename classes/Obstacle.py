@@ -6,7 +6,13 @@ du jeu (rochers ou arbres). Un obstacle possède une position, une image,
 une rectangle de collision et une logique de déplacement vertical.
 
 Les obstacles apparaissent aléatoirement en bas de l'écran et se déplacent
-vers le haut à une vitesse donnée.
+vers le haut à une vitesse donnée. Le générateur aléatoire peut être fourni
+afin de rendre une partie reproductible.
+
+Les attributs sont déclarés dans __slots__ : un obstacle n'a pas de
+dictionnaire d'attributs, ce qui réduit sa taille en mémoire (les
+obstacles supplémentaires des niveaux élevés sont préalloués par
+ObstaclePool).
 """
 import random
 
@@ -25,9 +31,16 @@ class Obstacle:
         rect (pygame.Rect): Rectangle de collision.
         cleared (bool): Indique si l'obstacle a déjà été franchi.
         jump_allowed (bool): Indique si l'obstacle peut être sauté.
+        rng (random.Random): Générateur aléatoire des positions.
     """
 
-    def __init__(self, height, left_limit, right_limit, image, jump_allowed):
+    __slots__ = (
+        "rng", "image", "left_limit", "right_limit", "window_height",
+        "x", "y", "rect", "cleared", "jump_allowed"
+    )
+
+    def __init__(self, height, left_limit, right_limit, image, jump_allowed,
+                 rng=random):
         """Initialise un obstacle.
 
         Args:
@@ -37,19 +50,42 @@ class Obstacle:
             image (pygame.Surface): Image associée à l'obstacle.
             jump_allowed (bool): Indique si le joueur peut sauter
                 par-dessus cet obstacle.
+            rng (random.Random): Générateur aléatoire des positions.
+                Par défaut, le générateur global du module random.
         """
+        self.rng = rng
         self.image = image
         self.left_limit = left_limit + 50
         self.right_limit = right_limit - 50
         self.window_height = height
-        self.y = height + random.randint(0, height)
-        self.x = random.randint(self.left_limit, self.right_limit)
+        self.respawn()
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
         self.rect.width = self.image.get_width() - 20
         self.rect.height = self.image.get_height() - 20
-        self.cleared = False
         self.jump_allowed = jump_allowed
 
+    def respawn(self):
+        """Place l'obstacle sous le bas de l'écran, à une position aléatoire.
+
+        L'obstacle n'est plus marqué comme franchi.
+        """
+        self.cleared = False
+        self.y = self.window_height + self.rng.randint(0, self.window_height)
+        self.x = self.rng.randint(self.left_limit, self.right_limit)
+
+    def place(self, x, y):
+        """Place l'obstacle à une position donnée.
+
+        L'obstacle n'est plus marqué comme franchi.
+
+        Args:
+            x (float): Position horizontale.
+            y (float): Position verticale.
+        """
+        self.cleared = False
+        self.x = x
+        self.y = y
+
     def update_rect(self):
         """Met à jour la position du rectangle de collision de l'obstacle.
 
@@ -70,9 +106,13 @@ class Obstacle:
 
         Args:
             speed (int): Vitesse de déplacement vertical.
+
+        Returns:
+            bool: True si l'obstacle a été replacé en bas de l'écran.
         """
         self.y -= speed
         if self.y < -self.image.get_height():
-            self.cleared = False
-            self.y = self.window_height + random.randint(0, self.window_height)
-            self.x = random.randint(self.left_limit, self.right_limit)
+            self.respawn()
+            return True
+
+        return False
@@ -0,0 +1,156 @@
+"""
+Module obstacle_pool.
+
+Ce module définit la classe ObstaclePool, une réserve d'obstacles créés
+une fois pour toutes au début de la partie. Les obstacles sont pris dans
+la réserve lorsqu'ils entrent en jeu et y sont rendus lorsqu'ils en
+sortent, au lieu d'être créés puis détruits pendant la partie.
+
+Functions:
+    object_size: Taille en mémoire d'un objet et de ses attributs propres.
+"""
+import sys
+
+
+def object_size(obj):
+    """Calcule la taille en mémoire d'un objet.
+
+    La taille comprend le dictionnaire d'attributs de l'objet, s'il en a
+    un, mais pas les objets partagés qu'il référence (image, générateur
+    aléatoire).
+
+    Args:
+        obj (object): Objet mesuré.
+
+    Returns:
+        int: Taille en octets.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+class ObstaclePool:
+    """Réserve d'obstacles préalloués.
+
+    Attributes:
+        capacity (int): Nombre d'obstacles de la réserve.
+        members (tuple[Obstacle, ...]): Tous les obstacles de la réserve.
+        free (list[Obstacle]): Obstacles disponibles.
+        active (set[Obstacle]): Obstacles en jeu.
+        high_water (int): Plus grand nombre d'obstacles en jeu en même
+            temps.
+        acquired (int): Nombre d'obstacles pris dans la réserve.
+        released (int): Nombre d'obstacles rendus à la réserve.
+    """
+
+    def __init__(self, factory, capacity):
+        """Crée tous les obstacles de la réserve.
+
+        Args:
+            factory (Callable[[], Obstacle]): Crée un obstacle.
+            capacity (int): Nombre d'obstacles de la réserve.
+        """
+        self.capacity = capacity
+        self.free = [factory() for i in range(capacity)]
+        self.members = tuple(self.free)
+        self.active = set()
+        self.high_water = 0
+        self.acquired = 0
+        self.released = 0
+
+    def __len__(self):
+        """Retourne le nombre d'obstacles en jeu."""
+        return len(self.active)
+
+    def acquire(self, position=None):
+        """Prend un obstacle dans la réserve et le place.
+
+        Args:
+            position (tuple[float, float] | None): Position de l'obstacle à
+                l'écran. Par défaut, une position aléatoire sous l'écran.
+
+        Returns:
+            Obstacle | None: Obstacle prêt à entrer en jeu, ou None si la
+                réserve est vide.
+        """
+        if not self.free:
+            return None
+
+        obstacle = self.free.pop()
+        if position is None:
+            obstacle.respawn()
+        else:
+            obstacle.place(*position)
+        self.active.add(obstacle)
+        self.acquired += 1
+        self.high_water = max(self.high_water, len(self.active))
+        return obstacle
+
+    def release(self, obstacle):
+        """Rend un obstacle à la réserve.
+
+        Args:
+            obstacle (Obstacle): Obstacle pris avec acquire.
+
+        Raises:
+            KeyError: Si l'obstacle n'est pas en jeu.
+        """
+        self.active.remove(obstacle)
+        self.free.append(obstacle)
+        self.released += 1
+
+    def state(self):
+        """Retourne l'état de la réserve, pour un instantané de la partie.
+
+        Returns:
+            tuple: Obstacles disponibles, dans l'ordre où ils seront pris,
+                puis compteurs de la réserve.
+        """
+        return (tuple(self.free), self.high_water, self.acquired,
+                self.released)
+
+    def set_state(self, state):
+        """Rétablit l'état de la réserve.
+
+        Args:
+            state (tuple): État retourné par state.
+        """
+        free, self.high_water, self.acquired, self.released = state
+        self.free[:] = free
+        self.active = set(self.members).difference(free)
+
+    def __contains__(self, obstacle):
+        """Vérifie si un obstacle de la réserve est en jeu."""
+        return obstacle in self.active
+
+    def object_size(self):
+        """Calcule la taille en mémoire d'un obstacle de la réserve.
+
+        La taille comprend l'obstacle et son rectangle de collision.
+
+        Returns:
+            int: Taille en octets, ou 0 si la réserve est vide.
+        """
+        obstacles = self.free or list(self.active)
+        if not obstacles:
+            return 0
+        return object_size(obstacles[0]) + object_size(obstacles[0].rect)
+
+    def stats(self):
+        """Retourne les statistiques de la réserve.
+
+        Returns:
+            dict: Taille, obstacles en jeu, plus grand nombre d'obstacles
+                en jeu, obstacles pris et rendus, et taille d'un obstacle
+                (octets).
+        """
+        return {
+            "capacity": self.capacity,
+            "in_use": len(self.active),
+            "high_water": self.high_water,
+            "acquired": self.acquired,
+            "released": self.released,
+            "object_bytes": self.object_size()
+        }
@@ -13,8 +13,9 @@ ce qui facilite la séparation de la logique de jeu.
 
 Functions:
     add_points: Ajoute des points à un total existant.
+    jump_transform: Calcule l'angle et l'échelle du skieur durant le saut.
 """
-from utils.FunctionalProgramming import add_points
+from utils.FunctionalProgramming import add_points, jump_transform
 
 
 class Player:
@@ -176,12 +177,7 @@ class Player:
                 self.scale = 1.0
                 self.stop_points = False
             else:
-                if t < 0.5:
-                    self.scale = 1.0 + t * 2
-                    self.angle = t * 360
-                else:
-                    self.scale = 2.0 - (t - 0.5) * 2
-                    self.angle = (t - 0.5) * 360 + 180
+                self.angle, self.scale = jump_transform(t)
 
     def obstacle_cleared(self):
         """Ajoute des points lorsqu'un obstacle est évité."""
@@ -0,0 +1,68 @@
+"""
+Module random_policy.
+
+Ce module définit la classe RandomPolicy, une politique d'entrées
+aléatoires pour les parties simulées sans affichage (headless.py,
+batch.py). Les touches actives sont conservées d'une image à l'autre ou
+tirées de nouveau au hasard.
+
+Functions:
+    random_keys: Tire de nouvelles touches actives.
+"""
+import random
+from classes.Recording import KEY_NAMES
+
+
+def random_keys(rng, keys, hold):
+    """Tire de nouvelles touches actives selon une politique aléatoire.
+
+    Args:
+        rng (random.Random): Générateur aléatoire des entrées.
+        keys (dict): Touches actives, modifiées sur place.
+        hold (float): Probabilité de conserver les touches de l'image
+            précédente.
+    """
+    if rng.random() < hold:
+        return
+
+    direction = rng.choice(("left", "right", None))
+    keys["left"] = direction == "left"
+    keys["right"] = direction == "right"
+    keys["up"] = rng.random() < 0.1
+    keys["down"] = rng.random() < 0.3
+    keys["space"] = rng.random() < 0.05
+
+
+class RandomPolicy:
+    """Politique d'entrées aléatoires.
+
+    Attributes:
+        rng (random.Random): Générateur aléatoire des entrées.
+        hold (float): Probabilité de conserver les touches de l'image
+            précédente.
+        keys (dict): Touches actives.
+    """
+
+    def __init__(self, seed=None, hold=0.95):
+        """Initialise la politique.
+
+        Args:
+            seed (int | None): Graine des entrées.
+            hold (float): Probabilité de conserver les touches de l'image
+                précédente.
+        """
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.keys = dict.fromkeys(KEY_NAMES, False)
+
+    def __call__(self, simulation):
+        """Choisit les touches actives de la prochaine image.
+
+        Args:
+            simulation (Simulation): Partie en cours (non utilisée).
+
+        Returns:
+            dict: Touches actives.
+        """
+        random_keys(self.rng, self.keys, self.hold)
+        return self.keys
@@ -0,0 +1,256 @@
+"""
+Module recording.
+
+Ce module définit la classe Recording, l'enregistrement compact d'une
+session de jeu permettant de la rejouer à l'identique.
+
+La simulation est déterministe : une graine (pour les obstacles), le mode
+de placement des obstacles (piste construite par tronçons ou obstacles
+replacés au hasard), le test de collision (rectangles ou pixels) et la
+suite des touches actives à chaque pas de
+logique suffisent à reproduire la session. Chaque pas est enregistré sur
+un octet dont les six premiers bits sont les touches (gauche, droite,
+haut, bas, espace, entrée); l'octet RESTART marque un redémarrage après
+une fin de partie. La durée d'un pas est fixe (logique à pas fixe) et
+n'est enregistrée qu'une fois, dans l'en-tête, sous forme de fréquence de
+la logique.
+
+Format du fichier (petit-boutiste) :
+    - en-tête (struct HEADER) : signature, version, graine, fréquence de
+      la logique, nombre de pas, points, niveau et vies à la fin de la
+      session (pour vérifier la reprise), puis options (bit 0 : piste
+      construite par tronçons, bit 1 : collisions au pixel près);
+    - événements compressés avec zlib.
+
+Functions:
+    encode_keys: Code les touches actives sur un octet.
+    decode_keys: Décode un octet en dictionnaire de touches actives.
+"""
+import struct
+import zlib
+
+KEY_NAMES = ("left", "right", "up", "down", "space", "return")
+RESTART = 0x80
+MAGIC = b"SKIR"
+VERSION = 2
+HEADER = struct.Struct("<4sBqHIIHBB")
+COURSE = 0x01
+MASKS = 0x02
+
+
+def encode_keys(keys):
+    """Code les touches actives sur un octet.
+
+    Args:
+        keys (dict): Touches actives ("left", "right", "up", "down",
+            "space", "return").
+
+    Returns:
+        int: Masque des touches, un bit par touche de KEY_NAMES.
+    """
+    mask = 0
+    for bit, name in enumerate(KEY_NAMES):
+        if keys[name]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    """Décode un masque de touches.
+
+    Args:
+        mask (int): Masque produit par encode_keys.
+
+    Returns:
+        dict: Touches actives.
+    """
+    return {name: bool(mask & 1 << bit) for bit, name in enumerate(KEY_NAMES)}
+
+
+# Touches décodées de chaque masque, partagées par les reprises
+DECODED_KEYS = [decode_keys(mask) for mask in range(1 << len(KEY_NAMES))]
+
+
+class Recording:
+    """Enregistrement des entrées d'une session, rejouable à l'identique.
+
+    Attributes:
+        seed (int): Graine de la simulation.
+        logic_hz (int): Nombre de pas de logique par seconde.
+        course (bool): Les obstacles suivent une piste construite par
+            tronçons.
+        masks (bool): Les collisions sont testées au pixel près.
+        events (bytearray): Masque des touches de chaque pas, ou RESTART.
+        steps (int): Nombre de pas enregistrés.
+        points (int | None): Points à la fin de la session.
+        level (int | None): Niveau à la fin de la session.
+        lives (int | None): Vies à la fin de la session.
+        position (int): Prochain événement lu lors d'une reprise.
+    """
+
+    def __init__(self, seed, logic_hz=120, course=False, masks=False):
+        """Crée un enregistrement vide.
+
+        Args:
+            seed (int): Graine de la simulation.
+            logic_hz (int): Nombre de pas de logique par seconde.
+            course (bool): Les obstacles suivent une piste construite par
+                tronçons.
+            masks (bool): Les collisions sont testées au pixel près.
+        """
+        self.seed = seed
+        self.logic_hz = logic_hz
+        self.course = course
+        self.masks = masks
+        self.events = bytearray()
+        self.steps = 0
+        self.points = None
+        self.level = None
+        self.lives = None
+        self.position = 0
+
+    @property
+    def dt(self):
+        """float: Durée d'un pas de logique (secondes)."""
+        return 1 / self.logic_hz
+
+    def record_step(self, keys):
+        """Enregistre les touches actives d'un pas de logique.
+
+        Args:
+            keys (dict): Touches actives.
+        """
+        self.events.append(encode_keys(keys))
+        self.steps += 1
+
+    def record_restart(self):
+        """Enregistre un redémarrage après une fin de partie."""
+        self.events.append(RESTART)
+
+    def finish(self, simulation):
+        """Mémorise l'état final de la session.
+
+        Args:
+            simulation (Simulation): Simulation enregistrée.
+        """
+        self.points = simulation.player.points
+        self.level = simulation.rules.level
+        self.lives = simulation.player.lives
+
+    def matches(self, simulation):
+        """Vérifie qu'une reprise se termine dans l'état enregistré.
+
+        Args:
+            simulation (Simulation): Simulation rejouée.
+
+        Returns:
+            bool: True si les points, le niveau et les vies sont identiques.
+        """
+        return (
+            simulation.player.points == self.points
+            and simulation.rules.level == self.level
+            and simulation.player.lives == self.lives
+        )
+
+    def save(self, path):
+        """Écrit l'enregistrement dans un fichier binaire.
+
+        Args:
+            path (str): Chemin du fichier.
+        """
+        header = HEADER.pack(
+            MAGIC, VERSION, self.seed, self.logic_hz, self.steps,
+            self.points or 0, self.level or 0, self.lives or 0,
+            (COURSE if self.course else 0) | (MASKS if self.masks else 0)
+        )
+        with open(path, "wb") as file:
+            file.write(header)
+            file.write(zlib.compress(bytes(self.events), 9))
+
+    @classmethod
+    def load(cls, path):
+        """Lit un enregistrement.
+
+        Args:
+            path (str): Chemin du fichier.
+
+        Returns:
+            Recording: Enregistrement prêt à être rejoué.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un enregistrement valide.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        try:
+            (magic, version, seed, logic_hz, steps,
+             points, level, lives, options) = HEADER.unpack_from(data)
+            events = zlib.decompress(data[HEADER.size:])
+        except (struct.error, zlib.error) as error:
+            raise ValueError(f"enregistrement invalide : {path}") from error
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"enregistrement invalide : {path}")
+
+        recording = cls(
+            seed, logic_hz, bool(options & COURSE), bool(options & MASKS))
+        recording.events = bytearray(events)
+        recording.steps = steps
+        recording.points = points
+        recording.level = level
+        recording.lives = lives
+        return recording
+
+    def restart_next(self):
+        """Consomme le prochain événement s'il s'agit d'un redémarrage.
+
+        Returns:
+            bool: True si la partie doit redémarrer.
+        """
+        if (
+            self.position < len(self.events)
+            and self.events[self.position] == RESTART
+        ):
+            self.position += 1
+            return True
+        return False
+
+    def next_keys(self):
+        """Consomme les touches du prochain pas de logique.
+
+        Returns:
+            dict | None: Touches actives, ou None à la fin de
+                l'enregistrement ou avant un redémarrage.
+        """
+        if self.finished or self.events[self.position] == RESTART:
+            return None
+
+        mask = self.events[self.position]
+        self.position += 1
+        return DECODED_KEYS[mask]
+
+    @property
+    def finished(self):
+        """bool: True si tous les événements ont été rejoués."""
+        return self.position >= len(self.events)
+
+    def play(self, simulation):
+        """Rejoue tout l'enregistrement, aussi vite que possible.
+
+        Args:
+            simulation (Simulation): Simulation créée avec la graine et le
+                mode de placement des obstacles de l'enregistrement.
+
+        Returns:
+            Simulation: La simulation, dans l'état final de la session.
+        """
+        dt = self.dt
+        step = simulation.step
+        for event in self.events[self.position:]:
+            if event == RESTART:
+                simulation.restart(dt)
+            else:
+                step(DECODED_KEYS[event], dt)
+        self.position = len(self.events)
+        return simulation
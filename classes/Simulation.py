@@ -0,0 +1,463 @@
+"""
+Module simulation.
+
+Ce module définit la classe Simulation, le cœur du jeu sans pygame.
+Elle possède le joueur, les obstacles et les règles (collisions, points,
+niveaux) et avance la partie d'une image à la fois à partir d'un
+enregistrement des touches pressées.
+
+La simulation ne touche jamais à pygame : l'affichage, les sons et la
+lecture du clavier restent dans la boucle principale (main.py). Elle peut
+donc s'exécuter sans affichage et plus vite que le temps réel.
+
+Un instantané (snapshot) de la partie est une liste plate de valeurs :
+un en-tête (compteurs, niveau, vitesse, défilement, état du générateur
+aléatoire, des réserves et de la piste, état du joueur), puis
+OBSTACLE_FIELDS valeurs par obstacle en jeu. Les objets (obstacles,
+images) sont référencés et non copiés : un instantané ne se rétablit que
+dans la simulation qui l'a pris, et sa taille ne dépend que du nombre
+d'obstacles en jeu.
+
+Classes:
+    GameRules: Règles du jeu indépendantes de pygame.
+    Player: Joueur.
+    Obstacle: Rochers et arbres.
+    HeadlessSprite: Image sans pixels pour la simulation sans affichage.
+    SpatialIndex: Phase large de la détection des collisions.
+    ObstaclePool: Réserve d'obstacles préalloués.
+    SpawnScheduler: Densité des obstacles selon le niveau.
+    CourseScheduler: Obstacles placés selon une piste construite par
+        tronçons (CourseGenerator, CourseStream).
+"""
+import random
+import time
+from operator import attrgetter
+from classes.GameRules import GameRules
+from classes.Player import Player
+from classes.Obstacle import Obstacle
+from classes.HeadlessSprite import HeadlessSprite
+from classes.SpatialIndex import SpatialIndex
+from classes.ObstaclePool import ObstaclePool
+from classes.SpawnScheduler import SpawnScheduler
+from classes.CourseGenerator import CourseGenerator
+from classes.CourseStream import CourseStream
+from classes.CourseScheduler import CourseScheduler
+
+# Nombre maximal de tronçons de piste dont des obstacles sont en jeu
+COURSE_CHUNKS_ALIVE = 3
+
+# Attributs du joueur conservés dans un instantané de la partie
+PLAYER_STATE = (
+    "x", "y", "dx", "mx", "image", "lives", "points",
+    "invincible", "invincible_time", "stop_points", "stop_points_time",
+    "jumping", "jump_time", "jump_x", "angle", "scale"
+)
+get_player_state = attrgetter(*PLAYER_STATE)
+
+# Valeurs de l'en-tête d'un instantané, puis de chaque obstacle en jeu
+SNAPSHOT_HEADER = 14
+OBSTACLE_FIELDS = 8
+
+
+class Simulation:
+    """Simule la partie image par image, sans pygame.
+
+    Attributes:
+        width (int): Largeur de la zone de jeu.
+        height (int): Hauteur de la zone de jeu.
+        left_limit (int): Limite horizontale gauche de la piste.
+        right_limit (int): Limite horizontale droite de la piste.
+        rules (GameRules): Règles du jeu; reçoit aussi les événements.
+        rng (random.Random): Générateur aléatoire de la partie.
+        player (Player): Joueur.
+        obstacles (list[Obstacle]): Obstacles en jeu : rochers et arbres
+            de départ, puis obstacles ajoutés selon le niveau.
+        scheduler (SpawnScheduler): Ajoute des obstacles préalloués à
+            mesure que le niveau augmente, ou selon la piste.
+        course (CourseStream | None): Tronçons de la piste construits en
+            arrière-plan, si les obstacles suivent une piste.
+        distance (float): Distance parcourue sur la piste.
+        index (SpatialIndex): Obstacles répartis par cellules de la piste.
+        previous_player (tuple[float, float]): Position du joueur avant
+            la dernière image simulée.
+        previous_obstacles (list[tuple[float, float]]): Positions des
+            obstacles avant la dernière image simulée.
+        frame (int): Nombre d'images simulées.
+        hits (int): Nombre d'obstacles touchés.
+        jumps (int): Nombre d'obstacles sautés.
+        clears (int): Nombre d'obstacles franchis avec points.
+        profiler (FrameProfiler | None): Profileur qui mesure la mise à
+            jour du joueur et la boucle des obstacles.
+    """
+
+    def __init__(self, width, height, left_limit, right_limit,
+                 skier_left, skier_right, rock, tree,
+                 rules=None, rocks=3, trees=4, seed=None,
+                 extra_per_level=1, pool_capacity=10, course=False):
+        """Crée le joueur et les obstacles.
+
+        Args:
+            width (int): Largeur de la zone de jeu.
+            height (int): Hauteur de la zone de jeu.
+            left_limit (int): Limite horizontale gauche de la piste.
+            right_limit (int): Limite horizontale droite de la piste.
+            skier_left (Surface): Image du skieur orientée vers la gauche.
+            skier_right (Surface): Image du skieur orientée vers la droite.
+            rock (Surface): Image des rochers.
+            tree (Surface): Image des arbres.
+            rules (GameRules | None): Règles du jeu. Une instance de Game
+                permet de jouer les sons; par défaut, des règles muettes.
+            rocks (int): Nombre de rochers.
+            trees (int): Nombre d'arbres.
+            seed (int | None): Graine du générateur aléatoire.
+            extra_per_level (int): Rochers et arbres ajoutés à chaque
+                niveau au-delà du premier.
+            pool_capacity (int): Nombre maximal de rochers et d'arbres
+                ajoutés, préalloués au début de la partie.
+            course (bool): Place les obstacles selon une piste construite
+                par tronçons, avec un passage garanti, au lieu de les
+                replacer au hasard. Les nombres de rochers et d'arbres
+                sont alors ceux de chaque tronçon; close() arrête la
+                construction de la piste.
+        """
+        self.width = width
+        self.height = height
+        self.left_limit = left_limit
+        self.right_limit = right_limit
+        self.rules = rules if rules is not None else GameRules()
+        self.rng = random.Random(seed)
+
+        self.player = Player(
+            width, height, left_limit, right_limit, skier_left, skier_right
+        )
+
+        def rock_factory():
+            return Obstacle(height, left_limit, right_limit, rock, True,
+                            self.rng)
+
+        def tree_factory():
+            return Obstacle(height, left_limit, right_limit, tree, False,
+                            self.rng)
+
+        if course:
+            # Tous les obstacles viennent des réserves, selon la piste.
+            # Un tronçon de deux écrans garde la densité des obstacles
+            # replacés au hasard sur un à deux écrans sous la fenêtre.
+            generator = CourseGenerator(
+                left_limit,
+                right_limit,
+                height,
+                {True: (rock.get_width(), rock.get_height()),
+                 False: (tree.get_width(), tree.get_height())},
+                player_size=(self.player.rect.width,
+                             self.player.rect.height),
+                chunk_height=2 * height,
+                rocks=rocks,
+                trees=trees,
+                extra_per_level=extra_per_level,
+                max_extra=pool_capacity,
+                seed=self.rng.getrandbits(63)
+            )
+            self.course = CourseStream(generator)
+            self.obstacles = []
+            self.scheduler = CourseScheduler(
+                {
+                    "rochers": ObstaclePool(
+                        rock_factory,
+                        COURSE_CHUNKS_ALIVE * (rocks + pool_capacity)
+                    ),
+                    "arbres": ObstaclePool(
+                        tree_factory,
+                        COURSE_CHUNKS_ALIVE * (trees + pool_capacity)
+                    )
+                },
+                self.course,
+                2 * height
+            )
+        else:
+            self.course = None
+            self.obstacles = [rock_factory() for i in range(rocks)]
+            self.obstacles += [tree_factory() for i in range(trees)]
+
+            # Obstacles des niveaux élevés, créés une seule fois
+            self.scheduler = SpawnScheduler(
+                {
+                    "rochers": ObstaclePool(rock_factory, pool_capacity),
+                    "arbres": ObstaclePool(tree_factory, pool_capacity)
+                },
+                extra_per_level
+            )
+
+        self.index = SpatialIndex()
+        for obs in self.obstacles:
+            self.index.insert(obs)
+
+        # États précédents, pour l'interpolation de l'affichage
+        self.previous_player = (self.player.x, self.player.y)
+        self.previous_obstacles = [(obs.x, obs.y) for obs in self.obstacles]
+
+        self.distance = 0.0
+        self.frame = 0
+        self.hits = 0
+        self.jumps = 0
+        self.clears = 0
+        self.profiler = None
+        self.update_density([])
+
+    @classmethod
+    def headless(cls, width=1400, height=750, spacing=50, **kwargs):
+        """Crée une simulation sans images, aux dimensions du jeu.
+
+        Les limites de la piste et la taille des images reprennent celles
+        de Window et de VisualAssetManager.
+
+        Args:
+            width (int): Largeur de la zone de jeu.
+            height (int): Hauteur de la zone de jeu.
+            spacing (int): Espacement des arbres en bordure de piste.
+            **kwargs: Autres arguments de Simulation (rules, seed, ...).
+
+        Returns:
+            Simulation: Simulation prête à être exécutée.
+        """
+        skier = HeadlessSprite(100, 100)
+        return cls(
+            width,
+            height,
+            2 * spacing,
+            width - 4 * spacing,
+            skier,
+            skier,
+            HeadlessSprite(90, 60),
+            HeadlessSprite(70, 70),
+            **kwargs
+        )
+
+    @property
+    def game_over(self):
+        """bool: True si le joueur n'a plus de vies."""
+        return self.player.lives == 0
+
+    def step(self, keys, dt):
+        """Avance la partie d'une image.
+
+        Args:
+            keys (dict): Touches actives ("left", "right", "up", "down",
+                "space", "return").
+            dt (float): Temps écoulé depuis l'image précédente (secondes).
+        """
+        rules = self.rules
+        player = self.player
+        previous = self.previous_obstacles
+
+        rules.update_level(player.points)
+        self.previous_player = (player.x, player.y)
+
+        # Mettre à jour le joueur selon les entrées et sa position
+        player.input(keys)
+        player.update_state(dt)
+        if self.profiler is not None:
+            self.profiler.mark("player")
+
+        # Phase large : seuls les obstacles proches du joueur sont testés
+        # en détail. Pour les autres, seule la sortie de piste compte.
+        rect = player.rect
+        candidates = self.index.query(
+            rect.x, rect.y, rect.x + rect.width, rect.y + rect.height)
+        outside = rules.check_side_limits(self, player)
+
+        # Mettre à jour les obstacles
+        retired = []
+        respawned = []
+        for i, obs in enumerate(self.obstacles):
+            previous[i] = (obs.x, obs.y)
+
+            if obs in candidates:
+                obs.update_rect()
+                collision = rules.check_collision(self, player, obs)
+            elif outside and not player.invincible:
+                collision = "hit"
+            else:
+                collision = False
+
+            # L'instant de chaque événement sert à mesurer la latence des
+            # sons joués par les règles
+            if collision == "jumped":
+                event_time = time.perf_counter()
+                player.obstacle_jumped()
+                rules.obstacle_jumped(event_time)
+                self.jumps += 1
+
+            elif collision == "hit":
+                event_time = time.perf_counter()
+                player.obstacle_hit()
+                rules.obstacle_hit(player.lives, event_time)
+                self.hits += 1
+
+            if rules.check_obstacle_cleared(player.y, obs.y, obs.cleared):
+                obs.set_cleared()
+                if not player.invincible:
+                    event_time = time.perf_counter()
+                    player.obstacle_cleared()
+                    rules.obstacle_cleared(event_time)
+                    self.clears += 1
+
+            if obs.update_position(rules.speed):
+                if self.scheduler.retire(obs, rules.level):
+                    retired.append(i)
+                else:
+                    respawned.append(obs)
+
+        # Les obstacles replacés sont rangés selon le défilement de ce pas
+        self.index.scroll_by(rules.speed)
+        for obs in respawned:
+            self.index.move(obs)
+        self.distance += rules.speed
+        if retired or self.scheduler.due(rules.level, self.distance):
+            self.update_density(retired)
+        self.frame += 1
+        if self.profiler is not None:
+            self.profiler.mark("obstacles")
+
+    def update_density(self, retired):
+        """Retire les obstacles rendus à leur réserve et ajoute ceux qui
+        manquent au niveau.
+
+        Args:
+            retired (list[int]): Indices des obstacles rendus à leur
+                réserve, dans l'ordre croissant.
+        """
+        for i in reversed(retired):
+            self.index.remove(self.obstacles[i])
+            del self.obstacles[i]
+            del self.previous_obstacles[i]
+
+        spawned = self.scheduler.spawn(self.rules.level, self.distance)
+        for obs in spawned:
+            self.index.insert(obs)
+            self.obstacles.append(obs)
+            self.previous_obstacles.append((obs.x, obs.y))
+
+    def close(self):
+        """Arrête la construction de la piste en arrière-plan."""
+        if self.course is not None:
+            self.course.close()
+
+    def snapshot(self):
+        """Prend un instantané de la partie.
+
+        Returns:
+            list: Instantané à rétablir avec restore.
+        """
+        player = self.player
+        rules = self.rules
+        index = self.index
+        snapshot = [
+            self.frame, self.hits, self.jumps, self.clears, self.distance,
+            rules.level, rules.speed, index.scroll, self.previous_player,
+            self.rng.getstate(), self.scheduler.state(),
+            get_player_state(player), player.rect.x, player.rect.y
+        ]
+        cells = index.cells
+        for obs, previous in zip(self.obstacles, self.previous_obstacles):
+            rect = obs.rect
+            snapshot += (obs, obs.x, obs.y, obs.cleared, rect.x, rect.y,
+                         cells[obs], previous)
+        return snapshot
+
+    def restore(self, snapshot):
+        """Rétablit la partie dans l'état d'un instantané.
+
+        Un même instantané peut être rétabli plusieurs fois, par exemple
+        pour explorer plusieurs suites de touches depuis le même état.
+
+        Args:
+            snapshot (list): Instantané pris par snapshot dans cette
+                simulation.
+
+        Raises:
+            ValueError: Si les tronçons de la piste consommés depuis
+                l'instantané ne sont plus conservés.
+        """
+        player = self.player
+        rules = self.rules
+        (frame, hits, jumps, clears, distance, level, speed, scroll,
+         previous_player, rng_state, scheduler_state, player_state,
+         rect_x, rect_y) = snapshot[:SNAPSHOT_HEADER]
+
+        # Seul l'état de la piste peut être refusé : il est rétabli en
+        # premier pour laisser la partie intacte en cas d'erreur
+        self.scheduler.set_state(scheduler_state)
+        self.frame = frame
+        self.hits = hits
+        self.jumps = jumps
+        self.clears = clears
+        self.distance = distance
+        rules.level = level
+        rules.speed = speed
+        self.previous_player = previous_player
+        self.rng.setstate(rng_state)
+        for name, value in zip(PLAYER_STATE, player_state):
+            setattr(player, name, value)
+        player.rect.x = rect_x
+        player.rect.y = rect_y
+
+        obstacles = self.obstacles
+        previous = self.previous_obstacles
+        obstacles.clear()
+        previous.clear()
+        cells = []
+        for i in range(SNAPSHOT_HEADER, len(snapshot), OBSTACLE_FIELDS):
+            (obs, obs.x, obs.y, obs.cleared, x, y, cell,
+             previous_position) = snapshot[i:i + OBSTACLE_FIELDS]
+            obs.rect.x = x
+            obs.rect.y = y
+            obstacles.append(obs)
+            previous.append(previous_position)
+            cells.append((obs, cell))
+        self.index.restore(scroll, cells)
+
+    def restart(self, dt):
+        """Redémarre la partie après une fin de partie.
+
+        Args:
+            dt (float): Temps écoulé depuis l'image précédente (secondes).
+        """
+        self.player.reset()
+        self.rules.update_level(self.player.points)
+        self.player.update_state(dt)
+        self.previous_player = (self.player.x, self.player.y)
+
+    def interpolated_player(self, alpha):
+        """Calcule la position affichée du joueur entre deux images.
+
+        Args:
+            alpha (float): Fraction écoulée entre l'état précédent (0)
+                et l'état courant (1).
+
+        Returns:
+            tuple[float, float]: Position interpolée du joueur.
+        """
+        x, y = self.previous_player
+        return (
+            x + (self.player.x - x) * alpha,
+            y + (self.player.y - y) * alpha
+        )
+
+    def interpolated_obstacles(self, alpha):
+        """Calcule les positions affichées des obstacles entre deux images.
+
+        Un obstacle replacé en bas de l'écran n'est pas interpolé.
+
+        Args:
+            alpha (float): Fraction écoulée entre l'état précédent (0)
+                et l'état courant (1).
+
+        Yields:
+            tuple[Obstacle, float, float]: Obstacle et position interpolée.
+        """
+        for obs, (x, y) in zip(self.obstacles, self.previous_obstacles):
+            if obs.y > y:
+                yield obs, obs.x, obs.y
+            else:
+                yield obs, obs.x, y + (obs.y - y) * alpha
@@ -0,0 +1,80 @@
+"""
+Module sound_cache.
+
+Ce module définit la classe SoundCache, un cache sur disque des effets
+sonores déjà décodés. Chaque entrée contient les échantillons PCM bruts
+du son au format du mélangeur (fréquence, taille d'échantillon, nombre de
+canaux), chargés directement avec pygame.mixer.Sound(buffer=...) sans
+décodage MP3 ni rééchantillonnage.
+
+Le format du mélangeur fait partie de la clé : changer la fréquence ou
+le nombre de canaux donne de nouvelles entrées.
+
+Classes:
+    DiskCache: Nommage, invalidation et écriture des entrées du cache.
+"""
+import pygame
+from classes.DiskCache import DiskCache
+
+
+class SoundCache(DiskCache):
+    """Cache sur disque des échantillons PCM des effets sonores."""
+
+    extension = ".pcm"
+
+    def __init__(self, directory=".cache/sounds"):
+        """Initialise le cache.
+
+        Args:
+            directory (str): Dossier des entrées du cache.
+        """
+        super().__init__(directory)
+
+    def tag(self, mixer_format):
+        """Décrit le format du mélangeur.
+
+        Args:
+            mixer_format (tuple[int, int, int]): Fréquence, format des
+                échantillons et nombre de canaux (pygame.mixer.get_init).
+
+        Returns:
+            str: Format, par exemple "44100-s16-2".
+        """
+        frequency, size, channels = mixer_format
+        sign = "s" if size < 0 else "u"
+        return f"{frequency}-{sign}{abs(size)}-{channels}"
+
+    def get(self, path):
+        """Lit un son décodé dans le cache.
+
+        Args:
+            path (str): Chemin du fichier audio source.
+
+        Returns:
+            pygame.mixer.Sound | None: Son, ou None si l'entrée est
+                absente ou invalide.
+
+        Raises:
+            FileNotFoundError: Si le fichier audio n'existe pas.
+        """
+        mixer_format = pygame.mixer.get_init()
+        frequency, size, channels = mixer_format
+        frame_size = abs(size) // 8 * channels
+        data = self.read(path, mixer_format)
+
+        if not data or len(data) % frame_size:
+            # Entrée absente ou tronquée : elle sera réécrite
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pygame.mixer.Sound(buffer=data)
+
+    def put(self, path, sound):
+        """Écrit un son décodé dans le cache.
+
+        Args:
+            path (str): Chemin du fichier audio source.
+            sound (pygame.mixer.Sound): Son décodé.
+        """
+        self.write(path, pygame.mixer.get_init(), sound.get_raw())
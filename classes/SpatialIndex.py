@@ -0,0 +1,171 @@
+"""
+Module spatial_index.
+
+Ce module définit la classe SpatialIndex, une phase large (broad phase)
+pour la détection des collisions. Les obstacles sont répartis dans une
+grille de cellules (bandes verticales découpées en colonnes) afin que
+seuls ceux proches du joueur soient testés en détail par
+GameRules.check_collision.
+
+Les bandes sont exprimées dans les coordonnées de la piste : tous les
+obstacles défilent à la même vitesse, si bien qu'un défilement ne change
+que le décalage global de l'index. Les obstacles ne se déplacent pas
+horizontalement. Seul un obstacle replacé en bas de l'écran doit donc
+changer de cellule.
+"""
+
+
+class SpatialIndex:
+    """Index des obstacles par cellules de la piste.
+
+    Attributes:
+        cell_size (int): Hauteur d'une bande et largeur d'une colonne,
+            en pixels.
+        scroll (float): Distance totale de défilement de la piste.
+        buckets (dict[tuple[int, int], set]): Obstacles de chaque cellule.
+        cells (dict): Cellule de chaque obstacle.
+        max_width (int): Largeur de la plus grande image indexée.
+        max_height (int): Hauteur de la plus grande image indexée.
+        candidates (int): Nombre de candidats retournés à la dernière
+            requête.
+        total_candidates (int): Nombre total de candidats retournés.
+        queries (int): Nombre de requêtes effectuées.
+    """
+
+    def __init__(self, cell_size=100):
+        """Initialise un index vide.
+
+        Args:
+            cell_size (int): Hauteur d'une bande et largeur d'une colonne,
+                en pixels.
+        """
+        self.cell_size = cell_size
+        self.scroll = 0.0
+        self.buckets = {}
+        self.cells = {}
+        self.max_width = 0
+        self.max_height = 0
+        self.candidates = 0
+        self.total_candidates = 0
+        self.queries = 0
+
+    def cell(self, x, y):
+        """Calcule la cellule d'une position à l'écran.
+
+        Args:
+            x (float): Position horizontale.
+            y (float): Position verticale à l'écran.
+
+        Returns:
+            tuple[int, int]: Bande (dans les coordonnées de la piste) et
+                colonne.
+        """
+        return (
+            int((y + self.scroll) // self.cell_size),
+            int(x // self.cell_size)
+        )
+
+    def insert(self, obstacle):
+        """Ajoute un obstacle à l'index.
+
+        Args:
+            obstacle (Obstacle): Obstacle à indexer.
+        """
+        cell = self.cell(obstacle.x, obstacle.y)
+        self.cells[obstacle] = cell
+        self.buckets.setdefault(cell, set()).add(obstacle)
+        self.max_width = max(self.max_width, obstacle.image.get_width())
+        self.max_height = max(self.max_height, obstacle.image.get_height())
+
+    def remove(self, obstacle):
+        """Retire un obstacle de l'index.
+
+        Args:
+            obstacle (Obstacle): Obstacle à retirer.
+        """
+        cell = self.cells.pop(obstacle)
+        bucket = self.buckets[cell]
+        bucket.discard(obstacle)
+        if not bucket:
+            del self.buckets[cell]
+
+    def move(self, obstacle):
+        """Met à jour la cellule d'un obstacle replacé.
+
+        Args:
+            obstacle (Obstacle): Obstacle dont la position a changé
+                autrement que par le défilement.
+        """
+        if self.cells.get(obstacle) != self.cell(obstacle.x, obstacle.y):
+            self.remove(obstacle)
+            self.insert(obstacle)
+
+    def restore(self, scroll, cells):
+        """Rétablit le défilement et les cellules des obstacles.
+
+        Args:
+            scroll (float): Distance totale de défilement de la piste.
+            cells (Iterable[tuple[Obstacle, tuple[int, int]]]): Obstacles
+                indexés et leur cellule.
+        """
+        self.scroll = scroll
+        self.cells.clear()
+        self.buckets.clear()
+        for obstacle, cell in cells:
+            self.cells[obstacle] = cell
+            self.buckets.setdefault(cell, set()).add(obstacle)
+
+    def scroll_by(self, distance):
+        """Fait défiler tous les obstacles vers le haut.
+
+        Args:
+            distance (float): Distance parcourue par les obstacles.
+        """
+        self.scroll += distance
+
+    def query(self, left, top, right, bottom):
+        """Retourne les obstacles qui peuvent toucher une zone de l'écran.
+
+        La zone est élargie vers le haut et vers la gauche de la taille du
+        plus grand obstacle, puis d'un pixel de chaque côté pour absorber
+        l'arrondi des positions.
+
+        Args:
+            left (float): Gauche de la zone.
+            top (float): Haut de la zone à l'écran.
+            right (float): Droite de la zone.
+            bottom (float): Bas de la zone à l'écran.
+
+        Returns:
+            set: Obstacles candidats.
+        """
+        first_band, first_column = self.cell(
+            left - self.max_width - 1, top - self.max_height - 1)
+        last_band, last_column = self.cell(right + 1, bottom + 1)
+        candidates = set()
+
+        num_cells = (
+            (last_band - first_band + 1) * (last_column - first_column + 1)
+        )
+        if num_cells < len(self.buckets):
+            for band in range(first_band, last_band + 1):
+                for column in range(first_column, last_column + 1):
+                    bucket = self.buckets.get((band, column))
+                    if bucket:
+                        candidates |= bucket
+        else:
+            for (band, column), bucket in self.buckets.items():
+                if (
+                    first_band <= band <= last_band
+                    and first_column <= column <= last_column
+                ):
+                    candidates |= bucket
+
+        self.candidates = len(candidates)
+        self.total_candidates += self.candidates
+        self.queries += 1
+        return candidates
+
+    def __len__(self):
+        """Retourne le nombre d'obstacles indexés."""
+        return len(self.cells)
@@ -0,0 +1,133 @@
+"""
+Module spawn_scheduler.
+
+Ce module définit la classe SpawnScheduler, qui fait croître la densité
+des obstacles avec le niveau. À chaque niveau, des obstacles
+supplémentaires sont pris dans des réserves (ObstaclePool); lorsque le
+niveau baisse (nouvelle partie), les obstacles en trop sont rendus à leur
+réserve à mesure qu'ils sortent de l'écran par le haut.
+
+Les obstacles de départ de la partie ne viennent pas des réserves et ne
+sont jamais retirés.
+"""
+
+
+class SpawnScheduler:
+    """Ajoute et retire des obstacles de réserves selon le niveau.
+
+    Attributes:
+        pools (dict[str, ObstaclePool]): Réserve de chaque type d'obstacle.
+        per_level (int): Obstacles supplémentaires de chaque type par
+            niveau au-delà du premier.
+        level (int): Niveau pour lequel les obstacles ont été ajoutés en
+            dernier.
+    """
+
+    def __init__(self, pools, per_level=1):
+        """Initialise le planificateur.
+
+        Args:
+            pools (dict[str, ObstaclePool]): Réserve de chaque type
+                d'obstacle.
+            per_level (int): Obstacles supplémentaires de chaque type par
+                niveau au-delà du premier.
+        """
+        self.pools = pools
+        self.per_level = per_level
+        self.level = 1
+
+    def target(self, pool, level):
+        """Calcule le nombre d'obstacles d'une réserve en jeu à un niveau.
+
+        Args:
+            pool (ObstaclePool): Réserve.
+            level (int): Niveau du jeu.
+
+        Returns:
+            int: Nombre d'obstacles, borné par la taille de la réserve.
+        """
+        return min(pool.capacity, (level - 1) * self.per_level)
+
+    def due(self, level, distance):
+        """Indique si des obstacles peuvent manquer.
+
+        Args:
+            level (int): Niveau du jeu.
+            distance (float): Distance parcourue sur la piste.
+
+        Returns:
+            bool: True si le niveau a changé depuis le dernier ajout.
+        """
+        return level != self.level
+
+    def spawn(self, level, distance):
+        """Prend dans les réserves les obstacles qui manquent au niveau.
+
+        Args:
+            level (int): Niveau du jeu.
+            distance (float): Distance parcourue sur la piste.
+
+        Returns:
+            list[Obstacle]: Obstacles entrés en jeu, placés sous l'écran.
+        """
+        self.level = level
+        spawned = []
+        for pool in self.pools.values():
+            for i in range(self.target(pool, level) - len(pool)):
+                spawned.append(pool.acquire())
+        return spawned
+
+    def retire(self, obstacle, level):
+        """Rend un obstacle sorti de l'écran s'il est en trop au niveau.
+
+        Args:
+            obstacle (Obstacle): Obstacle sorti de l'écran par le haut.
+            level (int): Niveau du jeu.
+
+        Returns:
+            bool: True si l'obstacle a été rendu à sa réserve.
+        """
+        for pool in self.pools.values():
+            if obstacle in pool:
+                if len(pool) > self.target(pool, level):
+                    pool.release(obstacle)
+                    return True
+                return False
+        return False
+
+    def state(self):
+        """Retourne l'état du planificateur et de ses réserves.
+
+        Returns:
+            tuple: Niveau, puis état de chaque réserve.
+        """
+        return (self.level,) + tuple(
+            pool.state() for pool in self.pools.values())
+
+    def set_state(self, state):
+        """Rétablit l'état du planificateur et de ses réserves.
+
+        Args:
+            state (tuple): État retourné par state.
+        """
+        self.level = state[0]
+        for pool, pool_state in zip(self.pools.values(), state[1:]):
+            pool.set_state(pool_state)
+
+    def report(self):
+        """Résume l'utilisation des réserves.
+
+        Returns:
+            list[str]: Une ligne par réserve.
+        """
+        lines = []
+        for name, pool in self.pools.items():
+            stats = pool.stats()
+            lines.append(
+                f"Réserve {name} : {stats['capacity']} obstacles, "
+                f"{stats['in_use']} en jeu, "
+                f"au plus {stats['high_water']} en même temps, "
+                f"{stats['acquired']} pris, {stats['released']} rendus, "
+                f"{stats['object_bytes']} octets par obstacle"
+            )
+        return lines
@@ -0,0 +1,78 @@
+"""
+Module sprite_cache.
+
+Ce module définit la classe SpriteCache, un cache sur disque des images
+déjà décodées et redimensionnées. Chaque entrée contient les pixels RGBA
+bruts de l'image finale, chargés directement avec pygame.image.frombytes
+sans décodage PNG ni redimensionnement.
+
+Classes:
+    DiskCache: Nommage, invalidation et écriture des entrées du cache.
+"""
+import pygame
+from classes.DiskCache import DiskCache
+
+
+class SpriteCache(DiskCache):
+    """Cache sur disque des pixels d'images redimensionnées."""
+
+    extension = ".rgba"
+
+    def __init__(self, directory=".cache/sprites"):
+        """Initialise le cache.
+
+        Args:
+            directory (str): Dossier des entrées du cache.
+        """
+        super().__init__(directory)
+
+    def tag(self, size):
+        """Décrit la taille de l'image finale.
+
+        Args:
+            size (tuple[int, int]): Taille de l'image finale.
+
+        Returns:
+            str: Largeur et hauteur, par exemple "200x200".
+        """
+        return f"{size[0]}x{size[1]}"
+
+    def get(self, path, size):
+        """Lit une image redimensionnée dans le cache.
+
+        Args:
+            path (str): Chemin de l'image source.
+            size (tuple[int, int]): Taille de l'image finale.
+
+        Returns:
+            pygame.Surface | None: Image RGBA non convertie, ou None si
+                l'entrée est absente ou invalide.
+
+        Raises:
+            FileNotFoundError: Si l'image source n'existe pas.
+        """
+        data = self.read(path, size)
+        image = None
+
+        if data is not None:
+            try:
+                image = pygame.image.frombytes(data, size, "RGBA")
+            except ValueError:
+                # Entrée tronquée : elle sera réécrite
+                image = None
+
+        if image is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return image
+
+    def put(self, path, size, image):
+        """Écrit une image redimensionnée dans le cache.
+
+        Args:
+            path (str): Chemin de l'image source.
+            size (tuple[int, int]): Taille de l'image finale.
+            image (pygame.Surface): Image redimensionnée.
+        """
+        self.write(path, size, pygame.image.tobytes(image, "RGBA"))
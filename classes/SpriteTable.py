@@ -0,0 +1,106 @@
+"""
+Module sprite_table.
+
+Ce module définit la classe SpriteTable, une table d'images précalculées
+de l'animation de saut du skieur. Au lieu d'appeler
+pygame.transform.rotozoom à chaque image, les rotations et mises à
+l'échelle sont calculées une seule fois par angle quantifié, en suivant
+la courbe de Player.update_jump.
+
+Functions:
+    jump_transform: Calcule l'angle et l'échelle du skieur durant le saut.
+"""
+import math
+import pygame
+from utils.FunctionalProgramming import jump_transform
+
+
+class SpriteTable:
+    """Table mémorisée des images de saut, indexée par angle quantifié.
+
+    Le pas de quantification permet d'échanger la mémoire contre la
+    fluidité de l'animation : un pas plus petit produit plus d'images.
+
+    Attributes:
+        angle_step (float): Pas de quantification de l'angle en degrés.
+        num_frames (int): Nombre d'images par sprite.
+        tables (dict): Images précalculées, indexées par surface source.
+    """
+
+    def __init__(self, angle_step=5):
+        """Initialise une table vide.
+
+        Args:
+            angle_step (float): Pas de quantification de l'angle en degrés.
+        """
+        self.angle_step = angle_step
+        self.num_frames = math.ceil(360 / angle_step)
+        self.tables = {}
+
+    def build(self, image, prepare=None, source=None):
+        """Précalcule toutes les images de saut d'un sprite.
+
+        Args:
+            image (pygame.Surface): Image du skieur, clé de la table.
+            prepare (Callable[[pygame.Surface], pygame.Surface] | None):
+                Préparation de chaque image transformée pour l'affichage.
+            source (pygame.Surface | None): Image transformée, avec
+                transparence par pixel; par défaut l'image elle-même. Une
+                image préparée avec une couleur transparente ne se
+                transforme pas correctement.
+
+        Returns:
+            list[pygame.Surface]: Images transformées, une par angle.
+        """
+        if source is None:
+            source = image
+        frames = []
+        for i in range(self.num_frames):
+            angle, scale = jump_transform(i * self.angle_step / 360)
+            frame = pygame.transform.rotozoom(source, -angle, scale)
+            frames.append(frame if prepare is None else prepare(frame))
+
+        self.tables[image] = frames
+        return frames
+
+    def get(self, image, angle):
+        """Retourne l'image précalculée la plus proche de l'angle donné.
+
+        La table du sprite est construite au premier appel si elle
+        n'existe pas encore.
+
+        Args:
+            image (pygame.Surface): Image source du skieur.
+            angle (float): Angle de rotation courant en degrés.
+
+        Returns:
+            pygame.Surface: Image transformée.
+        """
+        frames = self.tables.get(image)
+        if frames is None:
+            frames = self.build(image)
+
+        return frames[self.index(angle)]
+
+    def index(self, angle):
+        """Calcule l'indice de l'image la plus proche d'un angle.
+
+        Args:
+            angle (float): Angle de rotation en degrés.
+
+        Returns:
+            int: Indice de l'image dans la table d'un sprite.
+        """
+        return round(angle / self.angle_step) % self.num_frames
+
+    def memory_usage(self):
+        """Calcule la mémoire occupée par les pixels de la table.
+
+        Returns:
+            int: Nombre d'octets utilisés par l'ensemble des images.
+        """
+        return sum(
+            frame.get_pitch() * frame.get_height()
+            for frames in self.tables.values()
+            for frame in frames
+        )
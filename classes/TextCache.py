@@ -0,0 +1,72 @@
+"""
+Module text_cache.
+
+Ce module définit la classe TextCache, un cache LRU borné des surfaces
+de texte déjà rendues. La rastérisation d'une police (font.render) est
+coûteuse; le cache permet de ne la payer qu'une seule fois par chaîne
+distincte plutôt qu'à chaque image.
+"""
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache LRU borné de surfaces de texte rendues.
+
+    Les entrées sont indexées par le triplet (texte, couleur, police).
+    Lorsque la capacité est atteinte, l'entrée la moins récemment
+    utilisée est retirée.
+
+    Attributes:
+        max_size (int): Nombre maximal de surfaces conservées.
+        hits (int): Nombre de rendus servis par le cache.
+        misses (int): Nombre de rendus effectués par la police.
+    """
+
+    def __init__(self, max_size=128):
+        """Initialise un cache vide.
+
+        Args:
+            max_size (int): Nombre maximal de surfaces conservées.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.surfaces = OrderedDict()
+
+    def render(self, text, color, font):
+        """Retourne la surface du texte, rendue au besoin.
+
+        Args:
+            text (str): Texte à rendre.
+            color (tuple[int, int, int]): Couleur RGB du texte.
+            font (pygame.font.Font): Police utilisée.
+
+        Returns:
+            pygame.Surface: Surface contenant le texte rendu.
+        """
+        key = (text, tuple(color), font)
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Retourne le nombre de surfaces conservées."""
+        return len(self.surfaces)
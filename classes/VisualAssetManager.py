@@ -4,13 +4,30 @@ Gestionnaire de ressources visuelles pour un jeu Pygame.
 Ce module fournit la classe VisualAssetManager qui est
 une sous-classe de la classe AssetManager.
 
+Chaque image chargée ou dessinée passe par une même préparation
+(VisualAssetManager.prepare) qui la met au format de l'écran et choisit
+sa façon d'être copiée selon sa transparence :
+    - image opaque : convert, sans transparence;
+    - bords nets (pixels opaques ou transparents) : couleur transparente
+      (colorkey) encodée en RLE;
+    - bords adoucis (pixels semi-transparents) : transparence par pixel
+      (convert_alpha) encodée en RLE, les longues plages transparentes
+      étant alors sautées d'un bloc.
+Le choix fait pour chaque image est conservé (preparations).
+
 Classes:
     AssetManager: Fournit des utilitaires simples pour signaler les problèmes
         de chargement de fichiers (images, sons, polices, etc.)
+    SpriteCache: Cache sur disque des images décodées et redimensionnées.
 """
+from collections import Counter
+import numpy as np
 import pygame
 from classes.AssetManager import AssetManager
 
+# Couleur transparente des images à bords nets, si elles ne l'emploient pas
+COLORKEY = (255, 0, 255)
+
 
 class VisualAssetManager(AssetManager):
     """Gestionnaire de ressources visuelles pour un jeu Pygame.
@@ -18,10 +35,22 @@ class VisualAssetManager(AssetManager):
     Cette classe permet de charger des polices et des images, en fournissant
     des versions de secours si les fichiers sont introuvables ou si pygame
     n'a pas de mode vidéo actif.
+
+    Attributes:
+        preparations (list[tuple[str, str, tuple[int, int]]]): Nom,
+            préparation choisie et taille de chaque image préparée.
     """
 
-    def __init__(self):
-        """Initialise les chemins des fichiers et la police par défaut."""
+    def __init__(self, sprite_cache=None):
+        """Initialise les chemins des fichiers et la police par défaut.
+
+        Args:
+            sprite_cache (SpriteCache | None): Cache sur disque des images
+                redimensionnées. Par défaut, les images sont décodées et
+                redimensionnées à chaque chargement.
+        """
+        self.sprite_cache = sprite_cache
+        self.preparations = []
         self.font_default = pygame.font.SysFont(None, 36)
         self.font_retro_path = (
             "fonts/PressStart2P-Regular/PressStart2P-Regular.ttf"
@@ -42,15 +71,18 @@ class VisualAssetManager(AssetManager):
         self.rock_path = "images/Stones-Transparent-Isolated-Background-sm.png"
 
     # Polices
-    def load_retro_font(self):
+    def load_retro_font(self, size=18):
         """Charge la police rétro.
 
+        Args:
+            size (int): Taille de la police en pixels.
+
         Returns:
             pygame.font.Font: La police rétro chargée ou la police par défaut
                 si le fichier est manquant.
         """
         try:
-            font_retro = pygame.font.Font(self.font_retro_path, 18)
+            font_retro = pygame.font.Font(self.font_retro_path, size)
         except FileNotFoundError:
             font_retro = self.font_default
             super().print_file_missing_error(self.font_retro_path)
@@ -77,44 +109,49 @@ class VisualAssetManager(AssetManager):
         """Charge l'image grand skieur et la redimensionne.
 
         Returns:
-            pygame.Surface: Surface de l'image ou une surface vide
-                si fichier manquant.
+            pygame.Surface: Surface de l'image préparée, ou une surface
+                vide si fichier manquant.
         """
         try:
-            big_skier = pygame.transform.scale(pygame.image.load(
-                self.big_skier_path), (200, 200))
+            big_skier = self.load_scaled_image(
+                self.big_skier_path, (200, 200))
         except FileNotFoundError:
             big_skier = pygame.Surface((0, 0))
             super().print_file_missing_error(self.big_skier_path)
 
-        return big_skier
+        return self.prepare("grand skieur", big_skier)
 
     def load_big_tree(self):
         """Charge l'image grand arbre et la redimensionne.
 
         Returns:
-            pygame.Surface: Surface de l'image ou une surface vide
-                si fichier manquant.
+            pygame.Surface: Surface de l'image préparée, ou une surface
+                vide si fichier manquant.
         """
         try:
-            big_tree = pygame.transform.scale(pygame.image.load(
-                self.big_tree_path), (200, 200))
+            big_tree = self.load_scaled_image(
+                self.big_tree_path, (200, 200))
         except FileNotFoundError:
             big_tree = pygame.Surface((0, 0))
             super().print_file_missing_error(self.big_tree_path)
 
-        return big_tree
+        return self.prepare("grand arbre", big_tree)
 
-    def load_skier(self):
+    def load_skier(self, prepare=True):
         """Charge l'image du skieur et la redimensionne.
 
+        Args:
+            prepare (bool): Prépare l'image pour l'affichage. Sinon l'image
+                garde sa transparence par pixel, pour être transformée
+                avant d'être préparée.
+
         Returns:
             pygame.Surface: Surface de l'image ou un skieur dessiné si fichier
                 manquant ou erreur pygame.
         """
         try:
-            skier_left = pygame.transform.scale(pygame.image.load(
-                self.skier_path).convert_alpha(), (100, 100))
+            skier_left = self.load_scaled_image(
+                self.skier_path, (100, 100), convert=True)
         except FileNotFoundError:
             skier_left = self.create_fallback_skier()
             super().print_file_missing_error(self.skier_path)
@@ -122,55 +159,182 @@ class VisualAssetManager(AssetManager):
             skier_left = self.create_fallback_skier()
             self.print_video_mode_error()
 
-        return skier_left
+        if not prepare:
+            return skier_left
+        return self.prepare("skieur", skier_left)
 
-    def load_tree(self):
+    def load_tree(self, prepare=True):
         """Charge l'image de l'arbre ou crée un arbre si fichier manquant.
 
+        Args:
+            prepare (bool): Prépare l'image pour l'affichage. Sinon l'image
+                garde sa transparence par pixel, pour être transformée
+                avant d'être préparée.
+
         Returns:
             pygame.Surface: Surface de l'arbre.
         """
-        green = (0, 100, 50)
-        triangle_points = [
-            (35, 0),
-            (0, 70),
-            (70, 70)
-        ]
         try:
-            tree = pygame.transform.scale(pygame.image.load(
-                self.tree_path).convert_alpha(), (70, 70))
+            tree = self.load_scaled_image(
+                self.tree_path, (70, 70), convert=True)
         except FileNotFoundError:
-            tree = pygame.Surface((70, 70), pygame.SRCALPHA)
-            pygame.draw.polygon(tree, green, triangle_points)
+            tree = self.create_fallback_tree()
             super().print_file_missing_error(self.tree_path)
         except pygame.error:
-            tree = pygame.Surface((70, 70), pygame.SRCALPHA)
-            pygame.draw.polygon(tree, green, triangle_points)
+            tree = self.create_fallback_tree()
             self.print_video_mode_error()
 
-        return tree
+        if not prepare:
+            return tree
+        return self.prepare("arbre", tree)
 
-    def load_rock(self):
+    def load_rock(self, prepare=True):
         """Charge l'image du rocher ou crée un rocher si fichier manquant.
 
+        Args:
+            prepare (bool): Prépare l'image pour l'affichage. Sinon l'image
+                garde sa transparence par pixel, pour être transformée
+                avant d'être préparée.
+
         Returns:
             pygame.Surface: Surface du rocher.
         """
-        grey = (150, 150, 150)
-
         try:
-            rock = pygame.transform.scale(pygame.image.load(
-                self.rock_path).convert_alpha(), (90, 60))
+            rock = self.load_scaled_image(
+                self.rock_path, (90, 60), convert=True)
         except FileNotFoundError:
-            rock = pygame.Surface((90, 60), pygame.SRCALPHA)
-            pygame.draw.ellipse(rock, grey, rock.get_rect())
+            rock = self.create_fallback_rock()
             super().print_file_missing_error(self.rock_path)
         except pygame.error:
-            rock = pygame.Surface((90, 60), pygame.SRCALPHA)
-            pygame.draw.ellipse(rock, grey, rock.get_rect())
+            rock = self.create_fallback_rock()
             self.print_video_mode_error()
 
-        return rock
+        if not prepare:
+            return rock
+        return self.prepare("rocher", rock)
+
+    def load_scaled_image(self, path, size, convert=False):
+        """Charge une image et la redimensionne.
+
+        Si un cache est configuré, l'image redimensionnée y est lue sans
+        décodage ni redimensionnement, ou y est écrite au premier
+        chargement.
+
+        Args:
+            path (str): Chemin de l'image.
+            size (tuple[int, int]): Taille de l'image finale.
+            convert (bool): Convertit l'image au format de l'écran
+                (convert_alpha), ce qui exige un mode vidéo actif.
+
+        Returns:
+            pygame.Surface: Image redimensionnée.
+
+        Raises:
+            FileNotFoundError: Si le fichier est introuvable.
+            pygame.error: Si convert est True sans mode vidéo actif.
+        """
+        cache = self.sprite_cache
+        image = cache.get(path, size) if cache is not None else None
+
+        if image is not None:
+            return image.convert_alpha() if convert else image
+
+        image = pygame.image.load(path)
+        if convert:
+            image = image.convert_alpha()
+        image = pygame.transform.scale(image, size)
+
+        if cache is not None:
+            cache.put(path, size, image)
+
+        return image
+
+    def prepare(self, name, surface):
+        """Prépare une image pour des copies rapides vers l'écran.
+
+        L'image est mise au format de l'écran selon sa transparence (voir
+        le module) et le choix est conservé dans preparations. Sans mode
+        vidéo actif, ou pour une image vide, l'image est retournée telle
+        quelle.
+
+        Args:
+            name (str): Nom de l'image dans le relevé des préparations.
+            surface (pygame.Surface): Image chargée ou dessinée.
+
+        Returns:
+            pygame.Surface: Image préparée (une nouvelle surface, sauf si
+                elle est retournée telle quelle).
+        """
+        width, height = surface.get_size()
+        if pygame.display.get_surface() is None:
+            mode, prepared = "sans mode vidéo", surface
+        elif width * height == 0:
+            mode, prepared = "vide", surface
+        else:
+            visible, opaque = self.count_pixels(surface)
+            if opaque == width * height:
+                mode, prepared = "opaque", surface.convert()
+            elif opaque == visible and not self.uses_colorkey(surface):
+                mode = "couleur transparente RLE"
+                prepared = pygame.Surface((width, height)).convert()
+                prepared.fill(COLORKEY)
+                prepared.blit(surface, (0, 0))
+                prepared.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            else:
+                mode, prepared = "transparence RLE", surface.convert_alpha()
+                prepared.set_alpha(255, pygame.RLEACCEL)
+
+        self.preparations.append((name, mode, (width, height)))
+        return prepared
+
+    def count_pixels(self, surface):
+        """Compte les pixels visibles et opaques d'une image.
+
+        Args:
+            surface (pygame.Surface): Image non vide.
+
+        Returns:
+            tuple[int, int]: Nombre de pixels visibles (alpha non nul) et
+                de pixels opaques (alpha maximal).
+        """
+        if not surface.get_flags() & pygame.SRCALPHA:
+            # Sans transparence par pixel, seule une couleur transparente
+            # peut masquer des pixels
+            visible = pygame.mask.from_surface(surface).count()
+            return visible, visible
+
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        counts = np.count_nonzero(alpha), np.count_nonzero(alpha == 255)
+        del alpha  # Déverrouille la surface
+        return counts
+
+    def uses_colorkey(self, surface):
+        """Vérifie si un pixel visible a la couleur transparente.
+
+        Args:
+            surface (pygame.Surface): Image à bords nets.
+
+        Returns:
+            bool: True si la couleur transparente ne peut pas être employée.
+        """
+        visible = pygame.mask.from_surface(surface, 0)
+        keyed = pygame.mask.from_threshold(
+            surface, COLORKEY, (1, 1, 1, 255))
+        return keyed.overlap_area(visible, (0, 0)) > 0
+
+    def report(self):
+        """Résume les préparations des images.
+
+        Returns:
+            list[str]: Une ligne par nom et préparation, avec le nombre
+                d'images.
+        """
+        counts = Counter(
+            (name, mode) for name, mode, size in self.preparations)
+        return [
+            f"{name} : {mode}" + (f" ({count} images)" if count > 1 else "")
+            for (name, mode), count in counts.items()
+        ]
 
     def print_video_mode_error(self):
         """Affiche un message d'erreur s'il n'y pas de mode vidéo actif."""
@@ -230,3 +394,30 @@ class VisualAssetManager(AssetManager):
         pygame.draw.ellipse(surface, skier_white, (24, 14, 16, 8))
 
         return surface
+
+    def create_fallback_tree(self):
+        """Crée un arbre triangulaire dessiné avec pygame.
+
+        Returns:
+            pygame.Surface: Surface de l'arbre avec transparence.
+        """
+        green = (0, 100, 50)
+        triangle_points = [
+            (35, 0),
+            (0, 70),
+            (70, 70)
+        ]
+        tree = pygame.Surface((70, 70), pygame.SRCALPHA)
+        pygame.draw.polygon(tree, green, triangle_points)
+        return tree
+
+    def create_fallback_rock(self):
+        """Crée un rocher elliptique dessiné avec pygame.
+
+        Returns:
+            pygame.Surface: Surface du rocher avec transparence.
+        """
+        grey = (150, 150, 150)
+        rock = pygame.Surface((90, 60), pygame.SRCALPHA)
+        pygame.draw.ellipse(rock, grey, rock.get_rect())
+        return rock
@@ -8,13 +8,20 @@ visuels (joueur, obstacles, décor et interface utilisateur).
 
 Classes:
     VisualAssetManager: Charge et fournit des polices et images.
+    TextCache: Cache LRU des surfaces de texte rendues.
+    SpriteTable: Images précalculées de l'animation de saut.
+    CollisionMasks: Masques de collision au pixel près.
 
 Functions:
     side_obstacles_positions: Génère les coordonnées (x, y) des obstacles
-        décoratifs en bordure d'écran.
+        décoratifs en bordure d'écran. Utilisée pour précalculer les
+        bandes de forêt en bordure de piste.
 """
 import pygame
 from classes.VisualAssetManager import VisualAssetManager
+from classes.TextCache import TextCache
+from classes.SpriteTable import SpriteTable
+from classes.CollisionMasks import CollisionMasks
 from utils.FunctionalProgramming import side_obstacles_positions
 
 
@@ -29,16 +36,45 @@ class Window:
     - l'affichage des informations de statut (niveau, vies, points).
     """
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, jump_angle_step=5, dirty_rects=False,
+                 sprite_cache=None, loader=None, mask_collision=False,
+                 vsync=False, scale=1.0):
         """Initialise la fenêtre du jeu et charge les ressources graphiques.
 
         Args:
             width (int): Largeur de la fenêtre en pixels.
             height (int): Hauteur de la fenêtre en pixels.
+            jump_angle_step (float): Pas de quantification, en degrés,
+                des images précalculées du saut.
+            dirty_rects (bool): Active le rendu par rectangles modifiés
+                au lieu du remplissage et de la mise à jour de tout l'écran.
+            sprite_cache (SpriteCache | None): Cache sur disque des images
+                redimensionnées.
+            loader (AssetLoader | None): Chargeur en arrière-plan des
+                images de la partie. Seules les ressources de l'écran de
+                démarrage sont alors chargées ici; finish_loading doit être
+                appelée avant de dessiner la partie.
+            mask_collision (bool): Précalcule les masques de collision au
+                pixel près (collision_masks) avec les images de la partie.
+            vsync (bool): Demande la synchronisation verticale : la
+                présentation attend alors le rafraîchissement de l'écran.
+                Si le pilote la refuse, la fenêtre est créée sans.
+            scale (float): Facteur d'échelle du rendu. Les positions et
+                les tailles de la partie restent exprimées pour la taille
+                width x height; l'écran est dessiné à cette taille
+                multipliée par scale, puis agrandi à la fenêtre par SDL
+                (pygame.SCALED). Si SDL la refuse, la fenêtre garde la
+                taille du rendu.
+
+        Raises:
+            ValueError: Si le facteur d'échelle n'est pas positif.
         """
+        if scale <= 0:
+            raise ValueError(f"facteur d'échelle invalide : {scale}")
         if not pygame.get_init():
             pygame.init()
-        assets = VisualAssetManager()
+        assets = VisualAssetManager(sprite_cache)
+        self.assets = assets
         self.width = width
         self.height = height
         self.spacing = 50
@@ -48,40 +84,179 @@ class Window:
         self.left_limit = 2 * self.spacing
         self.right_limit = self.width - 4 * self.spacing
         self.white = (255, 255, 255)
+        self.scale = scale
+        self.render_size = (round(width * scale), round(height * scale))
         self.snow_color = (200, 200, 255)
-
-        self.display = pygame.display.set_mode((self.width, self.height))
+        self.text_cache = TextCache()
+
+        # Rendu par rectangles modifiés (dirty rects)
+        self.dirty_rects = dirty_rects
+        self.drawn_rects = []
+        self.previous_rects = []
+        self.background_valid = False
+        self.full_redraw = True
+        self.pixels_pushed = 0
+        self.total_pixels_pushed = 0
+        self.frames_presented = 0
+        self.frames_skipped = 0
+
+        # Écrans de menu composés hors écran, un par nom d'écran, et clés
+        # de l'écran affiché (sans autre dessin) et du dernier présenté
+        self.screens = {}
+        self.screens_composed = 0
+        self.shown_screen = None
+        self.presented_screen = None
+
+        self.display = None
+        self.vsync = vsync
+        if vsync:
+            # pygame n'accepte la synchronisation verticale qu'avec un
+            # rendu accéléré (SCALED ou OPENGL)
+            try:
+                self.display = pygame.display.set_mode(
+                    self.render_size, pygame.SCALED, vsync=1)
+            except pygame.error as error:
+                print(f"Synchronisation verticale indisponible : {error}")
+                self.vsync = False
+        if self.display is None and scale != 1:
+            # Un rendu à une autre échelle est agrandi à la fenêtre par SDL
+            try:
+                self.display = pygame.display.set_mode(
+                    self.render_size, pygame.SCALED)
+            except pygame.error as error:
+                print(f"Mise à l'échelle indisponible : {error}")
+        if self.display is None:
+            self.display = pygame.display.set_mode(self.render_size)
         pygame.display.set_caption("Ski Alpin 2D")
 
         self.font_retro = assets.load_retro_font()
+        if scale != 1:
+            self.font_status = assets.load_retro_font(round(18 * scale))
+        else:
+            self.font_status = self.font_retro
         self.font_snow = assets.load_snow_font()
+        self.font_overlay = pygame.font.Font(None, 22)
         self.big_skier = assets.load_big_skier()
         self.big_tree = assets.load_big_tree()
-        self.skier_left = assets.load_skier()
-        self.skier_right = pygame.transform.flip(self.skier_left, True, False)
-        self.tree = assets.load_tree()
-        self.rock = assets.load_rock()
+
+        # Images de la partie, leur version à l'échelle du rendu et images
+        # du saut précalculées (à l'échelle du rendu)
+        self.loader = loader
+        self.images = {}
+        self.sprite_table = SpriteTable(jump_angle_step)
+        if mask_collision:
+            self.collision_masks = CollisionMasks(self.sprite_table)
+        else:
+            self.collision_masks = None
+        if loader is None:
+            self.set_gameplay_sprites(self.load_gameplay_sprites(assets))
+        else:
+            self.set_gameplay_sprites((None, None, None, None))
+            loader.submit("sprites", self.load_gameplay_sprites, assets)
+
+        # Bandes de forêt en bordure, construites au premier affichage
+        self.side_strips_key = None
+        self.right_strip_x = 0
+        self.left_strip = None
+        self.right_strip = None
+
+    def load_gameplay_sprites(self, assets):
+        """Charge les images de la partie et précalcule celles du saut.
+
+        Les images gardent leur taille dans la partie (rectangles de
+        collision); une copie à l'échelle du rendu est faite pour
+        l'affichage. Les images dérivées (skieur vers la droite, copies,
+        images du saut) sont calculées à partir des images chargées avec
+        leur transparence par pixel, puis préparées: une image préparée
+        avec une couleur transparente ne se transforme pas correctement.
+        Les masques de collision sont aussi calculés ici, s'ils sont
+        demandés. Peut s'exécuter dans un fil d'exécution du chargeur.
+
+        Args:
+            assets (VisualAssetManager): Gestionnaire des images.
+
+        Returns:
+            tuple[pygame.Surface, ...]: Skieur vers la gauche, skieur vers
+                la droite, arbre et rocher.
+        """
+        skier_source = assets.load_skier(prepare=False)
+        sources = {}
+        for name, source in (
+                ("skieur", skier_source),
+                ("skieur", pygame.transform.flip(skier_source, True, False)),
+                ("arbre", assets.load_tree(prepare=False)),
+                ("rocher", assets.load_rock(prepare=False))):
+            sources[assets.prepare(name, source)] = source
+        skier_left, skier_right, tree, rock = sources
+        frame_sources = dict(sources)
+        if self.scale != 1:
+            for image, source in sources.items():
+                frame_sources[image] = self.scale_image(source)
+                self.images[image] = assets.prepare(
+                    "copie à l'échelle", frame_sources[image])
+        for image in (skier_left, skier_right):
+            self.sprite_table.build(
+                self.images.get(image, image),
+                lambda frame: assets.prepare("saut du skieur", frame),
+                source=frame_sources[image])
+        if self.collision_masks is not None:
+            self.collision_masks.build(
+                (skier_left, skier_right), (tree, rock), sources)
+        return skier_left, skier_right, tree, rock
+
+    def set_gameplay_sprites(self, sprites):
+        """Rattache les images de la partie à la fenêtre.
+
+        Args:
+            sprites (tuple[pygame.Surface, ...]): Skieur vers la gauche,
+                skieur vers la droite, arbre et rocher.
+        """
+        self.skier_left, self.skier_right, self.tree, self.rock = sprites
+
+    def finish_loading(self):
+        """Attend les images de la partie chargées en arrière-plan."""
+        if self.loader is not None and self.skier_left is None:
+            self.set_gameplay_sprites(self.loader.result("sprites"))
 
     def show_text(self, text, x, y, color, font):
         """Affiche du texte centré à l'écran.
 
+        Le rendu du texte passe par le cache de surfaces afin que la police
+        ne soit rastérisée qu'une seule fois par chaîne distincte.
+
         Args:
             text (str): Texte à afficher.
-            x (int): Position horizontale du centre du texte.
-            y (int): Position verticale du centre du texte.
+            x (int): Position horizontale du centre du texte, avant mise
+                à l'échelle du rendu.
+            y (int): Position verticale du centre du texte, avant mise à
+                l'échelle du rendu.
             color (tuple[int, int, int]): Couleur RGB du texte.
-            font (pygame.font.Font): Police utilisée.
+            font (pygame.font.Font): Police utilisée, à la taille du rendu.
         """
-        text_render = font.render(text, True, color)
-        text_rect = text_render.get_rect(center=(x, y))
-        self.display.blit(text_render, text_rect)
+        text_render = self.text_cache.render(text, color, font)
+        text_rect = text_render.get_rect(
+            center=(x * self.scale, y * self.scale))
+        self.blit(text_render, text_rect)
 
     def show_start_screen(self):
-        """Affiche l'écran de démarrage du jeu."""
+        """Affiche l'écran de démarrage du jeu.
+
+        Returns:
+            bool: True si l'écran affiché a changé.
+        """
+        return self.show_screen(("start",), self.compose_start_screen)
+
+    def compose_start_screen(self, surface):
+        """Dessine l'écran de démarrage du jeu.
+
+        Args:
+            surface (pygame.Surface): Surface de la taille de l'écran.
+        """
         blue = (50, 50, 255)
-        self.display.fill(blue)
+        surface.fill(blue)
 
-        self.show_text(
+        self.compose_text(
+            surface,
             "SKI ALPIN 2D",
             self.width // 2,
             self.height // 3,
@@ -89,7 +264,8 @@ class Window:
             self.font_snow
         )
 
-        self.show_text(
+        self.compose_text(
+            surface,
             "Appuyer sur ENTRÉE pour débuter",
             self.width // 2,
             self.height*2 // 3,
@@ -97,9 +273,8 @@ class Window:
             self.font_retro
         )
 
-        self.display.blit(self.big_tree, [100, self.height // 2])
-        self.display.blit(
-            self.big_skier, [self.width - 300, self.height // 2])
+        surface.blit(self.big_tree, [100, self.height // 2])
+        surface.blit(self.big_skier, [self.width - 300, self.height // 2])
 
     def show_game_over_screen(self, game_level, player_points):
         """Affiche l'écran de fin de partie.
@@ -107,11 +282,28 @@ class Window:
         Args:
             game_level (int): Niveau atteint par le joueur.
             player_points (int): Score final du joueur.
+
+        Returns:
+            bool: True si l'écran affiché a changé.
+        """
+        return self.show_screen(
+            ("game_over", game_level, player_points),
+            self.compose_game_over_screen, game_level, player_points
+        )
+
+    def compose_game_over_screen(self, surface, game_level, player_points):
+        """Dessine l'écran de fin de partie.
+
+        Args:
+            surface (pygame.Surface): Surface de la taille de l'écran.
+            game_level (int): Niveau atteint par le joueur.
+            player_points (int): Score final du joueur.
         """
         red = (255, 0, 0)
-        self.display.fill(red)
+        surface.fill(red)
 
-        self.show_text(
+        self.compose_text(
+            surface,
             "LA PARTIE EST TERMINÉE",
             self.width // 2,
             self.height // 4,
@@ -119,7 +311,8 @@ class Window:
             self.font_retro
         )
 
-        self.show_text(
+        self.compose_text(
+            surface,
             f"Niveau : {game_level}",
             self.width // 2,
             self.height // 2 - 25,
@@ -127,7 +320,8 @@ class Window:
             self.font_retro
         )
 
-        self.show_text(
+        self.compose_text(
+            surface,
             f"Points : {player_points}",
             self.width // 2,
             self.height // 2 + 25,
@@ -135,7 +329,8 @@ class Window:
             self.font_retro
         )
 
-        self.show_text(
+        self.compose_text(
+            surface,
             "Appuyer sur ENTRÉE pour recommencer",
             self.width // 2,
             self.height*2.5 // 3,
@@ -143,30 +338,182 @@ class Window:
             self.font_retro
         )
 
-        self.display.blit(self.big_tree, [200, 200])
-        self.display.blit(self.big_skier, [self.width - 400, 200])
+        surface.blit(self.big_tree, [200, 200])
+        surface.blit(self.big_skier, [self.width - 400, 200])
+
+    def compose_text(self, surface, text, x, y, color, font):
+        """Dessine du texte centré sur une surface hors écran.
+
+        Args:
+            surface (pygame.Surface): Surface de destination.
+            text (str): Texte à afficher.
+            x (int): Position horizontale du centre du texte.
+            y (int): Position verticale du centre du texte.
+            color (tuple[int, int, int]): Couleur RGB du texte.
+            font (pygame.font.Font): Police utilisée.
+        """
+        text_render = self.text_cache.render(text, color, font)
+        surface.blit(text_render, text_render.get_rect(center=(x, y)))
+
+    def show_screen(self, key, compose, *args):
+        """Affiche un écran de menu composé hors écran.
+
+        Chaque écran est composé une seule fois par valeur de sa clé, à la
+        taille de la partie puis réduit à celle du rendu, et copié d'un
+        seul bloc. Rien n'est dessiné si l'écran est déjà
+        affiché tel quel; flip ne le présente alors pas de nouveau.
+
+        Args:
+            key (tuple): Nom de l'écran suivi des valeurs qu'il affiche.
+            compose (Callable): Dessine l'écran sur une surface, avec les
+                arguments args.
+            *args: Arguments de compose après la surface.
+
+        Returns:
+            bool: True si l'écran affiché a changé.
+        """
+        if key == self.shown_screen:
+            return False
+
+        # Une seule surface par écran : la précédente est remplacée
+        cached = self.screens.get(key[0])
+        if cached is None or cached[0] != key:
+            surface = pygame.Surface((self.width, self.height)).convert()
+            compose(surface, *args)
+            if self.scale != 1:
+                surface = self.scale_image(surface)
+            cached = self.screens[key[0]] = (key, surface)
+            self.screens_composed += 1
+
+        self.display.blit(cached[1], (0, 0))
+        self.background_valid = False
+        self.full_redraw = True
+        self.shown_screen = key
+        return True
+
+    def expose(self):
+        """Présente de nouveau l'écran à la prochaine image.
+
+        À appeler lorsque la fenêtre a été découverte : un écran de menu
+        inchangé n'est sinon plus présenté.
+        """
+        self.presented_screen = None
 
     def update_side_obstacles(self, speed):
         """Met à jour le décor sur les bords de la piste.
 
+        Affiche le décor à sa position courante, puis le fait défiler.
+
         Args:
             speed (int): Vitesse de défilement vertical.
         """
+        self.draw_side_obstacles()
+        self.scroll_side_obstacles(speed)
+
+    def draw_side_obstacles(self, dx=None):
+        """Affiche le décor sur les bords de la piste.
+
+        Les forêts en bordure sont précalculées dans deux bandes verticales.
+        Chaque image se résume à deux copies d'une sous-zone de ces bandes,
+        décalée selon le défilement.
+
+        Args:
+            dx (float | None): Décalage vertical du décor, entre 0 et
+                l'espacement des arbres. Par défaut, le décalage courant.
+        """
+        if dx is None:
+            dx = self.dx
+
+        key = (self.width, self.height, self.spacing, self.alignment,
+               self.tree)
+        if key != self.side_strips_key:
+            self.build_side_strips()
+
+        scale = self.scale
+        area = pygame.Rect(
+            0,
+            (2 * self.spacing - dx) * scale,
+            self.left_strip.get_width(),
+            self.render_size[1]
+        )
+        self.blit(self.left_strip, (self.alignment * scale, 0), area,
+                  pygame.BLEND_PREMULTIPLIED)
+        self.blit(self.right_strip, (self.right_strip_x * scale, 0), area,
+                  pygame.BLEND_PREMULTIPLIED)
+
+    def scroll_side_obstacles(self, speed):
+        """Fait défiler le décor sur les bords de la piste.
+
+        Args:
+            speed (int): Distance de défilement vertical, cumulée sur les
+                pas de logique de l'image.
+        """
+        self.dx -= speed
+        while self.dx <= 0:
+            self.dx += self.spacing
+
+    def interpolated_side_offset(self, speed, alpha):
+        """Calcule le décalage affiché du décor entre deux pas de logique.
+
+        Args:
+            speed (float): Vitesse de défilement du dernier pas.
+            alpha (float): Fraction écoulée entre l'état précédent (0)
+                et l'état courant (1).
+
+        Returns:
+            float: Décalage vertical, entre 0 et l'espacement des arbres.
+        """
+        dx = self.dx + speed * (1 - alpha)
+        while dx > self.spacing:
+            dx -= self.spacing
+        return dx
+
+    def build_side_strips(self):
+        """Construit les bandes de forêt gauche et droite.
+
+        Le motif des arbres est périodique selon l'espacement. Les bandes
+        contiennent toutes les rangées visibles plus deux rangées de marge
+        pour le défilement. Les images sont prémultipliées par leur alpha
+        afin que la superposition des arbres soit identique à un affichage
+        arbre par arbre. Elles sont ensuite réduites à l'échelle du rendu.
+        """
+        nb = 3
+        self.num_rows = self.height // self.spacing
+        self.right_strip_x = self.width - nb * self.spacing + self.alignment
+
         positions = side_obstacles_positions(
             self.spacing,
             self.alignment,
             self.width,
             self.num_rows,
-            self.dx,
-            3
+            2 * self.spacing,
+            nb
         )
 
+        size = (
+            (nb - 1) * self.spacing + self.tree.get_width(),
+            (self.num_rows + 1) * self.spacing + self.tree.get_height()
+        )
+        self.left_strip = pygame.Surface(size, pygame.SRCALPHA)
+        self.right_strip = pygame.Surface(size, pygame.SRCALPHA)
+        tree = self.tree.convert_alpha().premul_alpha()
+
         for x, y in positions:
-            self.display.blit(self.tree, (x, y))
+            if x < self.right_strip_x:
+                self.left_strip.blit(
+                    tree, (x - self.alignment, y),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
+            else:
+                self.right_strip.blit(
+                    tree, (x - self.right_strip_x, y),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
 
-        self.dx -= speed
-        if self.dx <= 0:
-            self.dx += self.spacing
+        if self.scale != 1:
+            self.left_strip = self.scale_image(self.left_strip)
+            self.right_strip = self.scale_image(self.right_strip)
+
+        self.side_strips_key = (self.width, self.height, self.spacing,
+                                self.alignment, self.tree)
 
     def update_status(self, game_level, player_lives, player_points):
         """Affiche les informations de jeu en haut de l'écran.
@@ -182,46 +529,81 @@ class Window:
             self.width // 4,
             20,
             black,
-            self.font_retro
+            self.font_status
         )
         self.show_text(
             f"Vies : {player_lives}",
             self.width // 2,
             20,
             black,
-            self.font_retro
+            self.font_status
         )
         self.show_text(
             f"Points : {player_points}",
             self.width*3 // 4,
             20,
             black,
-            self.font_retro
+            self.font_status
+        )
+
+    def show_overlay(self, lines):
+        """Affiche des lignes de texte sur un fond noir en haut à gauche.
+
+        Utilisée pour le résumé du profileur d'images.
+
+        Args:
+            lines (list[str]): Lignes à afficher.
+        """
+        white = (255, 255, 255)
+        renders = [
+            self.text_cache.render(line, white, self.font_overlay)
+            for line in lines
+        ]
+        if not renders:
+            return
+
+        line_height = self.font_overlay.get_linesize()
+        panel = pygame.Rect(
+            8, 40,
+            max(render.get_width() for render in renders) + 12,
+            line_height * len(renders) + 8
         )
+        self.display.fill((0, 0, 0), panel)
+        self.shown_screen = None
+        if self.dirty_rects:
+            self.drawn_rects.append(panel)
+
+        for i, render in enumerate(renders):
+            self.blit(render, (panel.x + 6, panel.y + 4 + i * line_height))
 
     def draw(self, image, x, y):
         """Dessine une image si elle est visible à l'écran.
 
+        Une image de la partie est remplacée par sa copie à l'échelle du
+        rendu.
+
         Args:
             image (pygame.Surface): Image à afficher.
-            x (int): Position horizontale.
-            y (int): Position verticale.
+            x (int): Position horizontale dans la partie.
+            y (int): Position verticale dans la partie.
         """
         image_height = image.get_height()
         visible = -image_height < y < self.height
 
         if visible:
-            self.display.blit(image, (x, y))
+            self.blit(self.images.get(image, image),
+                      (x * self.scale, y * self.scale))
 
-    def draw_player(self, player):
+    def draw_player(self, player, position=None):
         """Affiche le joueur à l'écran.
 
         Cette méthode gère plusieurs états visuels du joueur :
         - **Invincibilité** : lorsque le joueur est invincible, son
           affichage alterne (effet de clignotement) afin d'indiquer
           visuellement qu'il ne peut pas subir de collision.
-        - **Saut** : lorsque le joueur saute, son image est transformée
-          (rotation et mise à l'échelle) pour simuler le mouvement aérien.
+        - **Saut** : lorsque le joueur saute, l'image transformée
+          (rotation et mise à l'échelle) correspondant à son angle est
+          tirée de la table précalculée pour simuler le mouvement aérien.
 
         Attention :
             Cette méthode utilise directement l'instance de l'objet joueur,
@@ -231,13 +613,14 @@ class Window:
             player (Player): Instance du joueur contenant son état
                 visuel (position, image, angle, échelle, saut et
                 invincibilité).
+            position (tuple[float, float] | None): Position affichée du
+                joueur, par exemple interpolée. Par défaut, sa position.
         """
-        transformed = self.transform_player_image(
-            player.image, player.angle, player.scale)
-        rect = transformed.get_rect(center=(
-            player.x + player.image.get_width()//2,
-            player.y + player.image.get_height()//2)
-        )
+        if position is None:
+            x, y = player.x, player.y
+        else:
+            x, y = position
+
         draw_player = True
 
         if player.invincible:
@@ -245,27 +628,120 @@ class Window:
 
         if draw_player:
             if player.jumping:
-                self.display.blit(transformed, rect)
+                image = player.image
+                transformed = self.sprite_table.get(
+                    self.images.get(image, image), player.angle)
+                rect = transformed.get_rect(center=(
+                    (x + image.get_width()//2) * self.scale,
+                    (y + image.get_height()//2) * self.scale)
+                )
+                self.blit(transformed, rect)
             else:
-                self.draw(player.image, player.x, player.y)
+                self.draw(player.image, x, y)
 
-    def transform_player_image(
-        self, player_image, player_angle, player_scale
-    ):
-        """Applique une rotation et un redimensionnement au joueur.
+    def scale_image(self, image):
+        """Réduit ou agrandit une image à l'échelle du rendu.
 
         Args:
-            player_image (pygame.Surface): Image du joueur.
-            player_angle (float): Angle de rotation.
-            player_scale (float): Facteur d'échelle.
+            image (pygame.Surface): Image à la taille de la partie.
 
         Returns:
-            pygame.Surface: Image transformée.
+            pygame.Surface: Image lissée (smoothscale) à l'échelle du
+                rendu, d'au moins un pixel de côté.
         """
-        return pygame.transform.rotozoom(
-            player_image, -player_angle, player_scale
-        )
+        width, height = image.get_size()
+        return pygame.transform.smoothscale(image, (
+            max(1, round(width * self.scale)),
+            max(1, round(height * self.scale))
+        ))
+
+    def blit(self, image, position, area=None, special_flags=0):
+        """Dessine une image et mémorise la zone modifiée de l'écran.
+
+        Args:
+            image (pygame.Surface): Image à afficher.
+            position (tuple[int, int] | pygame.Rect): Position de l'image.
+            area (pygame.Rect | None): Sous-zone de l'image à copier.
+            special_flags (int): Mode de mélange pygame.
+
+        Returns:
+            pygame.Rect: Zone de l'écran modifiée.
+        """
+        rect = self.display.blit(image, position, area, special_flags)
+        self.shown_screen = None
+        if self.dirty_rects:
+            self.drawn_rects.append(rect)
+        return rect
+
+    def fill_screen(self, color):
+        """Remplit tout l'écran d'une couleur autre que la neige.
+
+        L'écran complet devra être présenté à la prochaine mise à jour
+        et le fond enneigé devra être redessiné au complet.
+
+        Args:
+            color (tuple[int, int, int]): Couleur RGB de remplissage.
+        """
+        self.display.fill(color)
+        self.shown_screen = None
+        self.background_valid = False
+        self.full_redraw = True
+
+    def clear_background(self):
+        """Efface les éléments de l'image précédente.
+
+        En mode rectangles modifiés, seul le fond sous les éléments dessinés
+        à l'image précédente est restauré. Sinon, tout l'écran est rempli
+        avec la couleur de la neige.
+        """
+        if self.dirty_rects and self.background_valid:
+            for rect in self.previous_rects:
+                self.display.fill(self.snow_color, rect)
+        else:
+            self.shown_screen = None
+            self.display.fill(self.snow_color)
+            self.background_valid = True
+            self.full_redraw = True
 
     def flip(self):
-        """Met à jour l'affichage de la fenêtre."""
-        pygame.display.flip()
+        """Met à jour l'affichage de la fenêtre.
+
+        En mode rectangles modifiés, seules les zones dessinées à cette
+        image et à la précédente sont présentées. Le nombre de pixels
+        poussés vers l'écran est comptabilisé dans les deux modes. Un écran
+        de menu déjà présenté et inchangé n'est pas présenté de nouveau.
+        """
+        if (self.shown_screen is not None
+                and self.shown_screen == self.presented_screen):
+            self.pixels_pushed = 0
+            self.frames_skipped += 1
+            return
+
+        if self.dirty_rects and not self.full_redraw:
+            rects = self.previous_rects + self.drawn_rects
+            pygame.display.update(rects)
+            screen = self.display.get_rect()
+            self.pixels_pushed = sum(
+                rect.clip(screen).width * rect.clip(screen).height
+                for rect in rects
+            )
+        else:
+            pygame.display.flip()
+            self.pixels_pushed = self.render_size[0] * self.render_size[1]
+
+        self.full_redraw = False
+        self.presented_screen = self.shown_screen
+        self.previous_rects = self.drawn_rects
+        self.drawn_rects = []
+        self.total_pixels_pushed += self.pixels_pushed
+        self.frames_presented += 1
+
+    def average_pixels_pushed(self):
+        """Calcule le nombre moyen de pixels présentés par image.
+
+        Returns:
+            float: Moyenne des pixels poussés vers l'écran par image.
+        """
+        if self.frames_presented == 0:
+            return 0.0
+        return self.total_pixels_pushed / self.frames_presented
@@ -0,0 +1,156 @@
+"""
+Exécution du jeu Ski Alpin 2D sans affichage.
+
+Ce module fait tourner la simulation (classes.Simulation) sans pygame,
+aussi vite que possible, avec des entrées clavier aléatoires. Il sert à
+mesurer la vitesse de la logique du jeu et à produire des parties
+simulées plus vite que le temps réel.
+
+Il peut aussi enregistrer la session simulée, ou rejouer une session
+enregistrée (par main.py --record ou headless.py --record) aussi vite que
+possible et vérifier qu'elle se termine avec les mêmes points, niveau et
+vies.
+
+Exemples:
+    python headless.py --frames 100000 --seed 1
+    python headless.py --frames 100000 --seed 1 --record session.ski
+    python headless.py --replay session.ski
+"""
+import argparse
+import random
+import sys
+import time
+from classes.RandomPolicy import RandomPolicy
+from classes.Recording import Recording
+from classes.Simulation import Simulation
+
+
+def run(frames, seed=None, dt=1 / 120, recording=None, course=False):
+    """Simule un nombre d'images donné et mesure le temps écoulé.
+
+    Une nouvelle partie commence chaque fois que le joueur n'a plus
+    de vies.
+
+    Args:
+        frames (int): Nombre d'images à simuler.
+        seed (int | None): Graine de la partie et des entrées.
+        dt (float): Durée simulée d'une image (secondes).
+        recording (Recording | None): Enregistrement des touches de
+            chaque image et des redémarrages.
+        course (bool): Place les obstacles selon une piste construite par
+            tronçons.
+
+    Returns:
+        tuple[Simulation, float]: La simulation et le temps écoulé
+            (secondes).
+    """
+    simulation = Simulation.headless(seed=seed, course=course)
+    policy = RandomPolicy(seed)
+
+    start = time.perf_counter()
+    for i in range(frames):
+        keys = policy(simulation)
+        simulation.step(keys, dt)
+        if recording is not None:
+            recording.record_step(keys)
+        if simulation.game_over:
+            simulation.restart(dt)
+            if recording is not None:
+                recording.record_restart()
+    elapsed = time.perf_counter() - start
+    simulation.close()
+
+    if recording is not None:
+        recording.finish(simulation)
+
+    return simulation, elapsed
+
+
+def replay(recording):
+    """Rejoue une session enregistrée et mesure le temps écoulé.
+
+    Args:
+        recording (Recording): Session enregistrée.
+
+    Returns:
+        tuple[Simulation, float]: La simulation dans son état final et le
+            temps écoulé (secondes).
+    """
+    simulation = Simulation.headless(
+        seed=recording.seed, course=recording.course)
+
+    start = time.perf_counter()
+    recording.play(simulation)
+    elapsed = time.perf_counter() - start
+    simulation.close()
+
+    return simulation, elapsed
+
+
+def main(argv=None):
+    """Lance la simulation sans affichage et affiche sa vitesse.
+
+    Args:
+        argv (list[str] | None): Options de la ligne de commande.
+
+    Returns:
+        int: Code de sortie (1 si une reprise diffère de l'enregistrement,
+            2 si elle demande les collisions au pixel près).
+    """
+    parser = argparse.ArgumentParser(
+        description="Ski Alpin 2D sans affichage"
+    )
+    parser.add_argument("--frames", type=int, default=100000,
+                        help="nombre d'images à simuler")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine de la partie et des entrées")
+    parser.add_argument("--no-course", action="store_true",
+                        help="replace les obstacles au hasard au lieu de "
+                             "suivre une piste construite par tronçons")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre la session simulée")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="rejoue une session enregistrée")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        recording = Recording.load(args.replay)
+        if recording.masks:
+            # Les masques demandent les images de la partie, que la
+            # simulation sans affichage ne charge pas
+            print("Reprise impossible sans affichage : collisions au pixel "
+                  "près (rejouer avec main.py --replay)", file=sys.stderr)
+            return 2
+        simulation, elapsed = replay(recording)
+    else:
+        seed = args.seed if args.seed is not None else random.getrandbits(63)
+        course = not args.no_course
+        recording = Recording(seed, course=course) if args.record else None
+        simulation, elapsed = run(
+            args.frames, seed, recording=recording, course=course)
+        if recording is not None:
+            recording.save(args.record)
+
+    print(f"Images simulées : {simulation.frame}")
+    print(f"Images par seconde : {simulation.frame / elapsed:.0f}")
+    print(f"Collisions : {simulation.hits}, sauts : {simulation.jumps}, "
+          f"obstacles franchis : {simulation.clears}")
+    print(f"Points : {simulation.player.points}, "
+          f"niveau : {simulation.rules.level}")
+    print("\n".join(simulation.scheduler.report()))
+
+    if args.replay:
+        if recording.matches(simulation):
+            print("Reprise identique à l'enregistrement")
+        else:
+            print("Reprise DIFFÉRENTE de l'enregistrement : "
+                  f"{recording.points} points, niveau {recording.level}")
+            return 1
+    elif args.record:
+        print(f"Session enregistrée : {args.record}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
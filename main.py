@@ -1,11 +1,10 @@
 """
 Module principal pour le jeu Ski Alpin 2D.
 
-Ce module initialise le jeu, la fenêtre, le joueur et les obstacles, puis
-exécute la boucle principale du jeu qui gère :
+Ce module initialise le jeu, la fenêtre et la simulation, puis exécute la
+boucle principale du jeu qui gère :
     - La gestion des entrées et des événements de sortie
-    - La mise à jour de l'état du jeu et du joueur
-    - La détection de collision et la gestion des obstacles
+    - L'avancement de la simulation (joueur, obstacles, collisions)
     - L'affichage du joueur, des obstacles et de l'interface
     - Le contrôle du nombre d'images par seconde (FPS)
 
@@ -13,128 +12,504 @@ Classes:
     Game : Gestion de l'état du jeu, des entrées, des collisions,
         des sons, de la musique et du temps.
     Window : Gestion du rendu à l'écran.
-    Player : Représente le joueur avec ses mouvements,
-        sa logique de saut et ses points.
-    Obstacle : Représente les rochers et arbres que le joueur rencontre.
+    Simulation : Cœur du jeu sans pygame (joueur, obstacles, collisions,
+        points et niveaux), avancé une image à la fois.
+    AssetLoader : Chargement en arrière-plan des sons et des images de la
+        partie pendant l'affichage de l'écran de démarrage.
+
+Options de la ligne de commande:
+    --dirty-rects : Rendu par rectangles modifiés au lieu de mettre à jour
+        tout l'écran à chaque image.
+    --stats : Affiche des statistiques de rendu, des images du saut et des
+        réserves d'obstacles à la fermeture du jeu.
+    --logic-hz : Nombre de pas de logique par seconde (120 par défaut).
+    --fps : Nombre maximal d'images affichées par seconde (120 par défaut,
+        par exemple 60 ou 144, 0 pour ne pas limiter).
+    --pacing : Façon d'attendre l'image suivante : sleep (mise en veille),
+        busy (attente active) ou hybrid (veille puis attente active, par
+        défaut).
+    --vsync : Demande la synchronisation verticale à l'affichage.
+    --scale : Facteur d'échelle du rendu (1 par défaut). L'écran est
+        dessiné à la taille de la fenêtre multipliée par ce facteur, puis
+        agrandi par SDL; la partie elle-même ne change pas.
+    --idle-timeout : Délai maximal (ms) de l'attente d'un événement dans
+        les menus (250 par défaut, 0 pour cadencer les menus comme la
+        partie).
+    --power-stats : Affiche à la fermeture du jeu le temps processeur et
+        les réveils par seconde dans les menus et pendant la partie.
+    --frame-histogram : Affiche l'histogramme des intervalles entre
+        images à la fermeture du jeu.
+    --profile : Mesure la durée de chaque phase des images dès le
+        lancement. La touche F3 affiche ou masque le résumé à l'écran.
+    --profile-csv : Fichier CSV où écrire les dernières mesures à la
+        fermeture du jeu (active --profile).
+    --no-sprite-cache : Décode et redimensionne les images à chaque
+        lancement au lieu de les lire dans le cache (.cache/sprites).
+    --audio-frequency, --audio-buffer, --audio-channels : Configuration
+        du mélangeur audio (44100 Hz, 512 échantillons, stéréo par défaut).
+    --audio-latency : Affiche la latence estimée des effets sonores à la
+        fermeture du jeu.
+    --input-latency : Affiche à la fermeture du jeu le délai entre les
+        appuis sur les touches et leur prise en compte par la logique.
+    --no-sound-cache : Décode les effets sonores à chaque lancement au lieu
+        de les lire dans le cache PCM (.cache/sounds).
+    --seed : Graine des obstacles (aléatoire par défaut).
+    --no-course : Replace les obstacles au hasard au lieu de suivre une
+        piste construite par tronçons, avec un passage garanti.
+    --mask-collision : Teste les collisions au pixel près, avec des
+        masques précalculés, lorsque les rectangles de collision se
+        chevauchent.
+    --jump-angle-step : Pas de l'angle des images précalculées du saut en
+        degrés (5 par défaut) : un pas plus petit donne une rotation plus
+        fluide mais plus d'images en mémoire.
+    --record : Enregistre la session (graine et touches de chaque pas)
+        dans un fichier, à la fermeture du jeu.
+    --replay : Rejoue une session enregistrée à l'écran.
 """
+import argparse
+import random
+from classes.ActivityMonitor import ActivityMonitor
+from classes.AssetLoader import AssetLoader
 from classes.Game import Game
 from classes.Window import Window
-from classes.Player import Player
-from classes.Obstacle import Obstacle
+from classes.Simulation import Simulation
+from classes.FixedTimestep import FixedTimestep
+from classes.FrameProfiler import FrameProfiler
+from classes.FramePacer import FramePacer, MODES
+from classes.Recording import Recording
+from classes.SpriteCache import SpriteCache
+from classes.SoundCache import SoundCache
 
+# Phases mesurées par le profileur, dans l'ordre de la boucle principale
+PROFILER_PHASES = (
+    "input", "player", "obstacles", "draw", "hud", "decor", "flip", "wait"
+)
 
-def main():
-    """Initialise et lance la boucle principale du jeu.
 
-    Cette fonction crée les objets du jeu (Game, Window, Player, Obstacle),
-    puis entre dans la boucle principale.
+def parse_args(argv=None):
+    """Analyse les options de la ligne de commande.
 
-    La boucle se termine lorsque l'utilisateur quitte ou que le joueur n'a plus
-    de vies.
+    Args:
+        argv (list[str] | None): Arguments à analyser. Par défaut, ceux
+            de la ligne de commande.
+
+    Returns:
+        argparse.Namespace: Options du jeu.
     """
-    width = 1400
-    height = 750
-    obstacles = []
-    rocks = 3
-    trees = 4
+    parser = argparse.ArgumentParser(description="Ski Alpin 2D")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="ne présente que les zones modifiées de l'écran"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="affiche des statistiques de rendu, des images du saut et "
+             "des réserves d'obstacles à la fermeture"
+    )
+    parser.add_argument(
+        "--logic-hz",
+        type=int,
+        default=120,
+        help="pas de logique par seconde (vitesses réglées pour 120)"
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=120,
+        help="images affichées par seconde au maximum, par exemple 60, 120 "
+             "ou 144 (0 : illimité)"
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=MODES,
+        default="hybrid",
+        help="attente de l'image suivante : mise en veille, attente active "
+             "ou veille puis attente active (par défaut)"
+    )
+    parser.add_argument(
+        "--vsync",
+        action="store_true",
+        help="demande la synchronisation verticale"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=250,
+        metavar="MS",
+        help="dans les menus, attend un événement au plus MS ms au lieu de "
+             "cadencer les images (0 : cadence de la partie)"
+    )
+    parser.add_argument(
+        "--power-stats",
+        action="store_true",
+        help="affiche le temps processeur et les réveils par seconde dans "
+             "les menus et pendant la partie à la fermeture"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="facteur d'échelle du rendu, par exemple 0.5 pour dessiner "
+             "en 700x375 et agrandir à la fenêtre"
+    )
+    parser.add_argument(
+        "--frame-histogram",
+        action="store_true",
+        help="affiche l'histogramme des intervalles entre images à la "
+             "fermeture"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="mesure la durée de chaque phase des images (F3 : résumé)"
+    )
+    parser.add_argument(
+        "--profile-csv",
+        metavar="FICHIER",
+        help="écrit les dernières mesures du profileur en CSV à la fermeture"
+    )
+    parser.add_argument(
+        "--no-sprite-cache",
+        action="store_true",
+        help="n'utilise pas le cache des images redimensionnées"
+    )
+    parser.add_argument(
+        "--audio-frequency",
+        type=int,
+        default=44100,
+        help="fréquence du mélangeur audio en Hz"
+    )
+    parser.add_argument(
+        "--audio-buffer",
+        type=int,
+        default=512,
+        help="taille du tampon audio en échantillons (latence)"
+    )
+    parser.add_argument(
+        "--audio-channels",
+        type=int,
+        choices=(1, 2),
+        default=2,
+        help="nombre de canaux audio"
+    )
+    parser.add_argument(
+        "--audio-latency",
+        action="store_true",
+        help="affiche la latence estimée des effets sonores à la fermeture"
+    )
+    parser.add_argument(
+        "--input-latency",
+        action="store_true",
+        help="affiche le délai entre les appuis et leur prise en compte"
+    )
+    parser.add_argument(
+        "--no-sound-cache",
+        action="store_true",
+        help="n'utilise pas le cache des sons décodés"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="graine des obstacles (aléatoire par défaut)"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FICHIER",
+        help="enregistre la session dans un fichier à la fermeture"
+    )
+    parser.add_argument(
+        "--no-course",
+        action="store_true",
+        help="replace les obstacles au hasard au lieu de suivre une piste "
+             "construite par tronçons"
+    )
+    parser.add_argument(
+        "--mask-collision",
+        action="store_true",
+        help="teste les collisions au pixel près lorsque les rectangles "
+             "se chevauchent"
+    )
+    parser.add_argument(
+        "--jump-angle-step",
+        type=float,
+        default=5,
+        metavar="DEGRÉS",
+        help="pas de l'angle des images du saut : plus petit, la rotation "
+             "est plus fluide et la table plus grande"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FICHIER",
+        help="rejoue une session enregistrée"
+    )
+    args = parser.parse_args(argv)
+    if args.scale <= 0:
+        parser.error("--scale doit être positif")
+    if not 0 < args.jump_angle_step <= 360:
+        parser.error("--jump-angle-step doit être compris entre 0 et 360")
+    return args
+
+
+def create_simulation(window, game, seed, course=True):
+    """Crée la simulation avec les images de la partie.
+
+    Args:
+        window (Window): Fenêtre dont les images de la partie sont chargées.
+        game (Game): Règles du jeu, qui jouent aussi les sons.
+        seed (int): Graine des obstacles.
+        course (bool): Place les obstacles selon une piste construite par
+            tronçons.
 
-    game = Game()
-    window = Window(width, height)
-    player = Player(
+    Returns:
+        Simulation: Simulation de la partie.
+    """
+    return Simulation(
         window.width,
         window.height,
         window.left_limit,
         window.right_limit,
         window.skier_left,
-        window.skier_right
+        window.skier_right,
+        window.rock,
+        window.tree,
+        rules=game,
+        seed=seed,
+        course=course
     )
 
-    # Création des rochers
-    for i in range(rocks):
-        obs = Obstacle(
-            window.height,
-            window.left_limit,
-            window.right_limit,
-            window.rock,
-            True
-        )
-        obstacles.append(obs)
-
-    # Création des arbres
-    for i in range(trees):
-        obs = Obstacle(
-            window.height,
-            window.left_limit,
-            window.right_limit,
-            window.tree,
-            False
-        )
-        obstacles.append(obs)
+
+def main(argv=None):
+    """Initialise et lance la boucle principale du jeu.
+
+    Cette fonction crée les objets du jeu (Game, Window, Simulation),
+    puis entre dans la boucle principale.
+
+    La boucle se termine lorsque l'utilisateur quitte ou que le joueur n'a plus
+    de vies.
+
+    Args:
+        argv (list[str] | None): Options de la ligne de commande.
+    """
+    args = parse_args(argv)
+    width = 1400
+    height = 750
+
+    # Une session rejouée reprend la graine et la fréquence enregistrées
+    replay = Recording.load(args.replay) if args.replay else None
+    if replay is not None:
+        seed = replay.seed
+        logic_hz = replay.logic_hz
+        course = replay.course
+        masks = replay.masks
+    else:
+        seed = args.seed if args.seed is not None else random.getrandbits(63)
+        logic_hz = args.logic_hz
+        course = not args.no_course
+        masks = args.mask_collision
+    if args.record:
+        recording = Recording(seed, logic_hz, course, masks)
+    else:
+        recording = None
+
+    # Seules les ressources de l'écran de démarrage sont chargées avant la
+    # première image; les sons et les images de la partie le sont pendant
+    # que l'écran de démarrage est affiché.
+    loader = AssetLoader()
+    game = Game(
+        loader,
+        frequency=args.audio_frequency,
+        buffer=args.audio_buffer,
+        channels=args.audio_channels,
+        sound_cache=None if args.no_sound_cache else SoundCache(),
+        latency_probe=args.audio_latency
+    )
+    window = Window(
+        width,
+        height,
+        jump_angle_step=args.jump_angle_step,
+        dirty_rects=args.dirty_rects,
+        sprite_cache=None if args.no_sprite_cache else SpriteCache(),
+        loader=loader,
+        mask_collision=masks,
+        vsync=args.vsync,
+        scale=args.scale
+    )
+    simulation = None
+    player = None
+    timestep = FixedTimestep(logic_hz)
+    pacer = FramePacer(args.fps, args.pacing)
+    activity = ActivityMonitor()
+    profiler = FrameProfiler(
+        PROFILER_PHASES, enabled=args.profile or bool(args.profile_csv))
 
     # Boucle principale du jeu
     quit = False
     while not quit:
-        dt = game.clock.get_time() / 1000  # Temps écoulé en secondes
+        profiler.begin_frame()
+        in_menu = not game.started or simulation.game_over
+        activity.tick("menus" if in_menu else "partie")
+        frame_time = pacer.frame_time  # Temps écoulé en secondes
 
         if quit := game.check_quit_event():
             continue
 
-        game.update_level(player.points)
-        game.get_key_pressed()
+        if game.check_profiler_toggled():
+            profiler.toggle_overlay()
+        if game.input.exposed:
+            window.expose()
+        profiler.mark("input")
 
         if not game.started:
             window.show_start_screen()
-            game.check_game_started()
+            profiler.mark("draw")
+            if replay is not None:
+                game.start_game()
+            else:
+                game.check_game_started()
+            if game.started:
+                window.finish_loading()
+                game.narrow_phase = window.collision_masks
+                simulation = create_simulation(window, game, seed, course)
+                simulation.profiler = profiler
+                player = simulation.player
+                timestep.reset()
+            game.input.consume(record=False)
+            profiler.mark("input")
 
-        elif player.lives == 0:
+        elif simulation.game_over:
             window.show_game_over_screen(game.level, player.points)
-            if game.restart_game():
-                player.reset()
-                player.update_state(dt)
+            profiler.mark("draw")
+            if replay is not None:
+                restart = replay.restart_next()
+                if restart:
+                    game.reset_game()
+            else:
+                restart = game.restart_game()
+
+            if restart:
+                simulation.restart(timestep.dt)
+                timestep.reset()
+                if recording is not None:
+                    recording.record_restart()
+            game.input.consume(record=False)
+            profiler.mark("input")
 
         else:
-            window.display.fill(window.snow_color)
-
-            # Mettre à jour le joueur selon les entrées et sa position
-            player.input(game.keys)
-            player.update_state(dt)
-
-            # Mettre à jour les obstacles
-            for obs in obstacles:
-                obs.update_rect()
-                collision = game.check_collision(window, player, obs)
-
-                if collision == "jumped":
-                    player.obstacle_jumped()
-                    game.obstacle_jumped()
-
-                elif collision == "hit":
-                    player.obstacle_hit()
-                    game.obstacle_hit(player.lives)
-
-                if game.check_obstacle_cleared(
-                    player.y,
-                    obs.y,
-                    obs.cleared
-                ):
-                    obs.set_cleared()
-                    if not player.invincible:
-                        player.obstacle_cleared()
-                        game.obstacle_cleared()
-
-                obs.update_position(game.speed)
-                window.draw(obs.image, obs.x, obs.y)
-
-            # Affichage du joueur, de l'état de la partie
-            # et des arbres en bordure de fenêtre
-            window.draw_player(player)
+            # Pas de logique à durée fixe : joueur, obstacles, points et
+            # niveau. Le décor défile de la distance parcourue à l'affichage
+            scrolled = 0
+            for step in range(timestep.advance(frame_time)):
+                keys = game.keys
+                if replay is not None:
+                    keys = replay.next_keys()
+                    if keys is None:
+                        break
+                simulation.step(keys, timestep.dt)
+                if recording is not None:
+                    recording.record_step(keys)
+                # Les appuis brefs restent actifs jusqu'ici
+                game.input.consume()
+                scrolled += game.speed
+                if simulation.game_over:
+                    break
+
+            # Affichage interpolé entre les deux derniers pas de logique
+            alpha = timestep.alpha
+            window.clear_background()
+
+            for obs, x, y in simulation.interpolated_obstacles(alpha):
+                window.draw(obs.image, x, y)
+
+            # Affichage du joueur, des arbres en bordure de fenêtre
+            # et de l'état de la partie
+            window.draw_player(player, simulation.interpolated_player(alpha))
+            profiler.mark("draw")
+            window.scroll_side_obstacles(scrolled)
+            window.draw_side_obstacles(
+                window.interpolated_side_offset(game.speed, alpha))
+            profiler.mark("decor")
             window.update_status(game.level, player.lives, player.points)
-            window.update_side_obstacles(game.speed)
+
+        if profiler.overlay:
+            window.show_overlay(profiler.summary() + pacer.summary())
+        profiler.mark("hud")
 
         # Mise à jour de l'affichage et contrôle du framerate
         window.flip()
-        game.clock.tick(120)
+        loader.frame_presented()
+        profiler.mark("flip")
+        # Hors partie, le processus dort jusqu'au prochain événement; une
+        # session rejouée n'attend pas de touche
+        idle = args.idle_timeout > 0 and replay is None and (
+            not game.started or simulation.game_over)
+        if idle:
+            game.input.wait(args.idle_timeout / 1000)
+            pacer.reset()
+        else:
+            pacer.wait()
+        profiler.mark("wait")
+        profiler.end_frame()
+
+        if replay is not None and replay.finished:
+            quit = True
+
+    if args.stats:
+        print(
+            f"Pixels présentés par image : "
+            f"{window.average_pixels_pushed():.0f}"
+        )
+        print(f"Écrans de menu : {window.screens_composed} composés, "
+              f"{window.frames_skipped} images sans présentation")
+        print("Préparation des images :")
+        print("\n".join(f"  {line}" for line in window.assets.report()))
+        sprite_table = window.sprite_table
+        frames = sum(len(table) for table in sprite_table.tables.values())
+        print(f"Images du saut : {frames} images au pas de "
+              f"{sprite_table.angle_step:g}°, "
+              f"{sprite_table.memory_usage() / 1024:.0f} Kio")
+        if simulation is not None:
+            print("\n".join(simulation.scheduler.report()))
+        if window.collision_masks is not None:
+            masks = window.collision_masks
+            print(f"Tests au pixel près : {masks.tests}, "
+                  f"dont {masks.rejected} sans contact")
+
+    if recording is not None:
+        if simulation is not None:
+            recording.finish(simulation)
+        recording.save(args.record)
+        print(f"Session enregistrée : {args.record} "
+              f"({recording.steps} pas, graine {recording.seed})")
+
+    if replay is not None and simulation is not None:
+        if replay.matches(simulation):
+            verdict = "identique à l'enregistrement"
+        else:
+            verdict = "DIFFÉRENT de l'enregistrement"
+        print(f"Reprise : {player.points} points, niveau {game.level} "
+              f"({verdict})")
+
+    if args.audio_latency:
+        print("\n".join(game.latency_probe.report()))
+
+    if args.input_latency:
+        print("\n".join(game.input.report()))
+
+    if args.frame_histogram:
+        print("\n".join(pacer.report()))
+
+    activity.tick(None)
+    if args.power_stats:
+        print("\n".join(activity.report()))
+
+    if args.profile_csv:
+        profiler.write_csv(args.profile_csv)
 
+    if simulation is not None:
+        simulation.close()
+    loader.shutdown()
     game.quit()
 
 
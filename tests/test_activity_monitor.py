@@ -0,0 +1,56 @@
+import unittest
+from classes.ActivityMonitor import ActivityMonitor
+
+
+class TestActivityMonitor(unittest.TestCase):
+    """Tests unitaires pour la classe ActivityMonitor."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.cpu = 0.0
+        self.monitor = ActivityMonitor(clock=lambda: self.now,
+                                       cpu_clock=lambda: self.cpu)
+
+    def advance(self, elapsed, cpu):
+        self.now += elapsed
+        self.cpu += cpu
+
+    def test_time_attributed_to_previous_mode(self):
+        self.monitor.tick("menus")
+        for i in range(4):
+            self.advance(0.25, 0.001)
+            self.monitor.tick("menus")
+        self.advance(0.25, 0.001)
+        self.monitor.tick("partie")
+        for i in range(120):
+            self.advance(1 / 120, 0.004)
+            self.monitor.tick("partie")
+        self.monitor.tick(None)
+
+        elapsed, cpu, wakes = self.monitor.totals["menus"]
+        self.assertAlmostEqual(elapsed, 1.25)
+        self.assertAlmostEqual(cpu, 0.005)
+        self.assertEqual(wakes, 5)
+        elapsed, cpu, wakes = self.monitor.totals["partie"]
+        self.assertAlmostEqual(elapsed, 1.0)
+        self.assertEqual(wakes, 121)
+
+    def test_stopped_monitor_ignores_time(self):
+        self.monitor.tick("menus")
+        self.advance(1.0, 0.1)
+        self.monitor.tick(None)
+        self.advance(5.0, 1.0)
+        self.monitor.tick(None)
+        self.assertEqual(self.monitor.totals["menus"], [1.0, 0.1, 1])
+
+    def test_report(self):
+        self.assertEqual(self.monitor.report(), [])
+        self.monitor.tick("menus")
+        self.advance(2.0, 0.1)
+        self.monitor.tick(None)
+        self.assertEqual(self.monitor.report(),
+                         ["menus : 2.0 s, processeur 5.0%, 0.5 réveils/s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
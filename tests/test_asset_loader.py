@@ -0,0 +1,61 @@
+import threading
+import unittest
+from unittest.mock import patch
+from classes.AssetLoader import AssetLoader
+
+
+class TestAssetLoader(unittest.TestCase):
+    """Tests unitaires pour la classe AssetLoader."""
+
+    def setUp(self):
+        self.loader = AssetLoader(workers=2, verbose=False)
+        self.addCleanup(self.loader.shutdown)
+
+    def test_result(self):
+        self.loader.submit("sum", sum, [1, 2, 3])
+        self.assertEqual(self.loader.result("sum"), 6)
+        self.assertEqual(self.loader.pending(), [])
+
+    def test_wait_only_for_pending(self):
+        release = threading.Event()
+        self.loader.submit("fast", int, "1")
+        self.loader.result("fast")
+        self.loader.submit("slow", release.wait)
+
+        self.assertEqual(self.loader.pending(), ["slow"])
+        threading.Timer(0.05, release.set).start()
+        waited = self.loader.wait()
+        self.assertGreater(waited, 0.0)
+        self.assertEqual(self.loader.pending(), [])
+        self.assertGreaterEqual(self.loader.wait_time, waited)
+
+    def test_errors_are_raised_by_result(self):
+        self.loader.submit("error", int, "x")
+        with self.assertRaises(ValueError):
+            self.loader.result("error")
+
+    def test_frame_presented_records_times(self):
+        release = threading.Event()
+        self.loader.submit("slow", release.wait)
+        self.loader.frame_presented()
+        first_frame = self.loader.first_frame_time
+        self.assertIsNotNone(first_frame)
+        self.assertIsNone(self.loader.load_time)
+
+        release.set()
+        self.loader.wait()
+        self.loader.frame_presented()
+        self.assertEqual(self.loader.first_frame_time, first_frame)
+        self.assertEqual(self.loader.load_time, self.loader.finished["slow"])
+
+    def test_log(self):
+        loader = AssetLoader(workers=1)
+        self.addCleanup(loader.shutdown)
+        with patch("builtins.print") as mock_print:
+            loader.frame_presented()
+        self.assertEqual(mock_print.call_count, 2)
+        self.assertIn("Première image", mock_print.call_args_list[0].args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
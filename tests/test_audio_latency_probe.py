@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import Mock
+from classes.AudioLatencyProbe import AudioLatencyProbe
+
+
+class TestAudioLatencyProbe(unittest.TestCase):
+    """Tests unitaires pour la classe AudioLatencyProbe."""
+
+    def test_buffer_latency(self):
+        probe = AudioLatencyProbe(44100, 441)
+        self.assertAlmostEqual(probe.buffer_latency, 0.01)
+
+    def test_play_records_delay(self):
+        probe = AudioLatencyProbe(44100, 512)
+        sound = Mock()
+        probe.play("obstacle_hit", sound, 0.0)
+        sound.play.assert_called_once()
+        self.assertEqual(len(probe.samples["obstacle_hit"]), 1)
+        self.assertGreater(probe.samples["obstacle_hit"][0], 0.0)
+
+    def test_samples_are_bounded(self):
+        probe = AudioLatencyProbe(44100, 512, capacity=3)
+        for i in range(5):
+            probe.play("obstacle_hit", Mock(), 0.0)
+        self.assertEqual(len(probe.samples["obstacle_hit"]), 3)
+        self.assertEqual(probe.counts["obstacle_hit"], 5)
+
+    def test_report(self):
+        probe = AudioLatencyProbe(1000, 10)
+        probe.samples = {"obstacle_jumped": [0.001, 0.003]}
+        probe.counts = {"obstacle_jumped": 2}
+        self.assertEqual(probe.report(), [
+            "Tampon du mélangeur : 10.0 ms",
+            "obstacle_jumped : 2 sons, latence estimée 12.0 ms (max 13.0 ms)"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import csv
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from batch import (load_policy, main, play, run_batch, run_seeds,
+                   survival_curve)
+from classes.DodgePolicy import DodgePolicy
+
+
+class TestBatch(unittest.TestCase):
+    """Tests unitaires du simulateur par lots."""
+
+    def test_load_policy(self):
+        self.assertIs(load_policy("dodge"), DodgePolicy)
+        self.assertIs(load_policy("classes.DodgePolicy:DodgePolicy"),
+                      DodgePolicy)
+        with self.assertRaises(ValueError):
+            load_policy("unknown")
+        with self.assertRaises(ValueError):
+            load_policy("classes.DodgePolicy:Missing")
+
+    def test_play_is_reproducible(self):
+        first = play("dodge", 5, 20000)
+        self.assertEqual(play("dodge", 5, 20000), first)
+        self.assertEqual(len(first["level_frames"]), first["level"])
+        self.assertEqual(first["level_frames"],
+                         sorted(first["level_frames"]))
+
+    def test_play_stops_at_max_frames(self):
+        result = play("dodge", 1, 100)
+        self.assertEqual(result["frames"], 100)
+
+    def test_seeds_depend_only_on_batch_seed(self):
+        self.assertEqual(run_seeds(5, 3), run_seeds(5, 3))
+        self.assertEqual(run_seeds(5, 3)[:2], run_seeds(2, 3))
+
+    def test_processes_do_not_change_results(self):
+        """Le lot donne les mêmes parties, réparti ou non."""
+        local = list(run_batch(4, "random", seed=2, max_frames=3000,
+                               processes=1))
+        pooled = list(run_batch(4, "random", seed=2, max_frames=3000,
+                                processes=2))
+        key = (lambda result: result["seed"])
+        self.assertEqual(sorted(local, key=key), sorted(pooled, key=key))
+
+    def test_survival_curve(self):
+        results = [
+            {"level_frames": [0]},
+            {"level_frames": [0, 100]},
+            {"level_frames": [0, 300, 900]},
+            {"level_frames": [0, 200]},
+        ]
+        self.assertEqual(survival_curve(results), [
+            (1, 4, 1.0, 0),
+            (2, 3, 0.75, 200),
+            (3, 1, 0.25, 900),
+        ])
+
+    def test_main_writes_csv(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "runs.csv")
+        with redirect_stdout(StringIO()) as output:
+            code = main(["--runs", "3", "--seed", "1", "--max-frames",
+                         "2000", "--processes", "1", "--no-course",
+                         "--output", path])
+        self.assertEqual(code, 0)
+        self.assertIn("survie", output.getvalue())
+        with open(path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["level_frames"].split()[0], "0")
+
+    def test_main_rejects_empty_batch(self):
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            main(["--runs", "0"])
+        self.assertEqual(survival_curve([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
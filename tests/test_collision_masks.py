@@ -0,0 +1,72 @@
+import unittest
+from types import SimpleNamespace
+import pygame
+from classes.CollisionMasks import CollisionMasks
+from classes.SpriteTable import SpriteTable
+
+
+def disc(size):
+    """Crée une image transparente avec un disque opaque au centre."""
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255, 0, 0), (size // 2, size // 2), size // 4)
+    return image
+
+
+class TestCollisionMasks(unittest.TestCase):
+    """Tests unitaires pour la classe CollisionMasks."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.skier = disc(40)
+        self.rock = disc(40)
+        self.table = SpriteTable(angle_step=10)
+        self.masks = CollisionMasks(self.table)
+        self.masks.build((self.skier,), (self.rock,))
+        self.player = SimpleNamespace(
+            image=self.skier, x=100, y=100, jumping=False, angle=0.0)
+
+    def obstacle(self, x, y):
+        return SimpleNamespace(image=self.rock, x=x, y=y)
+
+    def test_build_masks_every_frame(self):
+        self.assertIn(self.skier, self.masks.masks)
+        self.assertIn(self.rock, self.masks.masks)
+        self.assertEqual(len(self.masks.frames[self.skier]), 36)
+        self.assertNotIn(self.rock, self.masks.frames)
+
+    def test_transparent_corners_do_not_collide(self):
+        # Les images se chevauchent, pas les disques
+        self.assertFalse(self.masks(self.player, self.obstacle(125, 125)))
+        self.assertEqual(self.masks.rejected, 1)
+
+    def test_opaque_pixels_collide(self):
+        self.assertTrue(self.masks(self.player, self.obstacle(115, 100)))
+        self.assertEqual(self.masks.tests, 1)
+        self.assertEqual(self.masks.rejected, 0)
+
+    def test_jump_frame_is_centered(self):
+        # À 180°, l'image du saut est deux fois plus grande : le disque
+        # agrandi touche un obstacle que le disque normal ne touche pas
+        obstacle = self.obstacle(120, 120)
+        self.player.jumping = True
+        self.player.angle = 180
+        self.assertTrue(self.masks(self.player, obstacle))
+
+        self.player.angle = 0
+        self.assertFalse(self.masks(self.player, obstacle))
+
+    def test_image_without_mask_keeps_rect_result(self):
+        other = SimpleNamespace(image=disc(40), x=125, y=125)
+        self.assertTrue(self.masks(self.player, other))
+        self.assertEqual(self.masks.tests, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
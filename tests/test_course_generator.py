@@ -0,0 +1,127 @@
+import itertools
+import unittest
+from classes.CourseGenerator import CourseGenerator
+
+SIZES = {True: (90, 60), False: (70, 70)}
+
+
+def make_generator(**kwargs):
+    """Crée un générateur aux dimensions du jeu."""
+    return CourseGenerator(100, 1200, 750, SIZES, chunk_height=1500,
+                           **kwargs)
+
+
+def has_path(generator, chunks):
+    """Cherche un passage pixel par pixel, indépendamment des couloirs.
+
+    Le skieur descend de 12.5 pixels par étape et se déplace d'au plus
+    5 pixels de côté (pente 0.4), entre les limites de la piste.
+    """
+    obstacles = [
+        (x + 10, y + 10, SIZES[jump][0] - 20, SIZES[jump][1] - 20)
+        for top, placements in chunks
+        for x, y, jump, level in placements
+    ]
+    top = chunks[0][0]
+    bottom = chunks[-1][0] + generator.chunk_height
+    xs = range(generator.left_limit + 1, generator.right_limit, 5)
+    reach = set(xs)
+
+    y = top
+    while y < bottom and reach:
+        near = [o for o in obstacles if o[1] < y + 90 and y + 10 < o[1] + o[3]]
+        free = {
+            x for x in xs
+            if not any(o[0] < x + 90 and x + 10 < o[0] + o[2] for o in near)
+        }
+        reach = {x + dx for x in reach for dx in (-5, 0, 5)} & free
+        y += 12.5
+    return bool(reach)
+
+
+class TestCourseGenerator(unittest.TestCase):
+    """Tests unitaires pour la classe CourseGenerator."""
+
+    def test_chunks_follow_each_other(self):
+        generator = make_generator(seed=1)
+        chunks = list(itertools.islice(generator.course(), 5))
+        self.assertEqual([top for top, placements in chunks],
+                         [750, 2250, 3750, 5250, 6750])
+        self.assertEqual(generator.chunks, 5)
+
+        for top, placements in chunks:
+            self.assertEqual(placements, sorted(placements,
+                                                key=lambda p: p[1]))
+            for x, y, jump_allowed, level in placements:
+                self.assertTrue(150 <= x <= 1150)
+                self.assertGreaterEqual(y, top + generator.clearance)
+                self.assertLessEqual(y + SIZES[jump_allowed][1], top + 1500)
+
+    def test_obstacles_are_spaced(self):
+        generator = make_generator(seed=2)
+        for top, placements in itertools.islice(generator.course(), 5):
+            for a, b in itertools.combinations(placements, 2):
+                (ax, ay, aj, _), (bx, by, bj, _) = a, b
+                aw, ah = SIZES[aj]
+                bw, bh = SIZES[bj]
+                self.assertFalse(
+                    ax - 20 < bx + bw and bx < ax + aw + 20
+                    and ay - 20 < by + bh and by < ay + ah + 20
+                )
+
+    def test_levels(self):
+        generator = make_generator(extra_per_level=2, max_extra=4)
+        self.assertEqual(
+            generator.levels(),
+            [(True, 1)] * 3 + [(False, 1)] * 4
+            + [(True, 2), (True, 2), (False, 2), (False, 2)]
+            + [(True, 3), (True, 3), (False, 3), (False, 3)]
+        )
+        self.assertEqual(len(make_generator(extra_per_level=0).levels()), 7)
+
+    def test_wall_is_not_passable(self):
+        generator = make_generator()
+        blocked = [0] * generator.rows
+        # Un couloir de plus par rangée, depuis le premier
+        self.assertEqual(
+            generator.passable(blocked, 1, generator.all_lanes),
+            (1 << (generator.rows + 1)) - 1)
+
+        # Un mur d'arbres sur toute la largeur de la piste
+        for x in range(150, 1200, 70):
+            generator.block(blocked, x, 500, 70, 70)
+        self.assertEqual(
+            generator.passable(blocked, generator.all_lanes,
+                               generator.all_lanes), 0)
+
+    def test_lane_change_needs_free_lanes(self):
+        generator = make_generator()
+        self.assertEqual(generator.passable([0], 0b0001, 0b1111), 0b0011)
+        # Le couloir voisin était bloqué à la rangée précédente
+        self.assertEqual(generator.passable([0], 0b0001, 0b1101), 0b0001)
+        # Le couloir atteint est bloqué : le skieur s'écarte
+        self.assertEqual(generator.passable([0b0010], 0b0010, 0b1111),
+                         0b0101)
+
+    def test_every_level_has_a_path(self):
+        """Chaque niveau garde un passage, vérifié pixel par pixel."""
+        generator = make_generator(seed=3)
+        wall = [(x, 1200, False, 1) for x in range(100, 1200, 70)]
+        self.assertFalse(has_path(generator, [(750, wall)]))
+
+        chunks = list(itertools.islice(generator.course(), 3))
+        for level in (1, 4, 11):
+            visible = [
+                (top, [p for p in placements if p[3] <= level])
+                for top, placements in chunks
+            ]
+            self.assertTrue(has_path(generator, visible), f"niveau {level}")
+
+    def test_same_seed_same_course(self):
+        first = list(itertools.islice(make_generator(seed=4).course(), 3))
+        second = list(itertools.islice(make_generator(seed=4).course(), 3))
+        self.assertEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
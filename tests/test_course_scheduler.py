@@ -0,0 +1,101 @@
+import random
+import unittest
+from types import SimpleNamespace
+from classes.CourseScheduler import CourseScheduler
+from classes.HeadlessSprite import HeadlessSprite
+from classes.Obstacle import Obstacle
+from classes.ObstaclePool import ObstaclePool
+
+
+class FakeStream:
+    """Tronçons fixes, sans fil d'exécution."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.generator = SimpleNamespace(start=750, chunk_height=1500,
+                                         blocking=0, unplaced=0)
+        self.consumed = 0
+        self.wait_time = 0.0
+
+    def next_chunk(self):
+        self.consumed += 1
+        return next(self.chunks)
+
+
+def make_pool(image, jump_allowed):
+    rng = random.Random(1)
+    return ObstaclePool(
+        lambda: Obstacle(750, 100, 1200, image, jump_allowed, rng), 5)
+
+
+class TestCourseScheduler(unittest.TestCase):
+    """Tests unitaires pour la classe CourseScheduler."""
+
+    def setUp(self):
+        self.stream = FakeStream([
+            (750, [(200, 900, True, 1), (400, 1400, False, 2),
+                   (600, 2000, False, 1)]),
+            (2250, [(300, 2500, True, 1)]),
+        ])
+        self.rocks = make_pool(HeadlessSprite(90, 60), True)
+        self.trees = make_pool(HeadlessSprite(70, 70), False)
+        self.scheduler = CourseScheduler(
+            {"rochers": self.rocks, "arbres": self.trees},
+            self.stream, 1500)
+
+    def test_spawn_at_horizon(self):
+        self.assertTrue(self.scheduler.due(1, 0))
+        spawned = self.scheduler.spawn(1, 0)
+
+        # Seuls les obstacles à moins de 1500 pixels du haut de l'écran
+        # entrent en jeu; celui du niveau 2 est ignoré
+        self.assertEqual([(obs.x, obs.y, obs.jump_allowed)
+                          for obs in spawned], [(200, 900, True)])
+        self.assertEqual(self.scheduler.skipped, 1)
+        self.assertEqual(self.scheduler.next_y, 2000)
+        self.assertFalse(self.scheduler.due(1, 400))
+
+        spawned = self.scheduler.spawn(1, 600)
+        self.assertEqual([(obs.x, obs.y) for obs in spawned], [(600, 1400)])
+        self.assertEqual(self.stream.consumed, 1)
+
+        spawned = self.scheduler.spawn(1, 1100)
+        self.assertEqual([(obs.x, obs.y) for obs in spawned], [(300, 1400)])
+        self.assertEqual(self.stream.consumed, 2)
+
+    def test_retire_releases_course_obstacles(self):
+        spawned = self.scheduler.spawn(2, 0)
+        self.assertEqual(len(spawned), 2)
+        for obs in spawned:
+            self.assertTrue(self.scheduler.retire(obs, 2))
+        self.assertEqual((len(self.rocks), len(self.trees)), (0, 0))
+        other = Obstacle(750, 100, 1200, HeadlessSprite(70, 70), False)
+        self.assertFalse(self.scheduler.retire(other, 2))
+
+    def test_restore_reuses_received_chunks(self):
+        state = self.scheduler.state()
+        first = [(obs.x, obs.y) for obs in self.scheduler.spawn(1, 1000)]
+        self.assertEqual(self.stream.consumed, 2)
+
+        self.scheduler.set_state(state)
+        self.assertEqual(len(self.rocks) + len(self.trees), 0)
+        again = [(obs.x, obs.y) for obs in self.scheduler.spawn(1, 1000)]
+        self.assertEqual(again, first)
+        self.assertEqual(self.stream.consumed, 2)
+
+    def test_restore_forgotten_chunks(self):
+        scheduler = CourseScheduler(
+            {"rochers": self.rocks, "arbres": self.trees},
+            self.stream, 1500, history=1)
+        state = scheduler.state()
+        scheduler.spawn(1, 1000)
+        with self.assertRaises(ValueError):
+            scheduler.set_state(state)
+
+    def test_report(self):
+        self.scheduler.spawn(1, 0)
+        self.assertIn("1 tronçons", self.scheduler.report()[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
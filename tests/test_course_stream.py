@@ -0,0 +1,40 @@
+import itertools
+import time
+import unittest
+from classes.CourseGenerator import CourseGenerator
+from classes.CourseStream import CourseStream
+
+SIZES = {True: (90, 60), False: (70, 70)}
+
+
+class TestCourseStream(unittest.TestCase):
+    """Tests unitaires pour la classe CourseStream."""
+
+    def setUp(self):
+        self.generator = CourseGenerator(100, 1200, 750, SIZES, seed=1)
+        self.stream = CourseStream(self.generator, ahead=2)
+        self.addCleanup(self.stream.close)
+
+    def test_same_chunks_as_generator(self):
+        expected = list(itertools.islice(
+            CourseGenerator(100, 1200, 750, SIZES, seed=1).course(), 4))
+        self.assertEqual([self.stream.next_chunk() for i in range(4)],
+                         expected)
+        self.assertEqual(self.stream.consumed, 4)
+
+    def test_memory_is_bounded(self):
+        """Le fil ne construit que quelques tronçons d'avance."""
+        time.sleep(0.2)
+        # Deux tronçons dans la file, un en attente d'y entrer
+        self.assertLessEqual(self.generator.chunks, 3)
+        self.stream.next_chunk()
+        time.sleep(0.2)
+        self.assertLessEqual(self.generator.chunks, 4)
+
+    def test_close_stops_thread(self):
+        self.stream.close()
+        self.assertFalse(self.stream.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
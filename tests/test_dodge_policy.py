@@ -0,0 +1,52 @@
+import unittest
+from classes.DodgePolicy import DodgePolicy
+from classes.Simulation import Simulation
+
+
+class TestDodgePolicy(unittest.TestCase):
+    """Tests unitaires pour la classe DodgePolicy."""
+
+    def setUp(self):
+        self.simulation = Simulation.headless(seed=1, rocks=1, trees=0)
+        self.player = self.simulation.player
+        self.obstacle = self.simulation.obstacles[0]
+        self.policy = DodgePolicy(seed=1, error=0)
+
+    def place(self, dx, dy):
+        """Place l'obstacle par rapport au skieur, sans mettre à jour son
+        rectangle de collision (comme la simulation, loin du skieur)."""
+        self.obstacle.place(self.player.x + dx, self.player.y + dy)
+
+    def test_free_lane_returns_to_middle(self):
+        self.place(0, 600)
+        self.player.x = self.simulation.left_limit + 10
+        self.player.update_rect()
+        keys = self.policy(self.simulation)
+        self.assertTrue(keys["right"])
+        self.assertFalse(keys["space"])
+
+    def test_steers_away_from_obstacle(self):
+        self.place(40, 150)
+        keys = self.policy(self.simulation)
+        self.assertIs(self.policy.threat(self.simulation)[0], self.obstacle)
+        self.assertTrue(keys["left"])
+
+        self.place(-40, 150)
+        self.assertTrue(self.policy(self.simulation)["right"])
+
+    def test_jumps_close_rock(self):
+        self.place(0, 100)
+        self.assertTrue(self.policy(self.simulation)["space"])
+
+    def test_outlives_random_inputs(self):
+        """La politique scriptée survit plus longtemps qu'au hasard."""
+        from batch import play
+        dodge = sum(play("dodge", seed, 30000)["frames"]
+                    for seed in range(3))
+        random_ = sum(play("random", seed, 30000)["frames"]
+                      for seed in range(3))
+        self.assertGreater(dodge, 2 * random_)
+
+
+if __name__ == "__main__":
+    unittest.main()
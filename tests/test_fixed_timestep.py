@@ -0,0 +1,37 @@
+import unittest
+from classes.FixedTimestep import FixedTimestep
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Tests unitaires pour la classe FixedTimestep."""
+
+    def setUp(self):
+        self.timestep = FixedTimestep(logic_hz=100, max_steps=5)
+
+    def test_steps_do_not_depend_on_frame_rate(self):
+        """Une seconde donne le même nombre de pas à 30, 60 ou 144 FPS."""
+        for fps in (30, 60, 144):
+            timestep = FixedTimestep(logic_hz=120)
+            steps = sum(timestep.advance(1 / fps) for i in range(fps))
+            self.assertAlmostEqual(steps, 120, delta=1)
+
+    def test_alpha_is_remainder(self):
+        self.assertEqual(self.timestep.advance(0.025), 2)
+        self.assertAlmostEqual(self.timestep.alpha, 0.5)
+
+    def test_no_step_when_frame_is_short(self):
+        self.assertEqual(self.timestep.advance(0.004), 0)
+        self.assertAlmostEqual(self.timestep.alpha, 0.4)
+
+    def test_max_steps_drops_backlog(self):
+        self.assertEqual(self.timestep.advance(1.0), 5)
+        self.assertEqual(self.timestep.accumulator, 0.0)
+
+    def test_reset(self):
+        self.timestep.advance(0.005)
+        self.timestep.reset()
+        self.assertEqual(self.timestep.alpha, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from classes.FramePacer import FramePacer
+
+
+class FakeTime:
+    """Horloge simulée : la mise en veille se réveille en retard."""
+
+    def __init__(self, oversleep=0.0):
+        self.now = 0.0
+        self.oversleep = oversleep
+        self.sleeps = []
+        self.reads = 0
+
+    def clock(self):
+        self.reads += 1
+        self.now += 0.00001
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration + self.oversleep
+
+
+def make_pacer(fake, **kwargs):
+    return FramePacer(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+class TestFramePacer(unittest.TestCase):
+    """Tests unitaires pour la classe FramePacer."""
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            FramePacer(mode="spin")
+
+    def test_sleep_mode_oversleeps(self):
+        fake = FakeTime(oversleep=0.002)
+        pacer = make_pacer(fake, fps=100, mode="sleep")
+        intervals = [pacer.wait() for i in range(10)]
+        self.assertEqual(len(fake.sleeps), 10)
+        self.assertGreater(intervals[0], 0.0115)
+
+    def test_busy_mode_never_sleeps(self):
+        fake = FakeTime()
+        pacer = make_pacer(fake, fps=100, mode="busy")
+        for i in range(10):
+            self.assertAlmostEqual(pacer.wait(), 0.01, delta=0.0001)
+        self.assertEqual(fake.sleeps, [])
+
+    def test_hybrid_sleeps_then_spins(self):
+        fake = FakeTime(oversleep=0.0015)
+        pacer = make_pacer(fake, fps=100, mode="hybrid", spin=0.002)
+        for i in range(10):
+            self.assertAlmostEqual(pacer.wait(), 0.01, delta=0.0001)
+        self.assertAlmostEqual(fake.sleeps[0], 0.008, delta=0.0001)
+
+    def test_deadlines_do_not_drift_or_catch_up(self):
+        fake = FakeTime()
+        pacer = make_pacer(fake, fps=100, mode="busy")
+        pacer.wait()
+        fake.now += 0.005  # Image longue, rattrapée à l'échéance
+        self.assertAlmostEqual(pacer.wait(), 0.01, delta=0.0001)
+
+        fake.now += 0.05  # Grand retard : pas de rafale d'images
+        self.assertGreater(pacer.wait(), 0.05)
+        self.assertAlmostEqual(pacer.wait(), 0.01, delta=0.0001)
+
+    def test_uncapped_does_not_wait(self):
+        fake = FakeTime()
+        pacer = make_pacer(fake, fps=0)
+        fake.now += 0.003
+        self.assertAlmostEqual(pacer.wait(), 0.003, delta=0.0001)
+        self.assertEqual(fake.sleeps, [])
+
+    def test_histogram_and_statistics(self):
+        pacer = make_pacer(FakeTime(), bin_width=0.001, bins=20)
+        for interval in [0.0081] * 98 + [0.0125, 0.5]:
+            pacer.record(interval)
+        self.assertEqual(pacer.histogram[8], 98)
+        self.assertEqual(pacer.histogram[12], 1)
+        self.assertEqual(pacer.histogram[-1], 1)
+        self.assertAlmostEqual(pacer.percentile(50), 0.009)
+        self.assertAlmostEqual(pacer.percentile(99), 0.013)
+        self.assertAlmostEqual(pacer.longest, 0.5)
+        self.assertGreater(pacer.jitter(), 0.04)
+
+        report = pacer.report()
+        self.assertIn("100 images", report[0])
+        self.assertEqual(len(report), 4)
+        self.assertIn(">=", report[-1])
+
+    def test_summary_is_refreshed_periodically(self):
+        pacer = make_pacer(FakeTime(), refresh=5)
+        first = pacer.summary()
+        self.assertIs(pacer.summary(), first)
+        for i in range(5):
+            pacer.record(0.01)
+        self.assertIsNot(pacer.summary(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from classes.FrameProfiler import FrameProfiler
+
+
+PHASES = ("input", "logic", "flip")
+
+
+def record(profiler, durations, clock):
+    """Mesure une image dont chaque phase dure le temps donné."""
+    profiler.begin_frame()
+    for phase, duration in durations:
+        clock[0] += duration
+        profiler.mark(phase)
+    profiler.end_frame()
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests unitaires pour la classe FrameProfiler."""
+
+    def setUp(self):
+        self.clock = [0.0]
+        patcher = patch(
+            "classes.FrameProfiler.time.perf_counter",
+            side_effect=lambda: self.clock[0]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.profiler = FrameProfiler(PHASES, capacity=4, enabled=True)
+
+    def test_disabled_records_nothing(self):
+        profiler = FrameProfiler(PHASES)
+        record(profiler, [("input", 0.001)], self.clock)
+        self.assertEqual(profiler.count, 0)
+        self.assertEqual(profiler.fps(), 0.0)
+        self.assertEqual(profiler.percentile(50), 0.0)
+
+    def test_marks_accumulate_per_phase(self):
+        record(self.profiler, [
+            ("input", 0.001), ("logic", 0.002),
+            ("logic", 0.003), ("flip", 0.004)
+        ], self.clock)
+        frame, total, row = self.profiler.rows()[0]
+        self.assertEqual(frame, 0)
+        self.assertAlmostEqual(total, 0.010)
+        self.assertEqual(
+            [round(value, 6) for value in row], [0.001, 0.005, 0.004])
+
+    def test_interrupted_frame_keeps_buffer(self):
+        for i in range(4):
+            record(self.profiler, [("input", 0.001)], self.clock)
+        self.profiler.begin_frame()
+        rows = self.profiler.rows()
+        self.assertEqual(self.profiler.count, 4)
+        self.assertAlmostEqual(rows[0][2][0], 0.001)
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        for i in range(6):
+            record(self.profiler, [("input", 0.001 * (i + 1))], self.clock)
+        rows = self.profiler.rows()
+        self.assertEqual(self.profiler.count, 4)
+        self.assertEqual([frame for frame, total, row in rows], [2, 3, 4, 5])
+        self.assertAlmostEqual(rows[0][1], 0.003)
+
+    def test_statistics(self):
+        for duration in (0.010, 0.010, 0.010, 0.030):
+            record(self.profiler, [("logic", duration)], self.clock)
+        self.assertAlmostEqual(self.profiler.fps(), 4 / 0.060)
+        self.assertAlmostEqual(self.profiler.percentile(50), 0.010)
+        self.assertAlmostEqual(self.profiler.percentile(99), 0.030)
+        self.assertAlmostEqual(
+            self.profiler.phase_averages()["logic"], 0.015)
+
+    def test_toggle_overlay_enables_profiler(self):
+        profiler = FrameProfiler(PHASES)
+        profiler.toggle_overlay()
+        self.assertTrue(profiler.overlay)
+        self.assertTrue(profiler.enabled)
+        profiler.toggle_overlay()
+        self.assertFalse(profiler.overlay)
+
+    def test_toggle_overlay_mid_frame(self):
+        """La mesure activée en cours d'image part de l'activation."""
+        profiler = FrameProfiler(PHASES)
+        self.clock[0] = 100.0
+        profiler.begin_frame()
+        self.clock[0] += 0.001
+        profiler.toggle_overlay()
+        self.clock[0] += 0.002
+        profiler.mark("input")
+        self.clock[0] += 0.003
+        profiler.end_frame()
+        frame, total, row = profiler.rows()[0]
+        self.assertAlmostEqual(total, 0.005)
+        self.assertAlmostEqual(row[0], 0.002)
+
+    def test_toggle_overlay_keeps_enabled_frame(self):
+        self.profiler.begin_frame()
+        self.clock[0] += 0.001
+        self.profiler.toggle_overlay()
+        self.profiler.mark("input")
+        self.profiler.end_frame()
+        self.assertAlmostEqual(self.profiler.rows()[0][2][0], 0.001)
+
+    def test_summary_is_refreshed_periodically(self):
+        profiler = FrameProfiler(PHASES, enabled=True, refresh=2)
+        record(profiler, [("input", 0.010)], self.clock)
+        lines = profiler.summary()
+        self.assertEqual(lines[0], "FPS 100")
+        self.assertEqual(len(lines), 2 + len(PHASES))
+
+        record(profiler, [("input", 0.030)], self.clock)
+        self.assertIs(profiler.summary(), lines)
+        record(profiler, [("input", 0.030)], self.clock)
+        self.assertEqual(profiler.summary()[0], "FPS 43")
+
+    def test_write_csv(self):
+        record(self.profiler, [("input", 0.001), ("flip", 0.002)],
+               self.clock)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.csv")
+            self.profiler.write_csv(path)
+            with open(path, newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["frame", "total_ms", *PHASES])
+        self.assertEqual(rows[1], ["0", "3.0000", "1.0000", "0.0000",
+                                   "2.0000"])
+
+
+if __name__ == "__main__":
+    unittest.main()
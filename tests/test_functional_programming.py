@@ -1,5 +1,5 @@
 import unittest
-from utils.FunctionalProgramming import add_points, side_obstacles_positions
+from utils.FunctionalProgramming import add_points, side_obstacles_positions, jump_transform
 
 class TestFunctionalExamples(unittest.TestCase):
     """Tests unitaires pour les fonctions de programmation fonctionnelle."""
@@ -51,5 +51,13 @@ class TestFunctionalExamples(unittest.TestCase):
         self.assertEqual(y_values[0], -2*spacing + dx)
         self.assertEqual(y_values[-1], (rows - 1) * spacing + dx)
 
+    # ---------- jump_transform ----------
+
+    def test_jump_transform_curve(self):
+        self.assertEqual(jump_transform(0.0), (0.0, 1.0))
+        self.assertEqual(jump_transform(0.25), (90.0, 1.5))
+        self.assertEqual(jump_transform(0.5), (180.0, 2.0))
+        self.assertEqual(jump_transform(0.75), (270.0, 1.5))
+
 if __name__ == "__main__":
     unittest.main()
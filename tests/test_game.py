@@ -1,7 +1,10 @@
+import time
 import unittest
 import pygame
 from collections import defaultdict
 from unittest.mock import Mock, patch
+from classes.AssetLoader import AssetLoader
+from classes.AudioLatencyProbe import AudioLatencyProbe
 from classes.Game import Game
 
 
@@ -64,22 +67,17 @@ class TestGame(unittest.TestCase):
 
     # ---------- KEY INPUT ----------
 
-    @patch("pygame.key.get_pressed")
-    def test_update_key_pressed(self, mock_pressed):
-        """Test la mise à jour de l'état des touches pressées."""
-        pressed = defaultdict(bool)
-        pressed[pygame.K_LEFT] = True
-        pressed[pygame.K_RIGHT] = True
-        pressed[pygame.K_SPACE] = True
-        pressed[pygame.K_RETURN] = True
-
-        mock_pressed.return_value = pressed
-        self.game.get_key_pressed()
-
-        self.assertTrue(self.game.keys["left"])
-        self.assertTrue(self.game.keys["right"])
-        self.assertTrue(self.game.keys["space"])
-        self.assertTrue(self.game.keys["return"])
+    def test_keys_follow_events(self):
+        """L'état des touches vient des événements, sur place."""
+        keys = self.game.keys
+        self.game.input.poll([
+            Mock(type=pygame.KEYDOWN, key=pygame.K_LEFT),
+            Mock(type=pygame.KEYDOWN, key=pygame.K_RETURN),
+        ])
+        self.assertIs(self.game.keys, keys)
+        self.assertTrue(keys["left"])
+        self.assertTrue(keys["return"])
+        self.assertFalse(keys["space"])
 
     # ---------- COLLISIONS ----------
 
@@ -171,6 +169,37 @@ class TestGame(unittest.TestCase):
         self.game.obstacle_jumped()
         self.game.sound_woohoo.play.assert_called_once()
 
+    def test_latency_probe_records_events(self):
+        self.game.latency_probe = AudioLatencyProbe(44100, 512)
+        self.game.sound_woohoo = Mock()
+        self.game.obstacle_jumped(time.perf_counter() - 0.002)
+        self.game.sound_woohoo.play.assert_called_once()
+        delays = self.game.latency_probe.samples["obstacle_jumped"]
+        self.assertEqual(len(delays), 1)
+        self.assertGreaterEqual(delays[0], 0.002)
+
+    def test_latency_probe_needs_event_time(self):
+        self.game.latency_probe = AudioLatencyProbe(44100, 512)
+        self.game.sound_woohoo = Mock()
+        self.game.obstacle_jumped()
+        self.game.sound_woohoo.play.assert_called_once()
+        self.assertEqual(self.game.latency_probe.samples, {})
+
+    # ---------- SOUND CACHE ----------
+
+    @patch("pygame.mixer.Sound")
+    def test_load_sound_uses_cache(self, mock_sound):
+        cache = Mock()
+        cache.get.return_value = "cached"
+        self.game.sound_cache = cache
+        self.assertEqual(self.game.load_sound("audio/points.wav"), "cached")
+        mock_sound.assert_not_called()
+
+        cache.get.return_value = None
+        sound = self.game.load_sound("audio/points.wav")
+        self.assertIs(sound, mock_sound.return_value)
+        cache.put.assert_called_once_with("audio/points.wav", sound)
+
     # ---------- STATUS ----------
 
     def test_update_status(self):
@@ -190,12 +219,67 @@ class TestGame(unittest.TestCase):
         mock_get.return_value = []
         self.assertFalse(self.game.check_quit_event())
 
+    @patch("pygame.event.get")
+    def test_check_quit_event_records_keys_down(self, mock_get):
+        mock_get.return_value = [Mock(type=pygame.KEYDOWN, key=pygame.K_F3)]
+        self.assertFalse(self.game.check_quit_event())
+        self.assertEqual(self.game.input.keys_down, [pygame.K_F3])
+        self.assertTrue(self.game.check_profiler_toggled())
+
+        mock_get.return_value = []
+        self.game.check_quit_event()
+        self.assertFalse(self.game.check_profiler_toggled())
+
     @patch("pygame.quit")
     def test_quit(self, mock_quit):
         self.game.quit()
         mock_quit.assert_called_once()
 
 
+# ---------- MIXER CONFIGURATION ----------
+
+class TestGameMixerConfiguration(unittest.TestCase):
+    """Test la configuration du mélangeur audio."""
+
+    @patch("pygame.get_init", return_value=True)
+    @patch("pygame.time.Clock")
+    @patch("pygame.mixer")
+    def test_mixer_configuration(self, mock_mixer, mock_clock, mock_get_init):
+        game = Game(frequency=22050, buffer=256, channels=1,
+                    latency_probe=True)
+        mock_mixer.pre_init.assert_called_once_with(22050, -16, 1, 256)
+        self.assertAlmostEqual(
+            game.latency_probe.buffer_latency, 256 / 22050)
+
+
+# ---------- BACKGROUND LOADING ----------
+
+class TestGameBackgroundLoading(unittest.TestCase):
+    """Test le chargement des sons en arrière-plan."""
+
+    @patch("pygame.get_init", return_value=True)
+    @patch("pygame.time.Clock")
+    @patch("pygame.mixer")
+    def test_sounds_are_attached_when_game_starts(
+        self, mock_mixer, mock_clock, mock_get_init
+    ):
+        """Les sons ne sont rattachés qu'au lancement de la partie."""
+        mock_mixer.Sound.side_effect = lambda path: path
+        loader = AssetLoader(workers=2, verbose=False)
+        self.addCleanup(loader.shutdown)
+
+        game = Game(loader)
+        self.assertIsNone(game.sound_doh)
+        self.assertEqual(len(loader.futures), 4)
+
+        game.keys = {"return": True}
+        game.check_game_started()
+        self.assertTrue(game.started)
+        self.assertEqual(game.sound_doh, "audio/Homer-Doh! - QuickSounds.com.mp3")
+        self.assertEqual(game.sound_killed, "audio/killed.wav")
+        self.assertEqual(loader.pending(), [])
+
+
 # ---------- AUDIO EXCEPTIONS ----------
 
 class TestGameAudioExceptions(unittest.TestCase):
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import Mock
+from classes.GameRules import GameRules
+from classes.HeadlessSprite import HeadlessRect, HeadlessSprite
+
+
+class TestGameRules(unittest.TestCase):
+    """Tests unitaires pour la classe GameRules (sans pygame)."""
+
+    def setUp(self):
+        self.rules = GameRules()
+
+        self.window = Mock()
+        self.window.left_limit = 10
+        self.window.right_limit = 100
+        self.window.height = 600
+
+        self.player = Mock()
+        self.player.rect = HeadlessRect(50, 100, 30, 40)
+        self.player.invincible = False
+        self.player.jumping = False
+        self.player.stop_points = False
+        self.player.x = 50
+
+        self.obstacle = Mock()
+        self.obstacle.rect = HeadlessRect(50, 100, 30, 70)
+        self.obstacle.image = HeadlessSprite(30, 70)
+        self.obstacle.y = 100
+        self.obstacle.jump_allowed = False
+
+    def test_initial_state(self):
+        self.assertEqual(self.rules.level, 1)
+        self.assertEqual(self.rules.speed, 1)
+
+    def test_collision_with_headless_rects(self):
+        result = self.rules.check_collision(
+            self.window, self.player, self.obstacle)
+        self.assertEqual(result, "hit")
+
+    def test_narrow_phase_after_rect_test(self):
+        self.rules.narrow_phase = Mock(return_value=False)
+        result = self.rules.check_collision(
+            self.window, self.player, self.obstacle)
+        self.assertFalse(result)
+        self.rules.narrow_phase.assert_called_once_with(
+            self.player, self.obstacle)
+
+        # Sans chevauchement des rectangles, le test précis n'est pas appelé
+        self.rules.narrow_phase.reset_mock()
+        self.obstacle.rect = HeadlessRect(300, 100, 30, 70)
+        self.rules.check_collision(self.window, self.player, self.obstacle)
+        self.rules.narrow_phase.assert_not_called()
+
+    def test_collision_invincible(self):
+        self.player.invincible = True
+        result = self.rules.check_collision(
+            self.window, self.player, self.obstacle)
+        self.assertFalse(result)
+
+    def test_update_level(self):
+        self.rules.update_level(1999)
+        self.assertEqual(self.rules.level, 2)
+        self.assertEqual(self.rules.speed, 2.0)
+
+    def test_event_hooks_do_nothing(self):
+        self.assertIsNone(self.rules.obstacle_hit(2))
+        self.assertIsNone(self.rules.obstacle_cleared())
+        self.assertIsNone(self.rules.obstacle_jumped())
+
+
+if __name__ == "__main__":
+    unittest.main()
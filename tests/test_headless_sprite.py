@@ -0,0 +1,46 @@
+import unittest
+import pygame
+from classes.HeadlessSprite import HeadlessRect, HeadlessSprite, round_coordinate
+
+
+class TestHeadlessSprite(unittest.TestCase):
+    """Tests unitaires des substituts de Surface et Rect."""
+
+    def test_round_coordinate_matches_pygame(self):
+        rect = pygame.Rect(0, 0, 1, 1)
+        for value in (0.5, 1.49, 2.5, -0.5, -1.5, -2.7, 7.0, -3.2):
+            rect.x = value
+            self.assertEqual(round_coordinate(value), rect.x, value)
+
+    def test_colliderect_matches_pygame(self):
+        base = (10, 10, 20, 20)
+        others = [
+            (0, 0, 10, 10),    # coin qui touche
+            (30, 10, 5, 5),    # bord qui touche
+            (29, 29, 5, 5),    # chevauchement d'un pixel
+            (15, 15, 0, 5),    # largeur nulle
+            (12, 12, 2, 2),    # inclus
+            (-5, 12, 100, 2),  # traverse
+        ]
+        for other in others:
+            expected = pygame.Rect(base).colliderect(pygame.Rect(other))
+            result = HeadlessRect(*base).colliderect(HeadlessRect(*other))
+            self.assertEqual(result, expected, other)
+
+    def test_topleft_setter_rounds(self):
+        rect = HeadlessRect(0, 0, 5, 5)
+        rect.topleft = (1.5, -1.5)
+        self.assertEqual(rect.topleft, (2, -2))
+
+    def test_sprite_dimensions_and_rect(self):
+        sprite = HeadlessSprite(100, 60)
+        self.assertEqual(sprite.get_width(), 100)
+        self.assertEqual(sprite.get_height(), 60)
+        self.assertEqual(sprite.get_size(), (100, 60))
+        rect = sprite.get_rect(topleft=(3, 4))
+        self.assertEqual((rect.x, rect.y, rect.width, rect.height),
+                         (3, 4, 100, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+from classes.InputState import InputState
+
+
+def down(key):
+    return Mock(type=pygame.KEYDOWN, key=key)
+
+
+def up(key):
+    return Mock(type=pygame.KEYUP, key=key)
+
+
+class TestInputState(unittest.TestCase):
+    """Tests unitaires pour la classe InputState."""
+
+    def setUp(self):
+        self.input = InputState()
+
+    def test_held_key(self):
+        keys = self.input.keys
+        self.input.poll([down(pygame.K_LEFT)], now=1.0)
+        self.input.consume(now=1.0)
+        self.assertTrue(keys["left"])
+
+        self.input.poll([], now=1.01)
+        self.assertTrue(keys["left"])
+        self.input.poll([up(pygame.K_LEFT)], now=1.02)
+        self.assertFalse(keys["left"])
+        self.assertIs(self.input.keys, keys)
+
+    def test_tap_within_a_frame_is_not_lost(self):
+        self.input.poll([down(pygame.K_SPACE), up(pygame.K_SPACE)], now=1.0)
+        self.assertTrue(self.input.keys["space"])
+        self.assertFalse(self.input.held["space"])
+
+        # Une image sans pas de logique garde l'appui
+        self.input.poll([], now=1.008)
+        self.assertTrue(self.input.keys["space"])
+
+        self.input.consume(now=1.010)
+        self.assertFalse(self.input.keys["space"])
+
+    def test_latency_in_frames_and_seconds(self):
+        self.input.poll([down(pygame.K_SPACE)], now=1.0)
+        self.input.poll([], now=1.008)
+        self.input.consume(now=1.010)
+        frames, delay = self.input.latencies["space"][0]
+        self.assertEqual(frames, 1)
+        self.assertAlmostEqual(delay, 0.010)
+        self.assertIn("space : 1 appuis", self.input.report()[0])
+
+        # Un appui n'est mesuré qu'une fois
+        self.input.consume(now=1.02)
+        self.assertEqual(len(self.input.latencies["space"]), 1)
+
+    def test_keys_down_and_quit(self):
+        quit_event = self.input.poll(
+            [down(pygame.K_F3), Mock(type=pygame.QUIT)])
+        self.assertTrue(quit_event)
+        self.assertEqual(self.input.keys_down, [pygame.K_F3])
+        self.assertFalse(self.input.poll([]))
+        self.assertEqual(self.input.keys_down, [])
+
+    def test_consume_without_recording(self):
+        """Les appuis des menus sont oubliés sans fausser les délais."""
+        self.input.poll([down(pygame.K_RETURN), up(pygame.K_RETURN)],
+                        now=1.0)
+        self.input.consume(now=5.0, record=False)
+        self.assertFalse(self.input.keys["return"])
+        self.assertEqual(self.input.report(), [])
+
+    def test_focus_lost_releases_keys(self):
+        self.input.poll([down(pygame.K_RIGHT)])
+        self.input.consume()
+        self.input.poll([Mock(type=pygame.WINDOWFOCUSLOST)])
+        self.assertFalse(self.input.keys["right"])
+
+    def test_exposed_for_one_frame(self):
+        self.input.poll([Mock(type=pygame.WINDOWEXPOSED)])
+        self.assertTrue(self.input.exposed)
+        self.input.poll([])
+        self.assertFalse(self.input.exposed)
+
+    @patch("pygame.event.get", return_value=[])
+    @patch("pygame.event.wait")
+    def test_wait_keeps_event_for_poll(self, mock_wait, mock_get):
+        mock_wait.return_value = Mock(type=pygame.NOEVENT)
+        self.assertFalse(self.input.wait(0.25))
+        mock_wait.assert_called_once_with(250)
+
+        mock_wait.return_value = down(pygame.K_RETURN)
+        self.assertTrue(self.input.wait(0.25))
+        self.input.poll()
+        self.assertTrue(self.input.keys["return"])
+        self.assertEqual(self.input.pending, [])
+
+    @patch("pygame.event.get", return_value=[])
+    def test_poll_drains_pygame_queue(self, mock_get):
+        self.input.poll()
+        mock_get.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
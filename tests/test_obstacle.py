@@ -113,6 +113,28 @@ class TestObstacle(unittest.TestCase):
         self.assertEqual(obstacle.y, 650)
         self.assertEqual(obstacle.x, 200)
 
+    def test_respawn_moves_below_screen(self):
+        """Vérifie le placement sous l'écran d'un obstacle réutilisé."""
+        import random
+
+        obstacle = Obstacle(600, 0, 800, self.image, True, random.Random(2))
+        obstacle.y = 10
+        obstacle.cleared = True
+        obstacle.respawn()
+
+        self.assertFalse(obstacle.cleared)
+        self.assertTrue(600 <= obstacle.y <= 1200)
+        self.assertFalse(hasattr(obstacle, "__dict__"))
+
+    def test_rng_makes_positions_reproducible(self):
+        """Vérifie qu'un générateur fourni rend les positions reproductibles."""
+        import random
+
+        first = Obstacle(600, 0, 800, self.image, False, random.Random(4))
+        second = Obstacle(600, 0, 800, self.image, False, random.Random(4))
+
+        self.assertEqual((first.x, first.y), (second.x, second.y))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+from classes.HeadlessSprite import HeadlessSprite
+from classes.Obstacle import Obstacle
+from classes.ObstaclePool import ObstaclePool, object_size
+
+
+def make_obstacle():
+    """Crée un rocher sans pygame."""
+    return Obstacle(750, 100, 1200, HeadlessSprite(90, 60), True,
+                    random.Random(1))
+
+
+class TestObstaclePool(unittest.TestCase):
+    """Tests unitaires pour la classe ObstaclePool."""
+
+    def test_preallocates_capacity(self):
+        pool = ObstaclePool(make_obstacle, 4)
+        self.assertEqual(len(pool.free), 4)
+        self.assertEqual(len(pool), 0)
+
+    def test_acquire_and_release(self):
+        pool = ObstaclePool(make_obstacle, 2)
+        first = pool.acquire()
+        first.set_cleared()
+        second = pool.acquire()
+
+        self.assertIn(first, pool)
+        self.assertIsNone(pool.acquire())
+        self.assertEqual(pool.high_water, 2)
+
+        pool.release(first)
+        self.assertNotIn(first, pool)
+        self.assertIs(pool.acquire(), first)
+        self.assertFalse(first.cleared)
+        self.assertGreaterEqual(first.y, 750)
+
+        pool.release(second)
+        self.assertEqual(pool.stats()["acquired"], 3)
+        self.assertEqual(pool.stats()["released"], 2)
+        self.assertEqual(pool.stats()["in_use"], 1)
+        with self.assertRaises(KeyError):
+            pool.release(second)
+
+    def test_state_round_trip(self):
+        pool = ObstaclePool(make_obstacle, 3)
+        state = pool.state()
+        first = pool.acquire()
+        pool.acquire()
+        pool.release(first)
+
+        pool.set_state(state)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual((pool.acquired, pool.released, pool.high_water),
+                         (0, 0, 0))
+        self.assertIs(pool.acquire(), first)
+        self.assertIn(first, pool)
+
+    def test_object_size(self):
+        """Un obstacle sans dictionnaire d'attributs est plus petit."""
+        class Plain:
+            """Mêmes attributs qu'un obstacle, dans un dictionnaire."""
+
+        pool = ObstaclePool(make_obstacle, 1)
+        obstacle = pool.free[0]
+        self.assertFalse(hasattr(obstacle, "__dict__"))
+        self.assertEqual(
+            pool.object_size(),
+            object_size(obstacle) + object_size(obstacle.rect)
+        )
+        plain = Plain()
+        for name in Obstacle.__slots__:
+            setattr(plain, name, getattr(obstacle, name))
+        self.assertLess(object_size(obstacle), object_size(plain))
+        self.assertEqual(ObstaclePool(make_obstacle, 0).object_size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import random
+import unittest
+from classes.RandomPolicy import RandomPolicy, random_keys
+
+
+class TestRandomPolicy(unittest.TestCase):
+    """Tests unitaires pour la classe RandomPolicy."""
+
+    def test_same_seed_same_keys(self):
+        first = RandomPolicy(seed=4)
+        second = RandomPolicy(seed=4)
+        for i in range(500):
+            self.assertEqual(first(None), second(None))
+
+    def test_matches_random_keys(self):
+        policy = RandomPolicy(seed=7, hold=0.5)
+        rng = random.Random(7)
+        keys = dict.fromkeys(policy.keys, False)
+        for i in range(200):
+            random_keys(rng, keys, 0.5)
+            self.assertEqual(policy(None), keys)
+
+    def test_hold_keeps_keys(self):
+        policy = RandomPolicy(seed=1, hold=1.0)
+        self.assertFalse(any(policy(None).values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import random
+import tempfile
+import unittest
+from classes.Recording import Recording, RESTART, decode_keys, encode_keys
+from classes.Simulation import Simulation
+from headless import run
+
+
+KEYS = dict.fromkeys(("left", "right", "up", "down", "space", "return"),
+                     False)
+
+
+class TestRecording(unittest.TestCase):
+    """Tests unitaires pour la classe Recording."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "session.ski")
+
+    def test_keys_round_trip(self):
+        for mask in range(64):
+            self.assertEqual(encode_keys(decode_keys(mask)), mask)
+        self.assertEqual(encode_keys(dict(KEYS, left=True, space=True)),
+                         0b10001)
+
+    def test_save_and_load(self):
+        recording = Recording(-42, logic_hz=60, course=True)
+        recording.record_step(dict(KEYS, right=True))
+        recording.record_restart()
+        recording.finish(Simulation.headless(seed=1))
+        recording.save(self.path)
+
+        loaded = Recording.load(self.path)
+        self.assertEqual(loaded.seed, -42)
+        self.assertEqual(loaded.logic_hz, 60)
+        self.assertTrue(loaded.course)
+        self.assertFalse(loaded.masks)
+        self.assertEqual(loaded.steps, 1)
+        self.assertEqual(loaded.events, bytearray([0b10, RESTART]))
+        self.assertEqual((loaded.points, loaded.level, loaded.lives),
+                         (0, 1, 3))
+
+    def test_masks_option(self):
+        Recording(3, masks=True).save(self.path)
+        loaded = Recording.load(self.path)
+        self.assertTrue(loaded.masks)
+        self.assertFalse(loaded.course)
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a recording")
+        with self.assertRaises(ValueError):
+            Recording.load(self.path)
+
+    def test_replay_is_identical(self):
+        """Une longue session rejouée se termine dans le même état."""
+        recording = Recording(seed=9)
+        simulation, elapsed = run(60000, seed=9, recording=recording)
+        self.assertIn(RESTART, recording.events)
+        recording.save(self.path)
+        self.assertLess(os.path.getsize(self.path), 16 * 1024)
+
+        loaded = Recording.load(self.path)
+        replayed = loaded.play(Simulation.headless(seed=loaded.seed))
+        self.assertTrue(loaded.matches(replayed))
+        self.assertEqual(replayed.frame, simulation.frame)
+        self.assertEqual(
+            [(obs.x, obs.y) for obs in replayed.obstacles],
+            [(obs.x, obs.y) for obs in simulation.obstacles]
+        )
+
+    def test_course_replay_is_identical(self):
+        recording = Recording(seed=4, course=True)
+        simulation, elapsed = run(20000, seed=4, recording=recording,
+                                  course=True)
+        recording.save(self.path)
+
+        loaded = Recording.load(self.path)
+        replayed = Simulation.headless(seed=loaded.seed, course=loaded.course)
+        self.addCleanup(replayed.close)
+        loaded.play(replayed)
+        self.assertTrue(loaded.matches(replayed))
+        self.assertEqual(replayed.distance, simulation.distance)
+
+    def test_step_by_step_replay(self):
+        recording = Recording(seed=1)
+        recording.record_step(dict(KEYS, left=True))
+        recording.record_restart()
+        recording.record_step(KEYS)
+
+        self.assertFalse(recording.restart_next())
+        self.assertTrue(recording.next_keys()["left"])
+        self.assertIsNone(recording.next_keys())
+        self.assertTrue(recording.restart_next())
+        self.assertEqual(recording.next_keys(), KEYS)
+        self.assertTrue(recording.finished)
+        self.assertIsNone(recording.next_keys())
+
+    def test_restart_resets_level(self):
+        simulation = Simulation.headless(seed=random.randrange(100))
+        simulation.player.points = 2500
+        simulation.step(KEYS, 1 / 120)
+        self.assertEqual(simulation.rules.level, 3)
+        simulation.restart(1 / 120)
+        self.assertEqual(simulation.rules.level, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
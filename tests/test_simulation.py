@@ -0,0 +1,288 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import ANY, Mock
+import pygame
+from classes.GameRules import GameRules
+from classes.Simulation import Simulation
+
+
+KEYS = {
+    "left": False,
+    "right": False,
+    "up": False,
+    "down": False,
+    "space": False,
+    "return": False
+}
+
+
+def play(simulation, frames):
+    """Joue une séquence d'entrées fixe et retourne l'état final."""
+    keys = dict(KEYS)
+    for frame in range(frames):
+        keys["left"] = frame % 240 < 100
+        keys["right"] = 120 <= frame % 240 < 220
+        keys["down"] = frame % 90 < 30
+        keys["space"] = frame % 300 == 0
+        simulation.step(keys, 1 / 120)
+        if simulation.game_over:
+            simulation.restart(1 / 120)
+    return (
+        simulation.player.points,
+        simulation.player.lives,
+        simulation.rules.level,
+        [(obs.x, obs.y) for obs in simulation.obstacles]
+    )
+
+
+class TestSimulation(unittest.TestCase):
+    """Tests unitaires pour la classe Simulation."""
+
+    def test_headless_layout(self):
+        simulation = Simulation.headless(seed=1)
+        self.assertEqual(simulation.left_limit, 100)
+        self.assertEqual(simulation.right_limit, 1200)
+        self.assertEqual(len(simulation.obstacles), 7)
+        self.assertEqual(
+            sum(obs.jump_allowed for obs in simulation.obstacles), 3)
+
+    def test_step_advances_frame_and_obstacles(self):
+        simulation = Simulation.headless(seed=1)
+        before = [obs.y for obs in simulation.obstacles]
+        simulation.step(dict(KEYS), 1 / 120)
+        after = [obs.y for obs in simulation.obstacles]
+        self.assertEqual(simulation.frame, 1)
+        self.assertEqual(after, [y - 1.5 for y in before])
+
+    def test_same_seed_same_game(self):
+        first = play(Simulation.headless(seed=7), 3000)
+        second = play(Simulation.headless(seed=7), 3000)
+        self.assertEqual(first, second)
+
+    def test_headless_matches_pygame_surfaces(self):
+        """Les substituts sans pygame donnent la même partie que les Surface."""
+        simulation = Simulation(
+            1400, 750, 100, 1200,
+            pygame.Surface((100, 100)),
+            pygame.Surface((100, 100)),
+            pygame.Surface((90, 60)),
+            pygame.Surface((70, 70)),
+            seed=3
+        )
+        self.assertEqual(
+            play(simulation, 3000),
+            play(Simulation.headless(seed=3), 3000)
+        )
+
+    def test_broad_phase_matches_brute_force(self):
+        """La phase large ne change aucun résultat de la partie."""
+        indexed = Simulation.headless(seed=5, rocks=40, trees=40)
+        brute = Simulation.headless(seed=5, rocks=40, trees=40)
+        brute.index.query = lambda *zone: set(brute.obstacles)
+
+        self.assertEqual(play(indexed, 3000), play(brute, 3000))
+        self.assertEqual(
+            (indexed.hits, indexed.jumps, indexed.clears),
+            (brute.hits, brute.jumps, brute.clears)
+        )
+        self.assertLess(indexed.index.total_candidates,
+                        brute.frame * len(brute.obstacles) / 10)
+
+    def test_broad_phase_finds_respawned_obstacles_at_high_speed(self):
+        """Les obstacles replacés sont trouvés quelle que soit la vitesse."""
+        simulation = Simulation.headless(seed=3, rocks=60, trees=60)
+        query = simulation.index.query
+        missed = []
+
+        def checked_query(left, top, right, bottom):
+            candidates = query(left, top, right, bottom)
+            for obs in simulation.obstacles:
+                x, y = obs.x + 10, obs.y + 10
+                if (x < right and x + obs.rect.width > left
+                        and y < bottom and y + obs.rect.height > top
+                        and obs not in candidates):
+                    missed.append(obs)
+            return candidates
+
+        simulation.index.query = checked_query
+        keys = dict(KEYS)
+        for frame in range(3000):
+            # Niveau 61 : les obstacles descendent de 31,5 pixels par pas
+            simulation.player.points = max(simulation.player.points, 60000)
+            keys["left"] = frame % 240 < 100
+            keys["right"] = 120 <= frame % 240 < 220
+            simulation.step(keys, 1 / 120)
+            if simulation.game_over:
+                simulation.restart(1 / 120)
+        self.assertGreater(simulation.rules.speed, 30)
+        self.assertEqual(missed, [])
+
+    def test_density_grows_with_level(self):
+        """Les obstacles ajoutés viennent des réserves créées au départ."""
+        simulation = Simulation.headless(seed=2)
+        pooled = {
+            obs for pool in simulation.scheduler.pools.values()
+            for obs in pool.free
+        }
+        simulation.player.invincible = True
+        simulation.player.invincible_duration = float("inf")
+        simulation.player.points = 3000
+        simulation.step(dict(KEYS), 1 / 120)
+        self.assertEqual(len(simulation.obstacles), 7 + 2 * 3)
+        self.assertEqual(len(simulation.previous_obstacles), 13)
+        self.assertEqual(len(simulation.index), 13)
+
+        for frame in range(2000):
+            simulation.step(dict(KEYS), 1 / 120)
+        self.assertTrue(set(simulation.obstacles[7:]) <= pooled)
+
+        # Au niveau 1, les obstacles ajoutés sont rendus en quittant l'écran
+        simulation.player.points = 0
+        for frame in range(2000):
+            simulation.step(dict(KEYS), 1 / 120)
+        self.assertEqual(len(simulation.obstacles), 7)
+        self.assertEqual(len(simulation.index), 7)
+        stats = simulation.scheduler.pools["rochers"].stats()
+        self.assertEqual(stats["high_water"], 3)
+        self.assertEqual(stats["released"], 3)
+
+    def test_course_is_reproducible(self):
+        """La piste construite en arrière-plan ne dépend que de la graine."""
+        first = Simulation.headless(seed=6, course=True)
+        second = Simulation.headless(seed=6, course=True)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        # Les premiers obstacles de la piste attendent sous l'écran
+        self.assertTrue(first.obstacles)
+        self.assertTrue(all(obs.y >= 750 for obs in first.obstacles))
+        self.assertEqual(play(first, 3000), play(second, 3000))
+
+    def test_course_memory_is_bounded(self):
+        simulation = Simulation.headless(seed=6, course=True)
+        self.addCleanup(simulation.close)
+        simulation.player.invincible = True
+        simulation.player.invincible_duration = float("inf")
+        simulation.player.points = 11000
+        for frame in range(20000):
+            simulation.step(dict(KEYS), 1 / 120)
+
+        scheduler = simulation.scheduler
+        self.assertGreater(simulation.course.consumed, 50)
+        self.assertLessEqual(len(scheduler.pending), 2 * 27)
+        for pool in scheduler.pools.values():
+            self.assertLess(pool.high_water, pool.capacity)
+            self.assertGreater(pool.released, 100)
+        self.assertEqual(len(simulation.index), len(simulation.obstacles))
+
+    def test_snapshot_restore_replays_identically(self):
+        """Une partie rétablie rejoue les mêmes images, niveaux compris."""
+        simulation = Simulation.headless(seed=8)
+        simulation.player.points = 1900
+        play(simulation, 500)
+        snapshot = simulation.snapshot()
+        first = play(simulation, 6000)
+        first_state = (simulation.frame, simulation.hits,
+                       simulation.previous_obstacles, simulation.rng.random())
+
+        simulation.restore(snapshot)
+        self.assertEqual(simulation.frame, 500)
+        self.assertEqual(play(simulation, 6000), first)
+        self.assertEqual((simulation.frame, simulation.hits,
+                          simulation.previous_obstacles,
+                          simulation.rng.random()), first_state)
+        self.assertEqual(len(simulation.index), len(simulation.obstacles))
+
+    def test_course_snapshot_restore(self):
+        simulation = Simulation.headless(seed=8, course=True)
+        self.addCleanup(simulation.close)
+        play(simulation, 500)
+        snapshot = simulation.snapshot()
+        first = play(simulation, 1500)
+        consumed = simulation.course.consumed
+        self.assertGreater(consumed, simulation.scheduler.received - 1)
+
+        simulation.restore(snapshot)
+        self.assertEqual(play(simulation, 1500), first)
+        # Les tronçons déjà consommés sont repris, pas redemandés
+        self.assertEqual(simulation.course.consumed, consumed)
+
+    def test_restore_forgotten_chunks(self):
+        simulation = Simulation.headless(seed=8, course=True)
+        self.addCleanup(simulation.close)
+        simulation.player.invincible = True
+        simulation.player.invincible_duration = float("inf")
+        simulation.player.points = 11000
+        snapshot = simulation.snapshot()
+        for frame in range(8000):
+            simulation.step(dict(KEYS), 1 / 120)
+
+        with self.assertRaises(ValueError):
+            simulation.restore(snapshot)
+        self.assertEqual(simulation.frame, 8000)
+
+    def test_snapshot_shares_objects(self):
+        simulation = Simulation.headless(seed=8)
+        snapshot = simulation.snapshot()
+        self.assertIn(simulation.player.image, snapshot[11])
+        self.assertIs(snapshot[14], simulation.obstacles[0])
+        self.assertEqual(len(snapshot), 14 + 8 * len(simulation.obstacles))
+
+    def test_events_are_forwarded_to_rules(self):
+        rules = GameRules()
+        rules.obstacle_hit = Mock()
+        simulation = Simulation.headless(rules=rules, seed=1)
+        simulation.player.x = 0  # hors piste : collision
+        simulation.step(dict(KEYS), 1 / 120)
+        rules.obstacle_hit.assert_called_once_with(2, ANY)
+        self.assertEqual(simulation.hits, 1)
+
+    def test_interpolation_between_steps(self):
+        simulation = Simulation.headless(seed=1)
+        keys = dict(KEYS, right=True)
+        simulation.step(keys, 1 / 120)
+
+        x, y = simulation.interpolated_player(0.5)
+        self.assertEqual(x, simulation.player.x - simulation.player.speed / 2)
+        self.assertEqual(simulation.interpolated_player(1.0),
+                         (simulation.player.x, simulation.player.y))
+
+        for obs, x, y in simulation.interpolated_obstacles(0.5):
+            self.assertEqual(y, obs.y + 0.75)
+
+    def test_respawned_obstacle_is_not_interpolated(self):
+        simulation = Simulation.headless(seed=1)
+        obs = simulation.obstacles[0]
+        obs.y = -obs.image.get_height()
+        simulation.step(dict(KEYS), 1 / 120)
+        positions = list(simulation.interpolated_obstacles(0.5))
+        self.assertEqual(positions[0], (obs, obs.x, obs.y))
+
+    def test_profiler_marks_player_and_obstacles(self):
+        simulation = Simulation.headless(seed=1)
+        simulation.profiler = Mock()
+        simulation.step(dict(KEYS), 1 / 120)
+        self.assertEqual(
+            [c.args for c in simulation.profiler.mark.call_args_list],
+            [("player",), ("obstacles",)]
+        )
+
+    def test_restart(self):
+        simulation = Simulation.headless(seed=1)
+        simulation.player.lives = 0
+        self.assertTrue(simulation.game_over)
+        simulation.restart(1 / 120)
+        self.assertFalse(simulation.game_over)
+        self.assertTrue(simulation.player.invincible)
+
+    def test_does_not_import_pygame(self):
+        code = (
+            "import sys; import classes.Simulation; "
+            "sys.exit('pygame' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+from classes.SoundCache import SoundCache
+
+
+class TestSoundCache(unittest.TestCase):
+    """Tests unitaires pour la classe SoundCache."""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            pygame.mixer.init(22050, -16, 1, 512)
+        except pygame.error as error:
+            raise unittest.SkipTest(f"pas de sortie audio : {error}")
+        cls.addClassCleanup(pygame.mixer.quit)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = SoundCache(os.path.join(self.directory, "cache"))
+        self.source = "audio/points.wav"
+
+    def test_tag(self):
+        self.assertEqual(self.cache.tag((44100, -16, 2)), "44100-s16-2")
+        self.assertEqual(self.cache.tag((22050, 8, 1)), "22050-u8-1")
+
+    def test_miss_then_hit(self):
+        self.assertIsNone(self.cache.get(self.source))
+        sound = pygame.mixer.Sound(self.source)
+        self.cache.put(self.source, sound)
+
+        cached = self.cache.get(self.source)
+        self.assertEqual(cached.get_raw(), sound.get_raw())
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_mixer_format_is_part_of_the_key(self):
+        entry = self.cache.entry_path(self.source, pygame.mixer.get_init())
+        other = self.cache.entry_path(self.source, (44100, -16, 2))
+        self.assertIn("22050-s16-1", entry)
+        self.assertNotEqual(entry, other)
+
+    def test_truncated_entry_is_a_miss(self):
+        self.cache.put(self.source, pygame.mixer.Sound(self.source))
+        entry = self.cache.entry_path(self.source, pygame.mixer.get_init())
+        with open(entry, "wb") as file:
+            file.write(b"\0")
+        self.assertIsNone(self.cache.get(self.source))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from classes.HeadlessSprite import HeadlessSprite
+from classes.SpatialIndex import SpatialIndex
+
+
+class FakeObstacle:
+    """Obstacle minimal : une position et une image."""
+
+    def __init__(self, y, height=70, x=500):
+        self.x = x
+        self.y = y
+        self.image = HeadlessSprite(70, height)
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Tests unitaires pour la classe SpatialIndex."""
+
+    def setUp(self):
+        self.index = SpatialIndex(cell_size=100)
+        self.near = FakeObstacle(150)
+        self.far = FakeObstacle(1400)
+        self.index.insert(self.near)
+        self.index.insert(self.far)
+
+    def test_query_returns_only_nearby(self):
+        candidates = self.index.query(480, 120, 560, 220)
+        self.assertEqual(candidates, {self.near})
+        self.assertEqual(self.index.candidates, 1)
+        self.assertEqual(self.index.queries, 1)
+
+    def test_query_includes_tall_obstacle_above(self):
+        tall = FakeObstacle(-100, height=300)
+        self.index.insert(tall)
+        self.assertIn(tall, self.index.query(480, 150, 560, 250))
+
+    def test_scroll_moves_obstacles_without_rebucketing(self):
+        for i in range(1200):
+            self.far.y -= 1
+            self.near.y -= 1
+            self.index.scroll_by(1)
+        self.assertIn(self.far, self.index.query(480, 150, 560, 250))
+        self.assertNotIn(self.near, self.index.query(480, 150, 560, 250))
+
+    def test_move_after_respawn(self):
+        self.near.y = 1500
+        self.index.move(self.near)
+        self.assertNotIn(self.near, self.index.query(480, 120, 560, 220))
+        self.assertIn(self.near, self.index.query(480, 1450, 560, 1550))
+
+    def test_query_filters_columns(self):
+        left = FakeObstacle(150, x=120)
+        self.index.insert(left)
+        self.assertEqual(self.index.query(480, 120, 560, 220), {self.near})
+        self.assertEqual(self.index.query(100, 120, 180, 220), {left})
+
+    def test_remove(self):
+        self.index.remove(self.near)
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.query(480, 120, 560, 220), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from classes.HeadlessSprite import HeadlessSprite
+from classes.Obstacle import Obstacle
+from classes.ObstaclePool import ObstaclePool
+from classes.SpawnScheduler import SpawnScheduler
+
+
+def make_pool(capacity):
+    """Crée une réserve de rochers sans pygame."""
+    rng = random.Random(1)
+    return ObstaclePool(
+        lambda: Obstacle(750, 100, 1200, HeadlessSprite(90, 60), True, rng),
+        capacity
+    )
+
+
+class TestSpawnScheduler(unittest.TestCase):
+    """Tests unitaires pour la classe SpawnScheduler."""
+
+    def setUp(self):
+        self.rocks = make_pool(3)
+        self.trees = make_pool(5)
+        self.scheduler = SpawnScheduler(
+            {"rochers": self.rocks, "arbres": self.trees}, per_level=2)
+
+    def test_target_grows_with_level(self):
+        self.assertEqual(self.scheduler.target(self.rocks, 1), 0)
+        self.assertEqual(self.scheduler.target(self.trees, 2), 2)
+        self.assertEqual(self.scheduler.target(self.rocks, 9), 3)
+
+    def test_spawn_only_missing_obstacles(self):
+        self.assertFalse(self.scheduler.due(1, 0))
+        self.assertEqual(self.scheduler.spawn(1, 0), [])
+        self.assertTrue(self.scheduler.due(2, 0))
+        self.assertEqual(len(self.scheduler.spawn(2, 0)), 4)
+        self.assertFalse(self.scheduler.due(2, 100))
+        self.assertEqual(self.scheduler.spawn(2, 100), [])
+        self.assertEqual(len(self.scheduler.spawn(5, 200)), 4)
+        self.assertEqual((len(self.rocks), len(self.trees)), (3, 5))
+
+    def test_retire_only_excess_obstacles(self):
+        spawned = self.scheduler.spawn(3, 0)
+        base = Obstacle(750, 100, 1200, HeadlessSprite(70, 70), False)
+
+        self.assertFalse(self.scheduler.retire(spawned[0], 3))
+        self.assertFalse(self.scheduler.retire(base, 1))
+        self.assertTrue(self.scheduler.retire(spawned[0], 2))
+        self.assertEqual(len(self.rocks), 2)
+
+    def test_report(self):
+        self.scheduler.spawn(2, 0)
+        lines = self.scheduler.report()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("2 en jeu", lines[0])
+        self.assertIn("octets par obstacle", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
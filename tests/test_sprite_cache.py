@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+from classes.SpriteCache import SpriteCache
+
+
+class TestSpriteCache(unittest.TestCase):
+    """Tests unitaires pour la classe SpriteCache."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.source = os.path.join(self.directory, "sprite.png")
+        self.write_source((255, 0, 0, 128))
+        self.cache = SpriteCache(os.path.join(self.directory, "cache"))
+
+    def write_source(self, color):
+        surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+        surface.fill(color)
+        pygame.image.save(surface, self.source)
+
+    def entries(self):
+        return sorted(os.listdir(self.cache.directory))
+
+    def test_miss_then_hit(self):
+        self.assertIsNone(self.cache.get(self.source, (2, 2)))
+        image = pygame.Surface((2, 2), pygame.SRCALPHA)
+        image.fill((1, 2, 3, 4))
+        self.cache.put(self.source, (2, 2), image)
+
+        cached = self.cache.get(self.source, (2, 2))
+        self.assertEqual(cached.get_size(), (2, 2))
+        self.assertEqual(tuple(cached.get_at((1, 1))), (1, 2, 3, 4))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_size_change_is_a_new_entry(self):
+        self.cache.put(self.source, (2, 2), pygame.Surface((2, 2)))
+        self.assertIsNone(self.cache.get(self.source, (3, 3)))
+        self.cache.put(self.source, (3, 3), pygame.Surface((3, 3)))
+        self.assertEqual(len(self.entries()), 2)
+
+    def test_source_change_replaces_entry(self):
+        self.cache.put(self.source, (2, 2), pygame.Surface((2, 2)))
+        first = self.entries()
+
+        self.write_source((0, 255, 0, 255))
+        self.assertIsNone(self.cache.get(self.source, (2, 2)))
+        self.cache.put(self.source, (2, 2), pygame.Surface((2, 2)))
+        second = self.entries()
+
+        self.assertEqual(len(second), 1)
+        self.assertNotEqual(first, second)
+
+    def test_truncated_entry_is_a_miss(self):
+        self.cache.put(self.source, (2, 2), pygame.Surface((2, 2)))
+        entry = self.cache.entry_path(self.source, (2, 2))
+        with open(entry, "wb") as file:
+            file.write(b"\0\0")
+        self.assertIsNone(self.cache.get(self.source, (2, 2)))
+
+    def test_missing_source_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache.get(os.path.join(self.directory, "absent.png"), (2, 2))
+
+    def test_write_error_is_ignored(self):
+        blocker = os.path.join(self.directory, "file")
+        open(blocker, "w").close()
+        cache = SpriteCache(os.path.join(blocker, "cache"))
+        cache.put(self.source, (2, 2), pygame.Surface((2, 2)))
+        self.assertIsNone(cache.get(self.source, (2, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
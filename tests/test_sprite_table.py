@@ -0,0 +1,74 @@
+import unittest
+import pygame
+from classes.SpriteTable import SpriteTable
+
+
+class TestSpriteTable(unittest.TestCase):
+    """Tests unitaires pour la classe SpriteTable."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        self.table = SpriteTable(angle_step=10)
+
+    def test_build_number_of_frames(self):
+        frames = self.table.build(self.image)
+        self.assertEqual(len(frames), 36)
+        self.assertEqual(frames[0].get_size(), (20, 20))
+
+    def test_build_prepares_frames(self):
+        prepared = []
+
+        def prepare(frame):
+            prepared.append(frame)
+            return frame.copy()
+
+        frames = self.table.build(self.image, prepare)
+        self.assertEqual(len(prepared), 36)
+        self.assertIsNot(frames[0], prepared[0])
+        self.assertIs(self.table.get(self.image, 0), frames[0])
+
+    def test_build_from_source(self):
+        """La table est rangée sous l'image, calculée depuis la source."""
+        source = pygame.Surface((10, 10), pygame.SRCALPHA)
+        frames = self.table.build(self.image, source=source)
+        self.assertEqual(frames[0].get_size(), (10, 10))
+        self.assertIs(self.table.tables[self.image], frames)
+
+    def test_get_builds_lazily_and_memoizes(self):
+        self.assertNotIn(self.image, self.table.tables)
+        first = self.table.get(self.image, 0)
+        self.assertIn(self.image, self.table.tables)
+        self.assertIs(self.table.get(self.image, 2), first)
+
+    def test_get_quantizes_angle(self):
+        frames = self.table.build(self.image)
+        self.assertIs(self.table.get(self.image, 176), frames[18])
+        self.assertIs(self.table.get(self.image, 359), frames[0])
+
+    def test_frame_follows_jump_scale(self):
+        frames = self.table.build(self.image)
+        # À 180°, l'échelle est maximale (2x, avec la marge de rotozoom)
+        self.assertGreaterEqual(frames[18].get_width(), 40)
+        self.assertLess(frames[18].get_width(), 44)
+
+    def test_memory_usage(self):
+        self.assertEqual(self.table.memory_usage(), 0)
+        self.table.build(self.image)
+        coarse = self.table.memory_usage()
+        self.assertGreater(coarse, 0)
+
+        fine = SpriteTable(angle_step=5)
+        fine.build(self.image)
+        self.assertGreater(fine.memory_usage(), coarse)
+
+
+if __name__ == "__main__":
+    unittest.main()
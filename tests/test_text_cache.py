@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock
+from classes.TextCache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests unitaires pour la classe TextCache."""
+
+    def setUp(self):
+        """Crée une police factice dont chaque rendu est une nouvelle surface."""
+        self.font = Mock()
+        self.font.render.side_effect = lambda text, aa, color: Mock()
+        self.cache = TextCache(max_size=2)
+
+    def test_miss_then_hit(self):
+        first = self.cache.render("Points : 0", (0, 0, 0), self.font)
+        second = self.cache.render("Points : 0", (0, 0, 0), self.font)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.font.render.call_count, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_key_includes_color_and_font(self):
+        other_font = Mock()
+        other_font.render.side_effect = lambda text, aa, color: Mock()
+
+        self.cache.render("A", (0, 0, 0), self.font)
+        self.cache.render("A", (255, 255, 255), self.font)
+        self.cache.render("A", (0, 0, 0), other_font)
+
+        self.assertEqual(self.cache.misses, 3)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_lru_eviction(self):
+        self.cache.render("A", (0, 0, 0), self.font)
+        self.cache.render("B", (0, 0, 0), self.font)
+        self.cache.render("A", (0, 0, 0), self.font)  # A devient récent
+        self.cache.render("C", (0, 0, 0), self.font)  # B est retiré
+
+        self.assertEqual(len(self.cache), 2)
+        self.cache.render("A", (0, 0, 0), self.font)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.render("B", (0, 0, 0), self.font)
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_clear(self):
+        self.cache.render("A", (0, 0, 0), self.font)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
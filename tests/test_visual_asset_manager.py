@@ -1,7 +1,10 @@
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 import pygame
-from classes.VisualAssetManager import VisualAssetManager
+from classes.SpriteCache import SpriteCache
+from classes.VisualAssetManager import COLORKEY, VisualAssetManager
 
 
 class TestVisualAssetManagerFull(unittest.TestCase):
@@ -46,6 +49,103 @@ class TestVisualAssetManagerFull(unittest.TestCase):
         self.assertIsInstance(surface, pygame.Surface)
         self.assertEqual(surface.get_size(), (100, 100))
 
+    # ------------------
+    # Tests préparation des images
+    # ------------------
+    def last_mode(self, manager):
+        return manager.preparations[-1][1]
+
+    def test_prepare_opaque(self):
+        manager = VisualAssetManager()
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 255))
+        prepared = manager.prepare("carré", image)
+        self.assertEqual(self.last_mode(manager), "opaque")
+        self.assertFalse(prepared.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(prepared.get_at((5, 5))[:3], (10, 20, 30))
+
+    def test_prepare_hard_edges_uses_colorkey(self):
+        manager = VisualAssetManager()
+        tree = manager.create_fallback_tree()
+        prepared = manager.prepare("arbre", tree)
+        self.assertEqual(self.last_mode(manager), "couleur transparente RLE")
+        self.assertEqual(prepared.get_colorkey()[:3], COLORKEY)
+        self.assertTrue(prepared.get_flags() & pygame.RLEACCELOK)
+        self.assertEqual(prepared.get_at((35, 60))[:3], (0, 100, 50))
+        self.assertEqual(prepared.get_at((0, 0))[:3], COLORKEY)
+
+    def test_prepare_hard_edges_with_colorkey_color(self):
+        manager = VisualAssetManager()
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        image.fill(COLORKEY + (255,), pygame.Rect(2, 2, 4, 4))
+        prepared = manager.prepare("magenta", image)
+        self.assertEqual(self.last_mode(manager), "transparence RLE")
+        self.assertIsNone(prepared.get_colorkey())
+        self.assertEqual(prepared.get_at((3, 3)), COLORKEY + (255,))
+
+    def test_prepare_soft_edges_keeps_alpha(self):
+        manager = VisualAssetManager()
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        image.fill((200, 0, 0, 255), pygame.Rect(2, 2, 4, 4))
+        image.set_at((6, 6), (200, 0, 0, 128))
+        prepared = manager.prepare("flou", image)
+        self.assertEqual(self.last_mode(manager), "transparence RLE")
+        self.assertTrue(prepared.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(prepared.get_at((6, 6)), (200, 0, 0, 128))
+        self.assertEqual(prepared.get_at((0, 0)).a, 0)
+
+    def test_prepare_without_alpha(self):
+        manager = VisualAssetManager()
+        image = pygame.Surface((10, 10))
+        self.assertEqual(manager.count_pixels(image), (100, 100))
+        image.set_colorkey((0, 0, 0))
+        image.fill((1, 2, 3), pygame.Rect(0, 0, 5, 10))
+        self.assertEqual(manager.count_pixels(image), (50, 50))
+        manager.prepare("clé", image)
+        self.assertEqual(self.last_mode(manager), "couleur transparente RLE")
+
+    def test_prepare_empty_and_report(self):
+        manager = VisualAssetManager()
+        empty = pygame.Surface((0, 0))
+        self.assertIs(manager.prepare("vide", empty), empty)
+        manager.prepare("arbre", manager.create_fallback_tree())
+        manager.prepare("arbre", manager.create_fallback_tree())
+        self.assertEqual(manager.report(), [
+            "vide : vide",
+            "arbre : couleur transparente RLE (2 images)"
+        ])
+
+    def test_big_images_are_prepared(self):
+        manager = VisualAssetManager()
+        manager.load_big_skier()
+        manager.load_big_tree()
+        self.assertEqual(
+            [name for name, mode, size in manager.preparations],
+            ["grand skieur", "grand arbre"])
+
+    # ------------------
+    # Tests cache des images
+    # ------------------
+    def test_sprite_cache_warm_load_skips_decoding(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        manager = VisualAssetManager(SpriteCache(directory))
+
+        cold = [manager.load_skier(), manager.load_big_tree()]
+        with patch("pygame.image.load") as mock_load, \
+                patch("pygame.transform.scale") as mock_scale:
+            warm = [manager.load_skier(), manager.load_big_tree()]
+        mock_load.assert_not_called()
+        mock_scale.assert_not_called()
+
+        for before, after in zip(cold, warm):
+            self.assertEqual(before.get_size(), after.get_size())
+            self.assertEqual(
+                pygame.image.tobytes(before, "RGBA"),
+                pygame.image.tobytes(after, "RGBA")
+            )
+        self.assertEqual(manager.sprite_cache.hits, 2)
+
     # ------------------
     # Tests fallbacks FileNotFoundError
     # ------------------
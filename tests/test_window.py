@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import pygame
+from classes.AssetLoader import AssetLoader
 from classes.Window import Window
+from utils.FunctionalProgramming import side_obstacles_positions
 
 
 class MockPlayer:
@@ -40,6 +42,7 @@ class TestWindowFull(unittest.TestCase):
         mock_assets.load_skier.return_value = pygame.Surface((50, 50))
         mock_assets.load_tree.return_value = pygame.Surface((30, 60))
         mock_assets.load_rock.return_value = pygame.Surface((30, 20))
+        mock_assets.prepare.side_effect = lambda name, surface: surface
 
         cls.window = Window(cls.width, cls.height)
 
@@ -74,6 +77,14 @@ class TestWindowFull(unittest.TestCase):
         except Exception as e:
             self.fail(f"show_text raised an exception {e}")
 
+    def test_show_text_uses_cache(self):
+        """Vérifie qu'un texte identique n'est rendu qu'une seule fois."""
+        self.window.text_cache.clear()
+        self.window.update_status(game_level=1, player_lives=3, player_points=0)
+        self.window.update_status(game_level=1, player_lives=3, player_points=0)
+        self.assertEqual(self.window.text_cache.misses, 3)
+        self.assertEqual(self.window.text_cache.hits, 3)
+
     def test_show_start_screen(self):
         """Teste show_start_screen sans erreur."""
         try:
@@ -102,6 +113,73 @@ class TestWindowFull(unittest.TestCase):
         # Vérifie que dx a été réajusté
         self.assertGreater(self.window.dx, 0)
 
+    def test_scroll_and_interpolated_side_offset(self):
+        """Le décor défile par pas de logique et s'interpole à l'affichage."""
+        self.window.dx = 10
+        self.window.scroll_side_obstacles(4)
+        self.assertEqual(self.window.dx, 6)
+        self.assertEqual(self.window.interpolated_side_offset(4, 0.5), 8)
+        self.assertEqual(self.window.interpolated_side_offset(4, 1.0), 6)
+
+        self.window.dx = 2
+        self.assertEqual(self.window.interpolated_side_offset(4, 0.0), 6)
+        self.window.dx = 49
+        self.assertEqual(self.window.interpolated_side_offset(4, 0.0), 3)
+        self.window.draw_side_obstacles(3)
+        self.window.dx = self.window.spacing
+
+    def test_scroll_several_steps_at_once(self):
+        """La distance de plusieurs pas peut dépasser l'espacement."""
+        self.window.dx = 10
+        self.window.scroll_side_obstacles(2 * self.window.spacing + 4)
+        self.assertEqual(self.window.dx, 6)
+        self.window.dx = self.window.spacing
+
+    def test_draw_player_at_position(self):
+        """Le joueur peut être affiché à une position interpolée."""
+        player = MockPlayer()
+        self.window.drawn_rects = []
+        self.window.dirty_rects = True
+        self.window.draw_player(player, (200.0, 300.0))
+        self.window.dirty_rects = False
+        self.assertEqual(self.window.drawn_rects[0].topleft, (200, 300))
+        self.window.drawn_rects = []
+
+    def test_side_strips_rebuilt_on_change(self):
+        """Les bandes de forêt sont reconstruites si la géométrie change."""
+        self.window.update_side_obstacles(speed=1)
+        left_strip = self.window.left_strip
+        self.window.update_side_obstacles(speed=1)
+        self.assertIs(self.window.left_strip, left_strip)
+
+        self.window.spacing = 40
+        self.window.update_side_obstacles(speed=1)
+        self.assertIsNot(self.window.left_strip, left_strip)
+        self.window.spacing = 50
+        self.window.dx = self.window.spacing
+
+    def test_side_strips_match_per_tree_blits(self):
+        """Les bandes produisent la même image que l'affichage arbre par arbre."""
+        window = self.window
+        tree = pygame.Surface((30, 60), pygame.SRCALPHA)
+        pygame.draw.polygon(tree, (0, 100, 50, 255), [(15, 0), (0, 60), (30, 60)])
+        window.tree = tree
+        window.dx = 17
+
+        window.display.fill(window.snow_color)
+        window.update_side_obstacles(speed=1)
+        strips = pygame.image.tobytes(window.display, "RGB")
+
+        window.display.fill(window.snow_color)
+        for x, y in side_obstacles_positions(
+            window.spacing, window.alignment, window.width,
+            window.height // window.spacing, 17, 3
+        ):
+            window.display.blit(tree, (x, y))
+        expected = pygame.image.tobytes(window.display, "RGB")
+
+        self.assertLessEqual(max(abs(a - b) for a, b in zip(strips, expected)), 2)
+
     def test_update_status(self):
         """Teste update_status sans erreur."""
         try:
@@ -143,14 +221,8 @@ class TestWindowFull(unittest.TestCase):
         self.window.draw_player(player)
 
     # ------------------
-    # Tests transform et flip
+    # Tests flip
     # ------------------
-    def test_transform_player_image(self):
-        """Teste transform_player_image renvoie bien une Surface."""
-        img = pygame.Surface((50, 50))
-        transformed = self.window.transform_player_image(img, 45, 1.2)
-        self.assertIsInstance(transformed, pygame.Surface)
-
     def test_flip(self):
         """Teste flip sans erreur."""
         try:
@@ -158,6 +230,301 @@ class TestWindowFull(unittest.TestCase):
         except Exception as e:
             self.fail(f"flip raised an exception {e}")
 
+    def test_flip_full_counts_all_pixels(self):
+        """Vérifie que la mise à jour complète pousse tout l'écran."""
+        self.window.flip()
+        self.assertEqual(self.window.pixels_pushed, self.width * self.height)
+        self.assertEqual(self.window.drawn_rects, [])
+
+
+class TestWindowDirtyRects(unittest.TestCase):
+    """Tests unitaires du rendu par rectangles modifiés."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        patcher = patch('classes.Window.VisualAssetManager')
+        cls.MockAssets = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        mock_assets = cls.MockAssets.return_value
+        mock_assets.load_retro_font.return_value = pygame.font.SysFont(None, 20)
+        mock_assets.load_snow_font.return_value = pygame.font.SysFont(None, 40)
+        mock_assets.load_big_skier.return_value = pygame.Surface((100, 100))
+        mock_assets.load_big_tree.return_value = pygame.Surface((100, 100))
+        mock_assets.load_skier.return_value = pygame.Surface((50, 50))
+        mock_assets.load_tree.return_value = pygame.Surface((30, 60))
+        mock_assets.load_rock.return_value = pygame.Surface((30, 20))
+        mock_assets.prepare.side_effect = lambda name, surface: surface
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.window = Window(800, 600, dirty_rects=True)
+
+    def test_background_loading(self):
+        """Les images de la partie sont attendues par finish_loading."""
+        loader = AssetLoader(workers=1, verbose=False)
+        self.addCleanup(loader.shutdown)
+        window = Window(800, 600, loader=loader)
+        self.assertIn("sprites", loader.futures)
+
+        window.finish_loading()
+        self.assertEqual(window.skier_left.get_size(), (50, 50))
+        self.assertEqual(window.rock.get_size(), (30, 20))
+        self.assertEqual(len(window.sprite_table.tables), 2)
+        self.assertIsNone(window.collision_masks)
+
+    def test_vsync_window(self):
+        # Le pilote peut refuser la synchronisation : la fenêtre est
+        # alors créée sans
+        with patch("builtins.print"):
+            window = Window(800, 600, vsync=True)
+        self.assertIsInstance(window.vsync, bool)
+        self.assertEqual(window.display.get_size(), (800, 600))
+
+    def test_collision_masks_built_with_sprites(self):
+        """Les masques sont calculés au chargement, pas pendant la partie."""
+        loader = AssetLoader(workers=1, verbose=False)
+        self.addCleanup(loader.shutdown)
+        window = Window(800, 600, loader=loader, mask_collision=True)
+        window.finish_loading()
+        masks = window.collision_masks
+        self.assertEqual(len(masks.masks), 4)
+        self.assertEqual(
+            len(masks.frames[window.skier_left]),
+            window.sprite_table.num_frames)
+
+    def test_show_overlay_records_panel(self):
+        """Le résumé du profileur est dessiné sur un fond noir mémorisé."""
+        self.window.show_overlay(["FPS 120", "p50 8.00 ms"])
+        panel = self.window.drawn_rects[0]
+        self.assertEqual(panel.topleft, (8, 40))
+        self.assertEqual(len(self.window.drawn_rects), 3)
+        self.assertEqual(self.window.display.get_at((9, 41))[:3], (0, 0, 0))
+
+        self.window.drawn_rects = []
+        self.window.show_overlay([])
+        self.assertEqual(self.window.drawn_rects, [])
+
+    def test_first_frame_is_full(self):
+        """La première image efface et présente tout l'écran."""
+        self.window.clear_background()
+        self.window.flip()
+        self.assertEqual(self.window.pixels_pushed, 800 * 600)
+
+    @patch("pygame.display.update")
+    def test_only_dirty_rects_are_pushed(self, mock_update):
+        """Seules les zones dessinées (avant et maintenant) sont poussées."""
+        img = pygame.Surface((50, 40))
+        self.window.clear_background()
+        self.window.draw(img, 100, 100)
+        self.window.flip()
+
+        self.window.clear_background()
+        self.window.draw(img, 100, 110)
+        self.window.flip()
+
+        mock_update.assert_called_once()
+        self.assertEqual(len(mock_update.call_args[0][0]), 2)
+        self.assertEqual(self.window.pixels_pushed, 2 * 50 * 40)
+        self.assertEqual(self.window.average_pixels_pushed(),
+                         (800 * 600 + 2 * 50 * 40) / 2)
+
+    def test_menu_screen_forces_full_redraw(self):
+        """Un écran de menu invalide le fond enneigé."""
+        self.window.clear_background()
+        self.window.flip()
+        self.window.show_start_screen()
+        self.assertFalse(self.window.background_valid)
+        self.window.flip()
+        self.assertEqual(self.window.pixels_pushed, 800 * 600)
+
+        self.window.clear_background()
+        self.assertTrue(self.window.background_valid)
+        self.assertTrue(self.window.full_redraw)
+
+    def test_menu_screen_composed_once(self):
+        """Un écran inchangé n'est ni redessiné ni présenté de nouveau."""
+        self.assertTrue(self.window.show_start_screen())
+        self.window.flip()
+        self.assertEqual(self.window.display.get_at((0, 0)), (50, 50, 255))
+
+        for i in range(3):
+            self.assertFalse(self.window.show_start_screen())
+            self.window.flip()
+        self.assertEqual(self.window.screens_composed, 1)
+        self.assertEqual(self.window.frames_presented, 1)
+        self.assertEqual(self.window.frames_skipped, 3)
+        self.assertEqual(self.window.pixels_pushed, 0)
+
+    def test_game_over_screen_keyed_by_values(self):
+        """L'écran de fin est recomposé lorsque le score change."""
+        self.window.show_game_over_screen(2, 100)
+        self.window.flip()
+        self.assertFalse(self.window.show_game_over_screen(2, 100))
+        self.assertTrue(self.window.show_game_over_screen(3, 250))
+        self.window.flip()
+        self.assertEqual(self.window.screens_composed, 2)
+        self.assertEqual(self.window.frames_presented, 2)
+        # Une seule surface conservée par écran
+        self.assertEqual(len(self.window.screens), 1)
+
+        self.window.show_start_screen()
+        self.assertTrue(self.window.show_game_over_screen(3, 250))
+        self.assertEqual(self.window.screens_composed, 3)
+
+    def test_menu_screen_redrawn_under_overlay(self):
+        """Un dessin par-dessus l'écran oblige à le copier et présenter."""
+        self.window.show_start_screen()
+        self.window.flip()
+        self.window.show_overlay(["fps 120"])
+        self.window.flip()
+        self.assertTrue(self.window.show_start_screen())
+        self.window.flip()
+        self.assertEqual(self.window.frames_presented, 3)
+        self.assertEqual(self.window.screens_composed, 1)
+
+    def test_exposed_menu_screen_presented(self):
+        """Une fenêtre découverte est présentée de nouveau."""
+        self.window.show_start_screen()
+        self.window.flip()
+        self.window.expose()
+        self.assertFalse(self.window.show_start_screen())
+        self.window.flip()
+        self.assertEqual(self.window.frames_presented, 2)
+        self.assertEqual(self.window.frames_skipped, 0)
+
+
+class TestWindowScale(unittest.TestCase):
+    """Tests unitaires du rendu à une autre échelle."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        patcher = patch('classes.Window.VisualAssetManager')
+        cls.MockAssets = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        mock_assets = cls.MockAssets.return_value
+        mock_assets.load_retro_font.return_value = pygame.font.SysFont(None, 20)
+        mock_assets.load_snow_font.return_value = pygame.font.SysFont(None, 40)
+        mock_assets.load_big_skier.return_value = pygame.Surface((100, 100))
+        mock_assets.load_big_tree.return_value = pygame.Surface((100, 100))
+        mock_assets.load_skier.return_value = pygame.Surface((50, 50))
+        mock_assets.load_tree.return_value = pygame.Surface((30, 60))
+        mock_assets.load_rock.return_value = pygame.Surface((30, 20))
+        mock_assets.prepare.side_effect = lambda name, surface: surface
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        # SDL peut refuser SCALED sur une fenêtre existante
+        with patch("builtins.print"):
+            self.window = Window(800, 600, dirty_rects=True, scale=0.5)
+        self.window.drawn_rects = []
+
+    def test_invalid_scale(self):
+        with self.assertRaises(ValueError):
+            Window(800, 600, scale=0)
+
+    def test_render_size(self):
+        self.assertEqual(self.window.render_size, (400, 300))
+        self.assertEqual(self.window.display.get_size(), (400, 300))
+        self.window.clear_background()
+        self.window.flip()
+        self.assertEqual(self.window.pixels_pushed, 400 * 300)
+
+    def test_gameplay_images_keep_their_size(self):
+        """Les images de la partie gardent leur taille, pas leur copie."""
+        skier = self.window.skier_left
+        self.assertEqual(skier.get_size(), (50, 50))
+        self.assertEqual(self.window.images[skier].get_size(), (25, 25))
+        self.assertEqual(self.window.images[self.window.rock].get_size(),
+                         (15, 10))
+
+    def test_draw_scales_position_and_image(self):
+        self.window.draw(self.window.skier_left, 200, 100)
+        self.assertEqual(self.window.drawn_rects[0], pygame.Rect(100, 50, 25, 25))
+
+    def test_draw_player_jumping_is_centered(self):
+        player = MockPlayer()
+        player.image = self.window.skier_left
+        player.jumping = True
+        player.angle = 0
+        self.window.draw_player(player, (200, 100))
+        x, y = self.window.drawn_rects[0].center
+        self.assertAlmostEqual(x, 112.5, delta=1)
+        self.assertAlmostEqual(y, 62.5, delta=1)
+
+    def test_side_strips_and_screens_at_render_size(self):
+        self.window.draw_side_obstacles()
+        strip = self.window.left_strip
+        self.assertEqual(strip.get_height(), round(
+            ((600 // 50 + 1) * 50 + 60) * 0.5))
+        for rect in self.window.drawn_rects:
+            self.assertLessEqual(rect.bottom, 300)
+
+        self.window.show_start_screen()
+        key, surface = self.window.screens["start"]
+        self.assertEqual(surface.get_size(), (400, 300))
+
+
+class TestWindowFallbackSprites(unittest.TestCase):
+    """Tests des images dérivées des sprites de secours."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def load_window(self, scale):
+        # Fichiers introuvables : les sprites de secours, à bords nets,
+        # sont préparés avec une couleur transparente
+        with patch("pygame.image.load", side_effect=FileNotFoundError), \
+                patch("builtins.print"):
+            return Window(800, 600, scale=scale)
+
+    def assert_corners_transparent(self, surface):
+        mask = pygame.mask.from_surface(surface)
+        width, height = surface.get_size()
+        for corner in ((0, 0), (width - 1, 0), (0, height - 1),
+                       (width - 1, height - 1)):
+            self.assertEqual(mask.get_at(corner), 0)
+
+    def test_jump_frames_keep_transparent_corners(self):
+        """Les images du saut ne sont pas tirées de l'image préparée."""
+        window = self.load_window(1.0)
+        self.assertIsNotNone(window.skier_left.get_colorkey())
+        for image in (window.skier_left, window.skier_right):
+            for frame in window.sprite_table.tables[image]:
+                self.assert_corners_transparent(frame)
+
+    def test_scaled_copies_keep_transparent_corners(self):
+        window = self.load_window(0.5)
+        for image in (window.skier_left, window.skier_right):
+            self.assert_corners_transparent(window.images[image])
+        # Pas de frange de la couleur transparente autour des copies
+        for image in (window.skier_left, window.skier_right, window.tree,
+                      window.rock):
+            copy = window.images[image]
+            background = pygame.Surface(copy.get_size())
+            background.fill((255, 255, 255))
+            background.blit(copy, (0, 0))
+            for x in range(copy.get_width()):
+                for y in range(copy.get_height()):
+                    r, g, b, _ = background.get_at((x, y))
+                    self.assertFalse(r > 200 and g < 80 and b > 200)
+        frames = window.sprite_table.tables[window.images[window.skier_left]]
+        self.assert_corners_transparent(frames[9])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -52,3 +52,21 @@ def side_obstacles_positions(spacing, alignment, width, rows, dx, nb):
     positions = [(x, y) for y in y_positions for x in x_positions]
 
     return positions
+
+
+def jump_transform(t):
+    """Calcule l'angle et l'échelle du skieur à un instant du saut.
+
+    Première moitié du saut : agrandissement et rotation (0° → 180°),
+    deuxième moitié : rétrécissement et rotation (180° → 360°).
+    Fonction pure.
+
+    Args:
+        t (float): Progression du saut, entre 0.0 et 1.0.
+
+    Returns:
+        tuple[float, float]: L'angle (en degrés) et le facteur d'échelle.
+    """
+    if t < 0.5:
+        return t * 360, 1.0 + t * 2
+    return (t - 0.5) * 360 + 180, 2.0 - (t - 0.5) * 2